@@ -0,0 +1,97 @@
+"""
+Benchmark de tempo de import (cold start) do pacote dell.
+
+Roda cada import em um processo novo, várias vezes, e falha (exit code 1)
+se o melhor tempo passar do orçamento ou se dependências pesadas forem
+carregadas por imports que deveriam ser leves.
+
+Uso:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --budget-ms 80 --runs 10
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Import → orçamento padrão em milissegundos
+IMPORT_BUDGETS_MS = {
+    "dell": 25,
+    "dell.browser": 40,
+    "dell.config.settings": 40,
+}
+
+# Módulos que não podem ser carregados pelos imports acima
+HEAVY_MODULES = [
+    "playwright",
+    "dynaconf",
+    "pandas",
+    "sqlalchemy",
+    "rich",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    """Mede o import em processos novos e retorna o melhor tempo."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+    samples = []
+    heavy = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result["ms"])
+        heavy = result["heavy"]
+
+    return {"best_ms": min(samples), "heavy": heavy}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        budget = args.budget_ms or budget
+        result = measure(module, args.runs)
+
+        status = "ok"
+        if result["best_ms"] > budget:
+            status = "LENTO"
+            failed = True
+        if result["heavy"]:
+            status = f"PESADO ({', '.join(result['heavy'])})"
+            failed = True
+
+        print(
+            f"{module:<24} {result['best_ms']:8.1f} ms  (orçamento {budget:.0f} ms)  {status}"
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
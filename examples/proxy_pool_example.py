@@ -0,0 +1,141 @@
+"""
+Exemplo do pool de proxies com proxies locais de teste.
+
+Sobe um servidor HTTP de origem e três proxies HTTP locais (um rápido, um
+lento e um que responde 429), e faz requisições pelo APIRequestContext do
+Playwright escolhendo o proxy no proxy_pool. Não precisa de browser nem de
+proxies reais: ao final, o pool prefere o proxy rápido e deixa de escolher
+o que responde 429. O teste automatizado equivalente, pelo BrowserManager,
+está em tests/test_proxy_pool.py.
+"""
+
+import asyncio
+import logging
+import time
+
+from playwright.async_api import async_playwright
+
+from dell.browser import proxy_pool
+from dell.browser.proxy_pool import PROXY_FAILURE_STATUSES
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+ORIGIN_PORT = 8780
+PROXY_PORTS = {"rapido": 8781, "lento": 8782, "bloqueado": 8783}
+
+
+async def origin_handler(reader, writer):
+    """Servidor de origem: responde uma página HTML simples."""
+    await reader.readuntil(b"\r\n\r\n")
+    body = b"<html><title>Produto</title><body>ok</body></html>"
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n"
+        b"Content-Length: %d\r\nConnection: close\r\n\r\n%s" % (len(body), body)
+    )
+    await writer.drain()
+    writer.close()
+
+
+async def pipe(reader, writer):
+    """Copia bytes de um lado do túnel para o outro até o fim da conexão."""
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+def stand_in_proxy(delay: float = 0.0, status: int = 0):
+    """
+    Proxy HTTP mínimo com túnel CONNECT (o Playwright usa CONNECT também
+    para URLs http://).
+
+    Args:
+        delay: Atraso artificial por requisição (segundos)
+        status: Se definido, responde esse status em vez de abrir o túnel
+            para a origem (simula IP bloqueado)
+    """
+
+    async def handler(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        await asyncio.sleep(delay)
+
+        # 'CONNECT host:port HTTP/1.1'
+        host, port = head.split(b" ")[1].decode().rsplit(":", 1)
+        writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+        await writer.drain()
+
+        if status:
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(
+                b"HTTP/1.1 %d Blocked\r\nContent-Length: 0\r\n"
+                b"Connection: close\r\n\r\n" % status
+            )
+            await writer.drain()
+            writer.close()
+            return
+
+        up_reader, up_writer = await asyncio.open_connection(host, int(port))
+        await asyncio.gather(pipe(reader, up_writer), pipe(up_reader, writer))
+
+    return handler
+
+
+async def main():
+    servers = [await asyncio.start_server(origin_handler, "127.0.0.1", ORIGIN_PORT)]
+    behaviours = {
+        "rapido": stand_in_proxy(),
+        "lento": stand_in_proxy(delay=0.3),
+        "bloqueado": stand_in_proxy(status=429),
+    }
+    for name, handler in behaviours.items():
+        servers.append(
+            await asyncio.start_server(handler, "127.0.0.1", PROXY_PORTS[name])
+        )
+
+    proxy_pool.configure(
+        [f"http://127.0.0.1:{port}" for port in PROXY_PORTS.values()], cooldown=30
+    )
+
+    async with async_playwright() as playwright:
+        clients = {}
+        for proxy in proxy_pool.proxies:
+            clients[proxy.server] = await playwright.request.new_context(
+                proxy=proxy.as_playwright()
+            )
+
+        for _ in range(20):
+            proxy = proxy_pool.choose()
+            await proxy_pool.acquire(proxy)
+
+            started = time.monotonic()
+            response = await clients[proxy.server].get(
+                f"http://127.0.0.1:{ORIGIN_PORT}/produto"
+            )
+            latency = time.monotonic() - started
+
+            # Mesmo critério do safe_goto/HttpFetcher: 429 é falha do proxy
+            # (sem cool-down; o cool-down vem da página de bloqueio detectada)
+            proxy_pool.record(
+                proxy, response.status not in PROXY_FAILURE_STATUSES, latency
+            )
+
+        for client in clients.values():
+            await client.dispose()
+
+    for server, stats in proxy_pool.get_statistics().items():
+        logger.info(
+            f"{server}: {stats['successes']} ok, {stats['blocks']} bloqueios, "
+            f"mediana {stats['median_latency'] or 0:.3f}s, cool-down {stats['cooling_for']:.0f}s"
+        )
+
+    for server in servers:
+        server.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,13 @@
+"""
+Dell Products Scraper.
+
+Mantido sem imports no nível do pacote para que 'import dell' (CLI,
+migrações do Alembic) seja rápido; cada submódulo carrega o que precisa.
+"""
+
+
+def main() -> None:
+    """Entry point da CLI 'dell' (import tardio da aplicação)."""
+    from dell.main import main as run_app
+
+    run_app()
@@ -1,69 +1,131 @@
 """
 Módulo de gerenciamento de browser.
 Sistema completo para automação web com Playwright.
+
+Os exports são carregados sob demanda: importar dell.browser não importa
+Playwright até que algo que dependa deles seja acessado.
 """
 
-from .browser_manager import BrowserManager, browser_manager
-from .pace_manager import (
-    OperationType,
-    PaceLevel,
-    PaceManager,
-    TemporaryPace,
-    configure_pace,
-    pace_manager,
-    wait_click,
-    wait_extraction,
-    wait_fill,
-    wait_navigation,
-    wait_network,
-    wait_retry,
-    wait_scroll,
-)
-from .utils import (
-    ElementNotFoundError,
-    PageWaitTimeout,
-    extract_attribute,
-    extract_text,
-    get_page_info,
-    safe_click,
-    safe_fill,
-    safe_goto,
-    scroll_to_bottom,
-    take_screenshot,
-    wait_for_element,
-    wait_for_network_idle,
-)
+import importlib
+import sys
+import types
+from typing import Any, Dict, List
 
-__all__ = [
+# Submódulo → nomes exportados
+_LAZY_EXPORTS: Dict[str, tuple] = {
     # Browser Management
-    "BrowserManager",
-    "browser_manager",
+    ".browser_manager": (
+        "BrowserManager",
+        "browser_manager",
+        "PageResult",
+    ),
+    ".errors": ("BrowserCrashedError", "ElementNotFoundError", "PageWaitTimeout"),
+    ".page_pool": ("PagePool", "PoolClosedError"),
+    ".fleet": ("BrowserFleet", "FleetResult"),
+    ".routing": ("ResourcePolicy",),
+    ".storage_state": ("StorageStateStore",),
+    ".response_capture": (
+        "ResponseCapture",
+        "UrlPattern",
+        "compile_url_pattern",
+        "goto_and_capture",
+    ),
+    ".fetcher": ("HttpFetcher", "FetchResult"),
+    ".rate_limiter": ("RateLimiter", "TokenBucket", "rate_limiter"),
+    ".readiness": ("ReadinessStrategy", "readiness_registry"),
+    ".result_cache": ("ResultCache", "normalize_url", "result_cache"),
+    ".block_detection": (
+        "BlockDetector",
+        "BlockVerdict",
+        "BlockedPageError",
+        "block_detector",
+    ),
+    ".proxy_pool": ("Proxy", "ProxyPool", "proxy_pool"),
+    ".resilience": (
+        "CircuitBreaker",
+        "CircuitOpenError",
+        "RetryPolicy",
+        "call_with_retry",
+        "circuit_breakers",
+        "classify_error",
+    ),
+    ".presence": (
+        "PresenceMemory",
+        "page_template",
+        "presence_memory",
+        "probe_selectors",
+    ),
     # Pace Management
-    "PaceLevel",
-    "OperationType",
-    "PaceManager",
-    "pace_manager",
-    "configure_pace",
-    "TemporaryPace",
-    # Pace Functions
-    "wait_click",
-    "wait_extraction",
-    "wait_fill",
-    "wait_navigation",
-    "wait_retry",
-    "wait_scroll",
-    "wait_network",
+    ".pace_manager": (
+        "PaceLevel",
+        "OperationType",
+        "PaceManager",
+        "pace_manager",
+        "configure_pace",
+        "TemporaryPace",
+        "wait_click",
+        "wait_extraction",
+        "wait_fill",
+        "wait_navigation",
+        "wait_retry",
+        "wait_scroll",
+        "wait_network",
+    ),
     # Browser Utils
-    "ElementNotFoundError",
-    "PageWaitTimeout",
-    "extract_attribute",
-    "extract_text",
-    "get_page_info",
-    "safe_click",
-    "safe_fill",
-    "safe_goto",
-    "scroll_to_bottom",
-    "take_screenshot",
-    "wait_for_element",
-    "wait_for_network_idle",
-]
+    ".utils": (
+        "ExtractedFields",
+        "extract_attribute",
+        "extract_cards",
+        "extract_fields",
+        "extract_text",
+        "get_page_info",
+        "harvest_scroll",
+        "iter_cards",
+        "safe_click",
+        "safe_fill",
+        "safe_goto",
+        "scroll_to_bottom",
+        "take_screenshot",
+        "wait_for_element",
+        "wait_for_network_idle",
+    ),
+}
+
+_EXPORT_MODULES: Dict[str, str] = {
+    name: module for module, names in _LAZY_EXPORTS.items() for name in names
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache: próximos acessos não passam aqui
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyExportsModule(types.ModuleType):
+    """
+    Impede que o import de um submódulo homônimo (ex.: browser_manager)
+    sobrescreva a instância exportada com o mesmo nome.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if (
+            isinstance(value, types.ModuleType)
+            and name in _EXPORT_MODULES
+            and value.__name__ == f"{__name__}.{name}"
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyExportsModule
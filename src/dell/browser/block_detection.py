@@ -0,0 +1,299 @@
+"""
+BlockDetection - Classificação rápida de páginas de bloqueio/CAPTCHA.
+
+Desafios anti-bot e bloqueios "suaves" costumam voltar com status 200 e
+seriam extraídos como produtos vazios. Após a navegação, um único evaluate
+coleta título, URL, tamanho do texto e marcadores de DOM/scripts de
+desafio; a página bloqueada vira BlockedPageError, alimenta o pace e
+dispara a rotação de identidade do contexto (listeners).
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Trechos (minúsculos) de título que indicam página de desafio/bloqueio
+TITLE_MARKERS = (
+    "access denied",
+    "acesso negado",
+    "just a moment",
+    "attention required",
+    "pardon our interruption",
+    "verify you are human",
+    "are you a robot",
+    "request unsuccessful",
+    "security check",
+)
+
+# Trechos de URL de páginas de desafio (após redirecionamento)
+URL_MARKERS = (
+    "/captcha",
+    "/cdn-cgi/challenge-platform",
+    "_incapsula_resource",
+    "sec-cpt",
+    "/blocked",
+    "validate.perfdrive.com",
+)
+
+# Elementos de desafio/CAPTCHA
+SELECTOR_MARKERS = (
+    "#challenge-form",
+    "#challenge-running",
+    "#px-captcha",
+    "#sec-if-cpt-container",
+    ".g-recaptcha",
+    ".h-captcha",
+    "iframe[src*='captcha']",
+)
+
+# Trechos de src de scripts/iframes de provedores de desafio
+SCRIPT_MARKERS = (
+    "challenges.cloudflare.com",
+    "captcha-delivery.com",
+    "_incapsula_resource",
+    "px-captcha",
+    "hcaptcha.com",
+)
+
+# Texto visível mínimo de uma página real (0 desativa a verificação).
+# Sinal fraco: um shell de JS ainda não renderizado também tem pouco texto,
+# e o falso positivo descarta storage state, contexto e proxy. Desativado
+# por padrão; ative com BlockDetector(min_text_length=...)
+MIN_TEXT_LENGTH = 0
+
+# Eventos de navegação que retornam antes do conteúdo ser renderizado
+# (a verificação de texto mínimo não se aplica)
+EARLY_WAIT_EVENTS = ("commit", "domcontentloaded")
+
+_SNAPSHOT_JS = """
+(config) => {
+    const found = config.selectors.filter((selector) => {
+        try {
+            return document.querySelector(selector) !== null;
+        } catch (e) {
+            return false;
+        }
+    });
+    const sources = Array.from(
+        document.querySelectorAll("script[src], iframe[src]"),
+        (el) => el.src.toLowerCase(),
+    );
+    return {
+        url: location.href,
+        title: document.title || "",
+        text_length: document.body ? document.body.textContent.trim().length : 0,
+        selectors: found,
+        scripts: sources.filter((src) => config.scripts.some((m) => src.includes(m))),
+    };
+}
+"""
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_SRC_RE = re.compile(r"<(?:script|iframe)\b[^>]*\bsrc=[\"']([^\"']+)", re.IGNORECASE)
+_NON_TEXT_RE = re.compile(
+    r"<script\b.*?</script>|<style\b.*?</style>|<[^>]+>", re.IGNORECASE | re.DOTALL
+)
+
+
+@dataclass
+class BlockVerdict:
+    """Resultado da classificação de uma página."""
+
+    url: str
+    blocked: bool
+    reason: Optional[str] = None  # ex.: 'title:just a moment', 'empty_body'
+
+    @property
+    def kind(self) -> Optional[str]:
+        """Tipo do sinal ('url', 'title', 'dom', 'script', 'empty_body')."""
+        return self.reason.split(":", 1)[0] if self.reason else None
+
+
+class BlockedPageError(Exception):
+    """Página de bloqueio/desafio recebida no lugar do conteúdo."""
+
+    def __init__(self, verdict: BlockVerdict):
+        super().__init__(f"Página bloqueada em {verdict.url} ({verdict.reason})")
+        self.verdict = verdict
+
+
+# Listener de bloqueio: listener(page, verdict)
+BlockListener = Callable[[Page, BlockVerdict], Awaitable[None]]
+
+
+class BlockDetector:
+    """
+    Classificador de páginas de bloqueio com taxa de bloqueio por host.
+
+    Uso:
+    >>> verdict = await block_detector.detect(page)
+    >>> if verdict.blocked:
+    >>>     print(verdict.reason)
+    >>> print(block_detector.get_statistics())
+    """
+
+    def __init__(
+        self,
+        title_markers: Iterable[str] = TITLE_MARKERS,
+        url_markers: Iterable[str] = URL_MARKERS,
+        selectors: Iterable[str] = SELECTOR_MARKERS,
+        scripts: Iterable[str] = SCRIPT_MARKERS,
+        min_text_length: int = MIN_TEXT_LENGTH,
+    ):
+        """
+        Args:
+            title_markers: Trechos de título de páginas de desafio
+            url_markers: Trechos de URL de páginas de desafio
+            selectors: Seletores de elementos de desafio/CAPTCHA
+            scripts: Trechos de src de scripts/iframes de desafio
+            min_text_length: Texto mínimo de uma página real (0 desativa;
+                só use com páginas renderizadas no servidor ou 'load')
+        """
+        self.title_markers = [m.lower() for m in title_markers]
+        self.url_markers = [m.lower() for m in url_markers]
+        self.selectors = list(selectors)
+        self.scripts = [m.lower() for m in scripts]
+        self.min_text_length = min_text_length
+        self.enabled = True
+
+        self.listeners: List[BlockListener] = []
+        # host → {"checked", "blocked", "reasons": {tipo: contagem}}
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    def add_listener(self, listener: BlockListener) -> None:
+        """Registra uma função async chamada para cada página bloqueada."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: BlockListener) -> None:
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def classify(
+        self, snapshot: Dict[str, Any], check_empty_body: bool = True
+    ) -> BlockVerdict:
+        """
+        Classifica um snapshot da página (url, title, text_length,
+        selectors e scripts encontrados).
+
+        Args:
+            snapshot: Dados coletados da página
+            check_empty_body: Aplicar a verificação de texto mínimo
+        """
+        url = snapshot.get("url", "")
+        lowered_url = url.lower()
+        title = snapshot.get("title", "").strip().lower()
+
+        reason = None
+        for marker in self.url_markers:
+            if marker in lowered_url:
+                reason = f"url:{marker}"
+                break
+        else:
+            for marker in self.title_markers:
+                if marker in title:
+                    reason = f"title:{marker}"
+                    break
+
+        if reason is None and snapshot.get("selectors"):
+            reason = f"dom:{snapshot['selectors'][0]}"
+        if reason is None and snapshot.get("scripts"):
+            reason = f"script:{self._script_marker(snapshot['scripts'][0])}"
+        if (
+            reason is None
+            and check_empty_body
+            and self.min_text_length
+            and snapshot.get("text_length") is not None
+            and snapshot["text_length"] < self.min_text_length
+        ):
+            reason = "empty_body"
+
+        verdict = BlockVerdict(url, reason is not None, reason)
+        self._record(verdict)
+        return verdict
+
+    def _script_marker(self, src: str) -> str:
+        return next((m for m in self.scripts if m in src), src)
+
+    async def detect(self, page: Page, check_empty_body: bool = True) -> BlockVerdict:
+        """
+        Classifica a página atual (um round trip) e notifica os listeners
+        se ela estiver bloqueada.
+
+        Args:
+            page: Página do Playwright
+            check_empty_body: Aplicar a verificação de texto mínimo (False
+                quando a navegação retornou antes da renderização)
+
+        Returns:
+            BlockVerdict: Resultado (não bloqueada se o snapshot falhar)
+        """
+        try:
+            snapshot = await page.evaluate(
+                _SNAPSHOT_JS, {"selectors": self.selectors, "scripts": self.scripts}
+            )
+        except Exception as e:
+            logger.debug(f"Erro na detecção de bloqueio: {str(e)}")
+            return BlockVerdict(page.url, False)
+
+        verdict = self.classify(snapshot, check_empty_body)
+        if verdict.blocked:
+            logger.warning(f"Página bloqueada em {verdict.url}: {verdict.reason}")
+            for listener in list(self.listeners):
+                try:
+                    await listener(page, verdict)
+                except Exception as e:
+                    logger.warning(f"Erro no listener de bloqueio: {str(e)}")
+        return verdict
+
+    def check_html(
+        self, url: str, html: str, check_empty_body: bool = True
+    ) -> BlockVerdict:
+        """
+        Classifica HTML obtido sem browser (ex.: HttpFetcher).
+
+        Seletores de DOM não são avaliados; título, URL, scripts e tamanho
+        do texto são extraídos do HTML; 'check_empty_body' como em detect().
+        """
+        match = _TITLE_RE.search(html)
+        sources = [src.lower() for src in _SRC_RE.findall(html)]
+        return self.classify(
+            {
+                "url": url,
+                "title": match.group(1) if match else "",
+                "text_length": len(_NON_TEXT_RE.sub("", html).strip()),
+                "scripts": [s for s in sources if any(m in s for m in self.scripts)],
+            },
+            check_empty_body,
+        )
+
+    def _record(self, verdict: BlockVerdict) -> None:
+        host = urlsplit(verdict.url).hostname or "unknown"
+        stats = self.stats.setdefault(host, {"checked": 0, "blocked": 0, "reasons": {}})
+        stats["checked"] += 1
+        if verdict.blocked:
+            stats["blocked"] += 1
+            stats["reasons"][verdict.kind] = stats["reasons"].get(verdict.kind, 0) + 1
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Retorna páginas verificadas, bloqueadas e taxa de bloqueio por host."""
+        return {
+            host: {
+                **stats,
+                "reasons": dict(stats["reasons"]),
+                "block_rate": stats["blocked"] / stats["checked"],
+            }
+            for host, stats in self.stats.items()
+        }
+
+    def reset_statistics(self) -> None:
+        self.stats.clear()
+
+
+# Instância global do detector de bloqueio
+block_detector = BlockDetector()
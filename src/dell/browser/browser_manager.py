@@ -3,8 +3,26 @@ BrowserManager - Factory Pattern para gerenciamento do Playwright.
 Implementação enterprise com máxima confiabilidade e padrão RPA.
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional
+import os
+import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from playwright.async_api import (
     Browser,
@@ -13,13 +31,146 @@ from playwright.async_api import (
     Playwright,
     async_playwright,
 )
-from tenacity import retry, stop_after_attempt, wait_exponential
 
+from dell.browser.block_detection import BlockVerdict, block_detector
+from dell.browser.browser_server import get_server_endpoint, read_server_info
+from dell.browser.errors import BrowserCrashedError
+from dell.browser.page_pool import PagePool
 from dell.browser.profiles.browser_profiles import get_profile
+from dell.browser.proxy_pool import Proxy, proxy_pool
+from dell.browser.resilience import (
+    RETRYABLE_CATEGORIES,
+    RetryPolicy,
+    call_with_retry,
+)
+from dell.browser.result_cache import ResultCache, normalize_url
+from dell.browser.routing import ResourcePolicy
+from dell.browser.storage_state import (
+    DEFAULT_STORAGE_STATE_DIR,
+    DEFAULT_STORAGE_STATE_TTL,
+    StorageStateStore,
+)
+from dell.browser.utils import replay_contexts, safe_goto
 from dell.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Máximo de páginas simultâneas por contexto no pool
+DEFAULT_PAGE_POOL_SIZE = 5
+
+# Chaves dos perfis que são de lançamento/pace e não de contexto
+PROFILE_LAUNCH_KEYS = ("headless", "slow_mo", "devtools", "args", "wait_for_load_state")
+
+# Limites para reciclagem automática de contextos (None desativa o limite)
+DEFAULT_RECYCLE_POLICY = {
+    "max_pages": 500,  # Páginas entregues pelo contexto
+    "max_age": 1800,  # Idade do contexto em segundos (30 min)
+    "max_rss_mb": 2048,  # RSS total dos processos do browser
+    "min_age": 60,  # Idade mínima antes de reciclar por memória (evita loop)
+}
+
+# Intervalo mínimo entre leituras de memória em /proc (segundos)
+RSS_CHECK_INTERVAL = 10.0
+
+# Watchdog: intervalo entre probes, timeout do probe e falhas até relançar
+WATCHDOG_INTERVAL = 15.0
+WATCHDOG_PROBE_TIMEOUT = 10.0
+WATCHDOG_MAX_FAILURES = 2
+
+# Tempo máximo que uma chamada aguarda o browser ser relançado (segundos)
+RESPAWN_WAIT_TIMEOUT = 60.0
+
+# Espera entre relançamentos que falharam (dobra até o teto, em segundos)
+RESPAWN_RETRY_DELAY = 5.0
+RESPAWN_MAX_RETRY_DELAY = 60.0
+
+# Espera após um aquecimento que falhou, dobrando até o teto (segundos)
+WARM_UP_RETRY_DELAY = 300.0
+WARM_UP_MAX_RETRY_DELAY = 3600.0
+
+# Timeout para conectar no browser server persistente (ms)
+SERVER_CONNECT_TIMEOUT = 5000
+
+# Diretório dos arquivos HAR (um por categoria) e modos suportados
+DEFAULT_HAR_DIR = "har"
+HAR_MODES = ("record", "replay")
+
+
+# Retry da inicialização (espera de 4-10s entre tentativas)
+INITIALIZE_RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay=4.0, max_delay=10.0)
+
+# map_pages: tentativas extras e tempo máximo por URL (segundos)
+DEFAULT_MAP_RETRIES = 2
+DEFAULT_MAP_ITEM_TIMEOUT = 90.0
+
+# Handler do map_pages: handler(page, url) -> resultado
+PageHandler = Callable[[Page, str], Awaitable[Any]]
+
+
+@dataclass
+class PageResult:
+    """
+    Resultado de uma URL processada pelo map_pages.
+
+    Com cached=True o valor veio do cache (ou de outra chamada concorrente
+    para a mesma URL): attempts é 0 e elapsed é só a espera deste chamador.
+    """
+
+    url: str
+    ok: bool
+    value: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    cached: bool = False
+
+
+def _process_tree_rss_bytes(
+    root_pid: Optional[int] = None, include_root: bool = False
+) -> Optional[int]:
+    """
+    Soma o RSS de todos os processos descendentes (driver + Chromium).
+
+    Lê /proc diretamente, então só funciona em Linux.
+
+    Args:
+        root_pid: Raiz da árvore (padrão: este processo)
+        include_root: Somar também o RSS da raiz (ex.: PID do browser server)
+
+    Returns:
+        int: RSS em bytes ou None se /proc não estiver disponível
+    """
+    root_pid = root_pid or os.getpid()
+    children: Dict[int, List[int]] = {}
+    rss_pages: Dict[int, int] = {}
+
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # O nome do processo pode conter espaços; campos seguem após ')'
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open(f"/proc/{entry}/statm") as f:
+                rss_pages[int(entry)] = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    total_pages = rss_pages.get(root_pid, 0) if include_root else 0
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        total_pages += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+
+    return total_pages * os.sysconf("SC_PAGE_SIZE")
+
 
 class BrowserManager:
     """
@@ -27,12 +178,66 @@ class BrowserManager:
     Foco em confiabilidade máxima e reutilização de recursos.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        page_pool_size: int = DEFAULT_PAGE_POOL_SIZE,
+        recycle_policy: Optional[Dict[str, Any]] = None,
+        storage_states: Optional[StorageStateStore] = None,
+    ):
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
         self.contexts: Dict[str, BrowserContext] = {}
+        self.context_specs: Dict[str, Dict[str, Any]] = {}
+        self.page_pools: Dict[str, PagePool] = {}
+        self.resource_policies: Dict[str, ResourcePolicy] = {}
+        self.page_pool_size = page_pool_size
+        self.recycle_policy = {**DEFAULT_RECYCLE_POLICY, **(recycle_policy or {})}
+        self.recycle_count = 0
         self.is_initialized = False
 
+        # Contextos reciclados aguardando devolução/fechamento das páginas
+        self._retired_pools: List[PagePool] = []
+        self._retired_contexts: Dict[BrowserContext, str] = {}
+        self._unpooled_pages: Dict[BrowserContext, Set[Page]] = {}
+        self._recycle_locks: Dict[str, asyncio.Lock] = {}
+        self._last_rss_check = 0.0
+        self._last_rss_bytes: Optional[int] = None
+        # PID do browser server local (browser_server.json); None = RSS remoto
+        # desconhecido, e a reciclagem por memória fica desligada
+        self._server_pid: Optional[int] = None
+        self._rss_unavailable_logged = False
+
+        # Storage state por perfil (criado sob demanda a partir do settings)
+        self._storage_states = storage_states
+        self._warm_up_locks: Dict[str, asyncio.Lock] = {}
+        # Perfil → (instante da próxima tentativa, espera atual) após falha
+        self._warm_up_backoff: Dict[str, Tuple[float, float]] = {}
+
+        # Watchdog - supervisão do browser e relançamento automático
+        self.browser_type = "chromium"
+        self.use_browser_server = False
+        self.is_remote_browser = False
+        self.crash_count = 0
+        self._browser_ready: Optional[asyncio.Event] = None
+        self._respawn_lock: Optional[asyncio.Lock] = None
+        self._watchdog_task: Optional[asyncio.Task] = None
+        self._respawn_task: Optional[asyncio.Task] = None
+        self._closing = False
+
+        # Página de bloqueio → contexto recriado com identidade limpa
+        # (listener registrado no initialize e removido no cleanup)
+        self.block_rotations = 0
+
+    @property
+    def storage_states(self) -> StorageStateStore:
+        """Store de storage state por perfil."""
+        if self._storage_states is None:
+            self._storage_states = StorageStateStore(
+                settings.get("storage_state_dir", DEFAULT_STORAGE_STATE_DIR),
+                settings.get("storage_state_ttl", DEFAULT_STORAGE_STATE_TTL),
+            )
+        return self._storage_states
+
     async def __aenter__(self):
         """Context manager para uso com async with"""
         await self.initialize()
@@ -42,16 +247,27 @@ class BrowserManager:
         """Cleanup automático ao sair do context"""
         await self.cleanup()
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    async def initialize(self, browser_type: str = "chromium") -> None:
+    async def initialize(
+        self, browser_type: str = "chromium", use_server: Optional[bool] = None
+    ) -> None:
         """
         Inicializa o Playwright e browser com retry automático.
 
+        Só falhas transitórias (timeout, rede, browser fechado) são repetidas,
+        pela mesma política de retry das operações de página.
+
         Args:
             browser_type: Tipo do browser ('chromium', 'firefox', 'webkit')
+            use_server: Conectar no browser server persistente, com fallback
+                para lançamento local (padrão: setting 'browser_server')
         """
+        await call_with_retry(
+            lambda: self._initialize(browser_type, use_server),
+            policy=INITIALIZE_RETRY_POLICY,
+            reason="Inicialização do browser",
+        )
+
+    async def _initialize(self, browser_type: str, use_server: Optional[bool]) -> None:
         try:
             logger.info(f"Inicializando BrowserManager com {browser_type}")
 
@@ -63,20 +279,16 @@ class BrowserManager:
             self.playwright = await async_playwright().start()
             logger.debug("Playwright iniciado com sucesso")
 
-            # Configurações base do browser
-            browser_config = {
-                "headless": not settings.debug if hasattr(settings, "debug") else True,
-                "args": [
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-first-run",
-                    "--disable-dev-shm-usage",
-                ],
-            }
-
-            # Lançar browser
-            browser_launcher = getattr(self.playwright, browser_type)
-            self.browser = await browser_launcher.launch(**browser_config)
+            self.browser_type = browser_type
+            if use_server is None:
+                use_server = settings.get("browser_server", False)
+            self.use_browser_server = use_server
+            self._browser_ready = asyncio.Event()
+            self._respawn_lock = asyncio.Lock()
+            await self._launch_browser()
+            self._browser_ready.set()
 
+            block_detector.add_listener(self._on_page_blocked)
             self.is_initialized = True
             logger.info(f"Browser {browser_type} inicializado com sucesso")
 
@@ -85,12 +297,81 @@ class BrowserManager:
             await self.cleanup()
             raise
 
+    async def _launch_browser(self) -> None:
+        """
+        Lança (ou conecta) o browser e registra o listener de desconexão.
+
+        Não marca o browser como pronto: quem chama faz isso quando o estado
+        dependente (ex.: contextos recriados no respawn) também estiver pronto.
+        """
+        if self.use_browser_server and await self._connect_browser_server():
+            return
+
+        self.is_remote_browser = False
+
+        # Configurações base do browser
+        browser_config = {
+            "headless": not settings.debug if hasattr(settings, "debug") else True,
+            "args": [
+                "--disable-blink-features=AutomationControlled",
+                "--no-first-run",
+                "--disable-dev-shm-usage",
+            ],
+        }
+
+        # Lançar browser
+        browser_launcher = getattr(self.playwright, self.browser_type)
+        self.browser = await browser_launcher.launch(**browser_config)
+        self.browser.on("disconnected", self._on_browser_disconnected)
+
+    async def _connect_browser_server(self) -> bool:
+        """
+        Conecta no browser server persistente.
+
+        Returns:
+            bool: True se conectou; False para cair no lançamento local
+        """
+        endpoint = get_server_endpoint()
+        if not endpoint:
+            logger.debug("Nenhum browser server registrado, lançando localmente")
+            return False
+
+        browser_type = getattr(self.playwright, self.browser_type)
+        try:
+            if endpoint.startswith("ws"):
+                # Servidor 'playwright run-server'
+                self.browser = await browser_type.connect(
+                    endpoint, timeout=SERVER_CONNECT_TIMEOUT
+                )
+            else:
+                self.browser = await browser_type.connect_over_cdp(
+                    endpoint, timeout=SERVER_CONNECT_TIMEOUT
+                )
+        except Exception as e:
+            logger.warning(f"Browser server indisponível em {endpoint}: {str(e)}")
+            return False
+
+        self.is_remote_browser = True
+        # O Chromium do server não é filho deste processo: medir pelo PID
+        # registrado, se o endpoint for o do arquivo (ws:// não tem PID)
+        info = read_server_info()
+        self._server_pid = (
+            info.get("pid") if info and info.get("endpoint") == endpoint else None
+        )
+        self.browser.on("disconnected", self._on_browser_disconnected)
+        logger.info(f"Conectado ao browser server em {endpoint}")
+        return True
+
     async def create_context(
         self, profile_name: str = "production", context_id: str = "default", **kwargs
     ) -> BrowserContext:
         """
         Cria um novo contexto de browser com perfil específico.
 
+        Modo HAR (kwargs 'har_mode' e 'har_name', ou setting 'har_mode'):
+        - 'record': grava as respostas em <har_dir>/<har_name>.har.zip
+        - 'replay': serve o arquivo via roteamento, sem acesso à rede
+
         Args:
             profile_name: Nome do perfil ('production', 'debug', 'stealth')
             context_id: ID único para o contexto
@@ -102,11 +383,44 @@ class BrowserManager:
         if not self.is_initialized:
             await self.initialize()
 
+        # Durante o respawn os contextos registrados são recriados pelo watchdog
+        await self._wait_browser_ready()
+
         # Se contexto já existe, retorna o existente
         if context_id in self.contexts:
             logger.info(f"Reutilizando contexto existente: {context_id}")
             return self.contexts[context_id]
 
+        if "har_mode" not in kwargs and settings.get("har_mode"):
+            kwargs["har_mode"] = settings.get("har_mode")
+
+        # Warm start: garantir storage state fresco do perfil (replay não acessa a rede)
+        if "storage_state" not in kwargs and kwargs.get("har_mode") != "replay":
+            await self._ensure_storage_state(profile_name)
+
+        context = await self._open_context(profile_name, context_id, kwargs)
+        self.contexts[context_id] = context
+        self.context_specs[context_id] = {
+            "profile_name": profile_name,
+            "kwargs": kwargs,
+            "created_at": time.monotonic(),
+            "pages_served": 0,
+        }
+        return context
+
+    async def _open_context(
+        self,
+        profile_name: str,
+        context_id: str,
+        kwargs: Dict[str, Any],
+        proxy: Optional[Proxy] = None,
+    ) -> BrowserContext:
+        """
+        Abre um contexto no browser a partir do perfil (sem registrá-lo).
+
+        Sem 'proxy' (e sem a opção 'proxy' no perfil/kwargs), o contexto sai
+        pelo proxy escolhido no proxy_pool, se houver proxies configurados.
+        """
         try:
             # Carregar configurações do perfil
             profile_config = get_profile(profile_name)
@@ -117,16 +431,68 @@ class BrowserManager:
             # Aplicar kwargs customizados (sobrescreve perfil)
             profile_config.update(kwargs)
 
+            # Storage state salvo do perfil, salvo se informado explicitamente
+            profile_config.pop("warm_up_url", None)
+            if "storage_state" not in profile_config:
+                storage_state = self.storage_states.load(profile_name)
+                if storage_state:
+                    profile_config["storage_state"] = storage_state
+                    logger.debug(f"Contexto '{context_id}' com storage state salvo")
+
+            # Política de recursos não é opção do Playwright; contextos
+            # reciclados mantêm a mesma política (e seus contadores)
+            policy_config = profile_config.pop("resource_policy", None)
+            resource_policy = self.resource_policies.get(context_id)
+            if resource_policy is None:
+                resource_policy = ResourcePolicy.from_config(policy_config)
+
+            # Timeouts são aplicados no contexto, não na criação
+            timeout = profile_config.pop("timeout", None)
+            navigation_timeout = profile_config.pop("navigation_timeout", None)
+
+            # HAR: gravação por categoria ou replay sem rede
+            har_mode = profile_config.pop("har_mode", None)
+            har_path = self.har_path(profile_config.pop("har_name", None) or context_id)
+            if har_mode == "record":
+                har_path.parent.mkdir(parents=True, exist_ok=True)
+                profile_config["record_har_path"] = str(har_path)
+                profile_config.setdefault("record_har_mode", "full")
+            elif har_mode == "replay":
+                if not har_path.exists():
+                    raise FileNotFoundError(f"Arquivo HAR não encontrado: {har_path}")
+                # Service workers escapariam do roteamento
+                profile_config["service_workers"] = "block"
+            elif har_mode is not None:
+                raise ValueError(f"Modo HAR inválido '{har_mode}'. Use: {HAR_MODES}")
+
+            # Proxy do pool; replay não acessa a rede
+            if proxy is None and "proxy" not in profile_config and har_mode != "replay":
+                proxy = proxy_pool.choose()
+            if proxy is not None:
+                profile_config["proxy"] = proxy.as_playwright()
+
             logger.info(f"Criando contexto '{context_id}' com perfil '{profile_name}'")
 
             # Criar contexto com configurações
             context = await self.browser.new_context(**profile_config)
+            if proxy is not None:
+                proxy_pool.assign(context, proxy)
+                logger.info(f"Contexto '{context_id}' via proxy {proxy.server}")
+            if timeout:
+                context.set_default_timeout(timeout)
+            if navigation_timeout:
+                context.set_default_navigation_timeout(navigation_timeout)
 
-            # Configurações extras pós-criação
-            await self._setup_context_extras(context, profile_name)
+            # Requests fora do HAR são abortados: nada vai para a rede
+            if har_mode == "replay":
+                await context.route_from_har(har_path, not_found="abort")
+                replay_contexts.add(context)
+                logger.info(f"Contexto '{context_id}' em replay de {har_path}")
 
-            # Armazenar referência
-            self.contexts[context_id] = context
+            # Configurações extras pós-criação
+            await self._setup_context_extras(context, profile_name, resource_policy)
+            if resource_policy:
+                self.resource_policies[context_id] = resource_policy
 
             logger.info(f"Contexto '{context_id}' criado com sucesso")
             return context
@@ -135,13 +501,49 @@ class BrowserManager:
             logger.error(f"Erro ao criar contexto '{context_id}': {str(e)}")
             raise
 
+    def har_path(self, name: str) -> Path:
+        """
+        Caminho do arquivo HAR de uma categoria.
+
+        Args:
+            name: Nome da categoria (ou ID do contexto)
+
+        Returns:
+            Path: <har_dir>/<nome>.har.zip
+        """
+        safe_name = re.sub(r"[^\w.-]+", "_", name).strip("_") or "default"
+        return Path(settings.get("har_dir", DEFAULT_HAR_DIR)) / f"{safe_name}.har.zip"
+
+    def _sync_pace_with_profile(
+        self, profile_name: str, profile_config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Remove do perfil as chaves que não são opções de new_context().
+
+        O ritmo entre ações é controlado pelo PaceManager, então 'slow_mo' e
+        as opções de lançamento do browser não se aplicam ao contexto.
+        """
+        for key in PROFILE_LAUNCH_KEYS:
+            if key in profile_config:
+                logger.debug(f"Perfil '{profile_name}': ignorando '{key}' no contexto")
+                profile_config.pop(key)
+
+        return profile_config
+
     async def _setup_context_extras(
-        self, context: BrowserContext, profile_name: str
+        self,
+        context: BrowserContext,
+        profile_name: str,
+        resource_policy: Optional[ResourcePolicy] = None,
     ) -> None:
         """
         Configurações extras aplicadas após criação do contexto.
         """
         try:
+            # Bloqueio de recursos (imagens, fontes, trackers...)
+            if resource_policy:
+                await resource_policy.install(context)
+
             # Interceptar e logar requests se em debug
             if profile_name == "debug":
                 context.on(
@@ -182,6 +584,9 @@ class BrowserManager:
         """
         Obtém uma nova página do contexto especificado.
 
+        A página não volta para nenhum pool; quem chama é responsável por
+        fechá-la. Para reutilização de páginas use acquire_page() ou page().
+
         Args:
             context_id: ID do contexto
             profile_name: Perfil a usar se contexto não existir
@@ -190,20 +595,632 @@ class BrowserManager:
             Page: Nova página pronta para uso
         """
         # Garantir que contexto existe
+        await self._wait_browser_ready()
         if context_id not in self.contexts:
             await self.create_context(profile_name, context_id)
 
+        await self._maybe_recycle(context_id)
+
         context = self.contexts[context_id]
         page = await context.new_page()
+        self.context_specs[context_id]["pages_served"] += 1
+
+        # Rastreada para que a reciclagem não feche o contexto com ela aberta
+        self._unpooled_pages.setdefault(context, set()).add(page)
+        page.once("close", lambda _: self._on_unpooled_page_closed(context, page))
 
         logger.debug(f"Nova página criada no contexto '{context_id}'")
         return page
 
+    async def acquire_page(
+        self,
+        context_id: str = "default",
+        profile_name: str = "production",
+        timeout: Optional[float] = None,
+    ) -> Page:
+        """
+        Empresta uma página do pool do contexto, aguardando se estiver cheio.
+
+        Args:
+            context_id: ID do contexto
+            profile_name: Perfil a usar se contexto não existir
+            timeout: Tempo máximo de espera por página livre (segundos)
+
+        Returns:
+            Page: Página reutilizada ou recém-criada
+        """
+        await self._wait_browser_ready()
+        if context_id not in self.contexts:
+            await self.create_context(profile_name, context_id)
+
+        await self._maybe_recycle(context_id)
+
+        pool = self.page_pools.get(context_id)
+        if pool is None:
+            pool = PagePool(
+                self.contexts[context_id], context_id, max_size=self.page_pool_size
+            )
+            self.page_pools[context_id] = pool
+
+        page = await pool.acquire(timeout=timeout)
+        self.context_specs[context_id]["pages_served"] += 1
+        return page
+
+    async def release_page(self, page: Page, discard: bool = False) -> None:
+        """
+        Devolve uma página emprestada ao pool de origem.
+
+        Args:
+            page: Página obtida via acquire_page()
+            discard: Fechar a página em vez de reutilizá-la
+        """
+        for pool in self.page_pools.values():
+            if pool.owns(page):
+                await pool.release(page, discard=discard)
+                return
+
+        # Página de um contexto reciclado: fechar e, se for a última, o contexto
+        for pool in self._retired_pools:
+            if pool.owns(page):
+                await pool.release(page, discard=True)
+                await self._close_retired_if_idle(pool.context)
+                return
+
+        logger.warning("Página devolvida não pertence a nenhum pool, fechando")
+        if not page.is_closed():
+            await page.close()
+
+    def add_page_listener(self, page: Page, event: str, handler: Callable) -> None:
+        """
+        Registra um listener que dura só o empréstimo da página.
+
+        Use no lugar de page.on() em páginas do pool: o reset da devolução
+        remove apenas os listeners registrados por aqui. Páginas fora do pool
+        (get_page) não são reutilizadas, então recebem page.on() direto.
+
+        Args:
+            page: Página obtida via acquire_page() ou page()
+            event: Evento do Playwright (ex.: "response")
+            handler: Callback do evento
+        """
+        for pool in (*self.page_pools.values(), *self._retired_pools):
+            if pool.owns(page):
+                pool.on(page, event, handler)
+                return
+        page.on(event, handler)
+
+    @asynccontextmanager
+    async def page(
+        self,
+        context_id: str = "default",
+        profile_name: str = "production",
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Page]:
+        """
+        Context manager que empresta uma página do pool e a devolve ao sair.
+
+        Listeners temporários devem usar add_page_listener(): os de
+        page.on() continuam na página quando ela volta ao pool.
+
+        Uso:
+        >>> async with browser_manager.page("main") as page:
+        >>>     browser_manager.add_page_listener(page, "response", on_response)
+        >>>     await safe_goto(page, url)
+        """
+        page = await self.acquire_page(context_id, profile_name, timeout)
+        try:
+            yield page
+        except Exception as e:
+            # Erro causado por queda do browser vira erro repetível
+            if not self.is_browser_ready and not isinstance(e, BrowserCrashedError):
+                raise BrowserCrashedError(
+                    f"Browser caiu durante operação no contexto '{context_id}'"
+                ) from e
+            raise
+        finally:
+            await self.release_page(page)
+
+    async def map_pages(
+        self,
+        urls: Iterable[str],
+        handler: PageHandler,
+        concurrency: Optional[int] = None,
+        context_id: str = "default",
+        profile_name: str = "production",
+        retries: int = DEFAULT_MAP_RETRIES,
+        item_timeout: Optional[float] = DEFAULT_MAP_ITEM_TIMEOUT,
+        navigate: bool = True,
+        cache: Optional[ResultCache] = None,
+        cache_key: Optional[str] = None,
+    ) -> AsyncIterator[PageResult]:
+        """
+        Processa várias URLs em paralelo, com páginas do pool do contexto.
+
+        Cada URL: empresta página → safe_goto (rate limit por host e
+        readiness) → handler(page, url). Falhas e timeouts são repetidos até
+        'retries' vezes; respostas HTTP de erro (4xx, ou 5xx/429 após os
+        retries) viram PageResult com ok=False sem chamar o handler. Os
+        resultados saem na ordem de conclusão.
+
+        Com 'cache', URLs repetidas (também em chamadas concorrentes)
+        compartilham uma única navegação, e resultados bem-sucedidos são
+        reaproveitados enquanto estiverem no cache.
+
+        Args:
+            urls: URLs a processar (consumidas sob demanda)
+            handler: Função async handler(page, url) -> valor
+            concurrency: Páginas simultâneas (padrão: tamanho do pool)
+            context_id: Contexto cujas páginas serão usadas
+            profile_name: Perfil do contexto e das estratégias de readiness
+            retries: Tentativas extras por URL
+            item_timeout: Tempo máximo por tentativa em segundos, contado após
+                obter a página do pool (None = sem limite)
+            navigate: False se o próprio handler navega
+            cache: ResultCache para coalescer/reaproveitar resultados por URL
+            cache_key: Identifica o handler no cache (padrão: o próprio objeto
+                handler, mantido pelo cache; informe para reaproveitar entre
+                handlers equivalentes)
+
+        Yields:
+            PageResult: Resultado de cada URL
+
+        Example:
+        >>> async for result in browser_manager.map_pages(urls, extract_product, 5):
+        >>>     if result.ok:
+        >>>         save(result.value)
+        """
+        concurrency = concurrency or self.page_pool_size
+        if concurrency > self.page_pool_size:
+            logger.warning(
+                f"Concorrência {concurrency} maior que o pool "
+                f"({self.page_pool_size}); excedentes aguardarão página livre"
+            )
+
+        url_iterator = iter(urls)
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def process(url: str) -> PageResult:
+            started = time.monotonic()
+            attempts = 0
+
+            async def attempt() -> Any:
+                nonlocal attempts
+                attempts += 1
+                # Espera por página livre não conta no tempo da tentativa
+                async with self.page(context_id, profile_name) as page:
+                    async with asyncio.timeout(item_timeout):
+                        if navigate:
+                            # Uma navegação por tentativa: o retry é o daqui
+                            # (HTTP de erro não chega ao handler)
+                            await safe_goto(
+                                page,
+                                url,
+                                max_retries=1,
+                                profile_name=profile_name,
+                                raise_on_status=True,
+                            )
+                        return await handler(page, url)
+
+            # Erros não transitórios e breaker aberto não gastam novas tentativas;
+            # bloqueio é repetido porque a próxima página vem do contexto rotacionado
+            try:
+                value = await call_with_retry(
+                    attempt,
+                    policy=RetryPolicy(
+                        max_attempts=retries + 1,
+                        retry_on=RETRYABLE_CATEGORIES | {"blocked"},
+                    ),
+                    reason=f"map_pages {url}",
+                )
+            except Exception as e:
+                error = type(e).__name__ + (f": {str(e)}" if str(e) else "")
+                logger.warning(
+                    f"map_pages: {url} falhou após {attempts} tentativas: {error}"
+                )
+                return PageResult(
+                    url, False, None, error, attempts, time.monotonic() - started
+                )
+
+            return PageResult(
+                url, True, value, None, attempts, time.monotonic() - started
+            )
+
+        # Resultados de handlers diferentes não se misturam no cache: o
+        # prefixo é do próprio objeto handler (nem __qualname__ nem id() bastam:
+        # closures da mesma fábrica compartilham o nome, e ids são reaproveitados)
+        if cache is not None and cache_key is None:
+            cache_key = cache.namespace(handler)
+
+        async def process_cached(url: str) -> PageResult:
+            if cache is None:
+                return await process(url)
+
+            started = time.monotonic()
+            computed = False
+
+            def compute() -> Awaitable[PageResult]:
+                nonlocal computed
+                computed = True
+                return process(url)
+
+            result = await cache.get_or_compute(
+                f"{cache_key}:{normalize_url(url)}",
+                compute,
+                cache_if=lambda result: result.ok,
+            )
+            if computed:
+                return result
+            # Hit ou chamada coalescida: a URL pode diferir da normalizada
+            return replace(
+                result,
+                url=url,
+                attempts=0,
+                elapsed=time.monotonic() - started,
+                cached=True,
+            )
+
+        async def worker() -> None:
+            # Iterador compartilhado: cada worker pega a próxima URL livre
+            try:
+                for url in url_iterator:
+                    await results.put(await process_cached(url))
+            finally:
+                results.put_nowait(None)  # Sinaliza fim do worker
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        active = len(workers)
+
+        try:
+            while active:
+                result = await results.get()
+                if result is None:
+                    active -= 1
+                else:
+                    yield result
+
+        finally:
+            # Consumidor saiu antes do fim: cancelar URLs em andamento
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _ensure_storage_state(self, profile_name: str) -> None:
+        """Aquece o perfil se o storage state salvo está ausente ou velho."""
+        if self.storage_states.is_fresh(profile_name):
+            return
+
+        if not get_profile(profile_name).get("warm_up_url"):
+            return
+
+        # Aquecimento falhou há pouco (offline, bloqueado...): não repetir a
+        # navegação a cada contexto criado
+        if self._warm_up_suspended(profile_name):
+            return
+
+        lock = self._warm_up_locks.setdefault(profile_name, asyncio.Lock())
+        async with lock:
+            # Outro coroutine pode ter aquecido (ou falhado) enquanto aguardávamos
+            if self.storage_states.is_fresh(profile_name):
+                return
+            if not self._warm_up_suspended(profile_name):
+                await self.warm_up(profile_name)
+
+    def _warm_up_suspended(self, profile_name: str) -> bool:
+        """Indica se o perfil está no backoff de um aquecimento que falhou."""
+        retry_at, _ = self._warm_up_backoff.get(profile_name, (0.0, 0.0))
+        return time.monotonic() < retry_at
+
+    async def warm_up(
+        self,
+        profile_name: str = "production",
+        url: Optional[str] = None,
+        setup: Optional[Callable[[Page], Awaitable[None]]] = None,
+    ) -> bool:
+        """
+        Navega com um contexto limpo e salva o storage state do perfil.
+
+        A navegação passa pelo safe_goto (rate limit, breaker e detecção de
+        bloqueio). Após uma falha, o warm start automático do perfil fica
+        suspenso por um tempo crescente (WARM_UP_RETRY_DELAY).
+
+        Args:
+            profile_name: Perfil a aquecer
+            url: URL de aquecimento (padrão: 'warm_up_url' do perfil)
+            setup: Função async opcional executada na página (ex.: aceitar cookies)
+
+        Returns:
+            bool: True se o storage state foi salvo
+        """
+        url = url or get_profile(profile_name).get("warm_up_url")
+        if not url:
+            logger.warning(f"Perfil '{profile_name}' sem URL de aquecimento")
+            return False
+
+        if not self.is_initialized:
+            await self.initialize()
+
+        warm_up_id = f"warm_up_{profile_name}"
+        logger.info(f"Aquecendo perfil '{profile_name}' em {url}")
+
+        try:
+            context = await self._open_context(
+                profile_name, warm_up_id, {"storage_state": None}
+            )
+        finally:
+            self.resource_policies.pop(warm_up_id, None)
+
+        try:
+            page = await context.new_page()
+            if not await safe_goto(
+                page, url, wait_until="load", profile_name=profile_name
+            ):
+                raise RuntimeError(f"Resposta HTTP de erro em {url}")
+            if setup:
+                await setup(page)
+
+            self.storage_states.save(profile_name, await context.storage_state())
+            self._warm_up_backoff.pop(profile_name, None)
+            return True
+
+        except Exception as e:
+            _, delay = self._warm_up_backoff.get(profile_name, (0.0, 0.0))
+            delay = min(delay * 2, WARM_UP_MAX_RETRY_DELAY) or WARM_UP_RETRY_DELAY
+            self._warm_up_backoff[profile_name] = (time.monotonic() + delay, delay)
+            logger.warning(
+                f"Erro ao aquecer perfil '{profile_name}': {str(e)} "
+                f"- warm start suspenso por {delay:.0f}s"
+            )
+            return False
+
+        finally:
+            await self._close_browser_context(context, warm_up_id)
+
+    async def save_storage_state(self, context_id: str = "default") -> bool:
+        """
+        Salva o storage state atual do contexto como estado do seu perfil.
+
+        Contextos criados com storage_state explícito não são persistidos.
+
+        Returns:
+            bool: True se o storage state foi salvo
+        """
+        context = self.contexts.get(context_id)
+        spec = self.context_specs.get(context_id)
+        if context is None or spec is None or "storage_state" in spec["kwargs"]:
+            return False
+
+        try:
+            state = await context.storage_state()
+            self.storage_states.save(spec["profile_name"], state)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Erro ao salvar storage state de '{context_id}': {str(e)}")
+            return False
+
+    def _recycle_reason(self, context_id: str) -> Optional[str]:
+        """
+        Verifica se o contexto ultrapassou algum limite de reciclagem.
+
+        Returns:
+            str: Motivo da reciclagem ou None se o contexto está dentro dos limites
+        """
+        spec = self.context_specs.get(context_id)
+        if spec is None:
+            return None
+
+        # O HAR é escrito no fechamento; reciclar sobrescreveria a gravação
+        if spec["kwargs"].get("har_mode"):
+            return None
+
+        policy = self.recycle_policy
+        age = time.monotonic() - spec["created_at"]
+
+        if policy["max_pages"] and spec["pages_served"] >= policy["max_pages"]:
+            return f"{spec['pages_served']} páginas servidas"
+        if policy["max_age"] and age >= policy["max_age"]:
+            return f"idade de {age:.0f}s"
+
+        if policy["max_rss_mb"] and age >= (policy["min_age"] or 0):
+            now = time.monotonic()
+            if now - self._last_rss_check >= RSS_CHECK_INTERVAL:
+                self._last_rss_check = now
+                self._last_rss_bytes = self._browser_rss_bytes()
+
+            rss_mb = (self._last_rss_bytes or 0) / (1024 * 1024)
+            if rss_mb >= policy["max_rss_mb"]:
+                # Após reciclar, forçar nova leitura antes de decidir de novo
+                self._last_rss_bytes = None
+                return f"RSS do browser em {rss_mb:.0f}MB"
+
+        return None
+
+    def _browser_rss_bytes(self) -> Optional[int]:
+        """
+        RSS dos processos do browser: descendentes deste processo no
+        lançamento local, árvore do PID registrado no browser server.
+
+        Returns:
+            int: RSS em bytes ou None se não dá para medir (browser remoto)
+        """
+        if not self.is_remote_browser:
+            return _process_tree_rss_bytes()
+
+        if self._server_pid is not None:
+            rss = _process_tree_rss_bytes(self._server_pid, include_root=True)
+            if rss:
+                return rss
+
+        if not self._rss_unavailable_logged:
+            self._rss_unavailable_logged = True
+            logger.info(
+                "RSS do browser remoto indisponível; "
+                "reciclagem por memória desativada"
+            )
+        return None
+
+    async def _maybe_recycle(self, context_id: str) -> None:
+        """Recicla o contexto se algum limite foi ultrapassado."""
+        if self._recycle_reason(context_id) is None:
+            return
+
+        lock = self._recycle_locks.setdefault(context_id, asyncio.Lock())
+        async with lock:
+            # Outro coroutine pode ter reciclado enquanto aguardávamos
+            reason = self._recycle_reason(context_id)
+            if reason is not None:
+                await self.recycle_context(context_id, reason)
+
+    async def recycle_context(
+        self, context_id: str, reason: str = "manual", fresh_identity: bool = False
+    ) -> None:
+        """
+        Substitui o contexto por um novo com o mesmo perfil e storage state.
+
+        Páginas emprestadas do contexto antigo (acquire_page ou get_page)
+        continuam funcionando; ele só é fechado quando a última delas for
+        devolvida ou fechada.
+
+        Args:
+            context_id: ID do contexto a reciclar
+            reason: Motivo (para logging)
+            fresh_identity: Descartar cookies/storage state (contexto bloqueado);
+                o storage state salvo do perfil também é descartado
+        """
+        old_context = self.contexts.get(context_id)
+        spec = self.context_specs.get(context_id)
+        if old_context is None or spec is None:
+            return
+
+        logger.info(f"Reciclando contexto '{context_id}': {reason}")
+
+        kwargs = dict(spec["kwargs"])
+        proxy = proxy_pool.proxy_for(old_context)
+        if fresh_identity:
+            kwargs.pop("storage_state", None)
+            self.storage_states.discard(spec["profile_name"])
+            # IP bloqueado entra em cool-down; o novo contexto escolhe outro proxy
+            if proxy is not None:
+                proxy_pool.report_block(proxy)
+                proxy = None
+        else:
+            try:
+                storage_state = await old_context.storage_state()
+                if "storage_state" not in spec["kwargs"]:
+                    self.storage_states.save(spec["profile_name"], storage_state)
+                kwargs["storage_state"] = storage_state
+            except Exception as e:
+                logger.warning(f"Erro ao ler storage state de '{context_id}': {str(e)}")
+
+        new_context = await self._open_context(
+            spec["profile_name"], context_id, kwargs, proxy=proxy
+        )
+
+        # Trocar referências antes de aposentar o pool antigo
+        self.contexts[context_id] = new_context
+        spec["created_at"] = time.monotonic()
+        spec["pages_served"] = 0
+        self.recycle_count += 1
+
+        old_pool = self.page_pools.pop(context_id, None)
+        if old_pool is not None:
+            await old_pool.close()
+            self._retired_pools.append(old_pool)
+
+        self._retired_contexts[old_context] = context_id
+        await self._close_retired_if_idle(old_context)
+        if old_context in self._retired_contexts:
+            pending = len(self._unpooled_pages.get(old_context, ()))
+            pending += old_pool.in_use if old_pool is not None else 0
+            logger.debug(
+                f"Contexto antigo '{context_id}' aguardando {pending} páginas"
+            )
+
+    async def _on_page_blocked(self, page: Page, verdict: BlockVerdict) -> None:
+        """
+        Listener do block_detector: recria o contexto da página com
+        identidade limpa (uma vez, mesmo com várias páginas bloqueadas).
+        """
+        context = page.context
+        context_id = next(
+            (cid for cid, ctx in self.contexts.items() if ctx is context), None
+        )
+        if context_id is None:
+            return
+
+        # Replay de HAR não acessa a rede: trocar identidade não muda nada
+        if self.context_specs[context_id]["kwargs"].get("har_mode"):
+            return
+
+        lock = self._recycle_locks.setdefault(context_id, asyncio.Lock())
+        async with lock:
+            # Outra página do mesmo contexto já provocou a rotação
+            if self.contexts.get(context_id) is not context:
+                return
+            self.block_rotations += 1
+            await self.recycle_context(
+                context_id, f"bloqueio ({verdict.reason})", fresh_identity=True
+            )
+
+    async def _close_retired_if_idle(self, context: BrowserContext) -> None:
+        """Fecha o contexto reciclado se nenhuma página dele segue em uso."""
+        context_id = self._retired_contexts.get(context)
+        if context_id is None or self._unpooled_pages.get(context):
+            return
+        if any(p.context is context and p.in_use for p in self._retired_pools):
+            return
+
+        del self._retired_contexts[context]
+        self._retired_pools = [
+            pool for pool in self._retired_pools if pool.context is not context
+        ]
+        await self._close_browser_context(context, context_id)
+
+    def _on_unpooled_page_closed(self, context: BrowserContext, page: Page) -> None:
+        """Listener de fechamento das páginas de get_page()."""
+        pages = self._unpooled_pages.get(context)
+        if pages is None:
+            return
+
+        pages.discard(page)
+        if not pages:
+            del self._unpooled_pages[context]
+            if context in self._retired_contexts:
+                asyncio.get_running_loop().create_task(
+                    self._close_retired_if_idle(context)
+                )
+
+    async def _close_browser_context(
+        self, context: BrowserContext, context_id: str
+    ) -> None:
+        proxy_pool.release(context)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Erro ao fechar contexto antigo '{context_id}': {str(e)}")
+
+    def get_resource_statistics(self, context_id: str = "default") -> Dict:
+        """
+        Retorna contadores de requests/bytes permitidos e bloqueados do contexto.
+        """
+        policy = self.resource_policies.get(context_id)
+        return policy.get_statistics() if policy else {}
+
     async def close_context(self, context_id: str) -> None:
         """
         Fecha um contexto específico e libera recursos.
         """
+        # Manter o storage state do perfil atualizado para o próximo warm start
+        await self.save_storage_state(context_id)
+
+        pool = self.page_pools.pop(context_id, None)
+        if pool:
+            await pool.close()
+        self.resource_policies.pop(context_id, None)
+        self.context_specs.pop(context_id, None)
+
         if context_id in self.contexts:
+            proxy_pool.release(self.contexts[context_id])
             try:
                 await self.contexts[context_id].close()
                 del self.contexts[context_id]
@@ -211,17 +1228,223 @@ class BrowserManager:
             except Exception as e:
                 logger.error(f"Erro ao fechar contexto '{context_id}': {str(e)}")
 
+    @property
+    def is_browser_ready(self) -> bool:
+        """Indica se o browser está conectado e disponível."""
+        return self._browser_ready is not None and self._browser_ready.is_set()
+
+    async def _wait_browser_ready(self) -> None:
+        """
+        Aguarda o relançamento do browser se ele caiu.
+
+        Raises:
+            BrowserCrashedError: Se o browser não voltar a tempo
+        """
+        if not self.is_initialized or self.is_browser_ready:
+            return
+
+        if self._watchdog_task is None:
+            raise BrowserCrashedError("Browser desconectado e watchdog inativo")
+
+        try:
+            await asyncio.wait_for(self._browser_ready.wait(), RESPAWN_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise BrowserCrashedError(
+                f"Browser não foi relançado em {RESPAWN_WAIT_TIMEOUT}s"
+            )
+
+    def _on_browser_disconnected(self, browser: Browser) -> None:
+        """Listener de desconexão: agenda relançamento se o watchdog está ativo."""
+        if self._closing or browser is not self.browser:
+            return
+
+        self.crash_count += 1
+        self._browser_ready.clear()
+        logger.error("Browser desconectado inesperadamente")
+
+        if self._watchdog_task is not None and (
+            self._respawn_task is None or self._respawn_task.done()
+        ):
+            self._respawn_task = asyncio.get_running_loop().create_task(
+                self._respawn_until_ready()
+            )
+
+    def start_watchdog(self, interval: float = WATCHDOG_INTERVAL) -> None:
+        """
+        Inicia a supervisão em background do browser.
+
+        Args:
+            interval: Intervalo entre probes (segundos)
+        """
+        if self._watchdog_task is not None and not self._watchdog_task.done():
+            logger.warning("Watchdog já está ativo")
+            return
+
+        self._watchdog_task = asyncio.get_running_loop().create_task(
+            self._watchdog_loop(interval)
+        )
+        logger.info(f"Watchdog do browser iniciado (intervalo {interval}s)")
+
+    async def stop_watchdog(self) -> None:
+        """Para a supervisão em background."""
+        task, self._watchdog_task = self._watchdog_task, None
+        if task is None:
+            return
+
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.debug("Watchdog do browser parado")
+
+    async def _watchdog_loop(self, interval: float) -> None:
+        failures = 0
+        while True:
+            await asyncio.sleep(interval)
+
+            if not self.is_initialized or not self.is_browser_ready:
+                continue
+
+            if await self._probe():
+                failures = 0
+                continue
+
+            failures += 1
+            logger.warning(
+                f"Probe do browser falhou ({failures}/{WATCHDOG_MAX_FAILURES})"
+            )
+            if failures >= WATCHDOG_MAX_FAILURES:
+                failures = 0
+                self.crash_count += 1
+                self._browser_ready.clear()
+                await self._respawn_until_ready()
+
+    async def _respawn_until_ready(self) -> None:
+        """
+        Relança o browser até ele voltar (ou até o cleanup), com backoff.
+
+        Uma falha no relançamento é logada e repetida, em vez de derrubar a
+        task do watchdog e deixar o browser indisponível para sempre.
+        """
+        delay = RESPAWN_RETRY_DELAY
+        while self.is_initialized and not self._closing and not self.is_browser_ready:
+            try:
+                await self._respawn()
+            except Exception as e:
+                logger.error(
+                    f"Relançamento do browser falhou: {str(e)} "
+                    f"- nova tentativa em {delay:.0f}s"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RESPAWN_MAX_RETRY_DELAY)
+
+    async def _probe(self) -> bool:
+        """
+        Probe barato: conexão ativa e um round trip em um contexto existente.
+        """
+        if not self.browser or not self.browser.is_connected():
+            return False
+
+        context = next(iter(self.contexts.values()), None)
+        if context is None:
+            return True
+
+        try:
+            await asyncio.wait_for(context.cookies(), WATCHDOG_PROBE_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.debug(f"Probe do browser falhou: {str(e)}")
+            return False
+
+    async def _respawn(self) -> None:
+        """
+        Relança o browser e recria os contextos registrados.
+
+        Páginas emprestadas do browser antigo são descartadas ao serem devolvidas.
+        """
+        async with self._respawn_lock:
+            if self.is_browser_ready or self._closing:
+                return
+
+            logger.warning("Relançando browser e recriando contextos")
+
+            # Pools antigos são aposentados; suas páginas morreram com o browser
+            for context_id, context in self.contexts.items():
+                self._retired_contexts[context] = context_id
+            for pool in self.page_pools.values():
+                await pool.close()
+                self._retired_pools.append(pool)
+            self.page_pools = {}
+            self.contexts = {}
+
+            old_browser = self.browser
+            try:
+                await old_browser.close()
+            except Exception:
+                pass
+
+            try:
+                await self._launch_browser()
+            except Exception as e:
+                # Driver do Playwright pode ter morrido junto - reiniciar tudo
+                logger.warning(f"Relançamento falhou, reiniciando Playwright: {str(e)}")
+                try:
+                    await self.playwright.stop()
+                except Exception:
+                    pass
+                self.playwright = await async_playwright().start()
+                await self._launch_browser()
+
+            # Todo contexto aposentado era do browser antigo: liberar agora os
+            # ociosos (e seus proxies) antes de escolher proxies para os novos.
+            # Páginas fora do pool morreram junto; as emprestadas do pool
+            # fecham o contexto ao serem devolvidas
+            for context in list(self._retired_contexts):
+                self._unpooled_pages.pop(context, None)
+                await self._close_retired_if_idle(context)
+
+            # Cópia: create_context pode registrar specs durante os awaits
+            for context_id, spec in list(self.context_specs.items()):
+                self.contexts[context_id] = await self._open_context(
+                    spec["profile_name"], context_id, dict(spec["kwargs"])
+                )
+                spec["created_at"] = time.monotonic()
+                spec["pages_served"] = 0
+
+            # Só agora: quem aguardava encontra todos os contextos recriados
+            self._browser_ready.set()
+            logger.info(f"Browser relançado com {len(self.contexts)} contextos")
+
     async def cleanup(self) -> None:
         """
         Cleanup completo - fecha todos os recursos.
         """
         logger.info("Iniciando cleanup do BrowserManager")
+        self._closing = True
+        block_detector.remove_listener(self._on_page_blocked)
+        await self.stop_watchdog()
+
+        respawn_task, self._respawn_task = self._respawn_task, None
+        if respawn_task is not None and not respawn_task.done():
+            respawn_task.cancel()
+            try:
+                await respawn_task
+            except asyncio.CancelledError:
+                pass
 
         # Fechar todos os contextos
         for context_id in list(self.contexts.keys()):
             await self.close_context(context_id)
 
-        # Fechar browser
+        # Fechar contextos reciclados que ainda tinham páginas emprestadas
+        for context, context_id in list(self._retired_contexts.items()):
+            await self._close_browser_context(context, context_id)
+        self._retired_contexts = {}
+        self._retired_pools = []
+        self._unpooled_pages = {}
+
+        # Fechar browser (em um browser server apenas desconecta)
         if self.browser:
             try:
                 await self.browser.close()
@@ -241,7 +1464,11 @@ class BrowserManager:
         self.playwright = None
         self.browser = None
         self.contexts = {}
+        self.page_pools = {}
+        self.resource_policies = {}
         self.is_initialized = False
+        self._browser_ready = None
+        self._closing = False
 
         logger.info("Cleanup concluído")
 
@@ -249,25 +1476,16 @@ class BrowserManager:
         """
         Verifica se o browser está funcionando corretamente.
 
+        Usa o mesmo probe barato do watchdog (sem criar contexto novo).
+
         Returns:
             bool: True se saudável, False caso contrário
         """
         try:
-            if not self.is_initialized:
+            if not self.is_initialized or not self.is_browser_ready:
                 return False
 
-            # Criar contexto temporário para teste
-            test_context = await self.browser.new_context()
-            test_page = await test_context.new_page()
-
-            # Teste básico - navegar para página simples
-            await test_page.goto("data:text/html,<html><body>OK</body></html>")
-            content = await test_page.content()
-
-            # Cleanup do teste
-            await test_context.close()
-
-            return "OK" in content
+            return await self._probe()
 
         except Exception as e:
             logger.error(f"Health check falhou: {str(e)}")
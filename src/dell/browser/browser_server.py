@@ -0,0 +1,198 @@
+"""
+Browser server - Chromium persistente reutilizado entre execuções da CLI.
+
+O Playwright para Python não expõe launch_server(); o servidor é um Chromium
+lançado com --remote-debugging-port, e o BrowserManager conecta via CDP.
+Também aceita endpoints ws:// de um 'playwright run-server' externo.
+
+Uso:
+    python -m dell.browser.browser_server start
+    python -m dell.browser.browser_server status
+    python -m dell.browser.browser_server stop
+"""
+
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dell.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Porta padrão do DevTools Protocol
+DEFAULT_SERVER_PORT = 9222
+
+# Arquivo com endpoint/pid do servidor em execução
+DEFAULT_SERVER_FILE = ".browser_state/browser_server.json"
+
+# Tempo máximo para o servidor responder após o lançamento (segundos)
+SERVER_START_TIMEOUT = 15.0
+
+SERVER_ARGS = [
+    "--headless=new",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+]
+
+
+def _server_file() -> Path:
+    return Path(settings.get("browser_server_file", DEFAULT_SERVER_FILE))
+
+
+def read_server_info() -> Optional[Dict[str, Any]]:
+    """
+    Lê as informações do servidor registrado.
+
+    Returns:
+        dict: {'endpoint', 'pid', 'port'} ou None se não há servidor registrado
+    """
+    try:
+        with open(_server_file(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def get_server_endpoint() -> Optional[str]:
+    """
+    Endpoint do browser server a usar no initialize().
+
+    Prioridade: setting 'browser_server_endpoint' e depois o arquivo do
+    servidor iniciado por start_browser_server().
+    """
+    endpoint = settings.get("browser_server_endpoint")
+    if endpoint:
+        return endpoint
+
+    info = read_server_info()
+    return info["endpoint"] if info else None
+
+
+def is_server_alive(endpoint: str, timeout: float = 1.0) -> bool:
+    """Verifica se o endpoint CDP responde."""
+    if endpoint.startswith("ws"):
+        return True  # run-server não expõe /json/version; o connect() valida
+
+    try:
+        with urllib.request.urlopen(f"{endpoint}/json/version", timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def _chromium_executable() -> str:
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright:
+        return playwright.chromium.executable_path
+
+
+def start_browser_server(port: int = DEFAULT_SERVER_PORT) -> str:
+    """
+    Lança um Chromium desanexado com DevTools remoto e registra o endpoint.
+
+    Args:
+        port: Porta do DevTools Protocol
+
+    Returns:
+        str: Endpoint HTTP do servidor (para connect_over_cdp)
+
+    Raises:
+        RuntimeError: Se o servidor não responder a tempo
+    """
+    info = read_server_info()
+    if info and is_server_alive(info["endpoint"]):
+        logger.info(f"Browser server já em execução: {info['endpoint']}")
+        return info["endpoint"]
+
+    endpoint = f"http://127.0.0.1:{port}"
+    user_data_dir = tempfile.mkdtemp(prefix="dell-browser-server-")
+    command = [
+        _chromium_executable(),
+        f"--remote-debugging-port={port}",
+        f"--user-data-dir={user_data_dir}",
+        *SERVER_ARGS,
+    ]
+
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,  # Sobrevive ao fim da CLI que o iniciou
+    )
+
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while not is_server_alive(endpoint):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            raise RuntimeError(f"Browser server não respondeu em {endpoint}")
+        time.sleep(0.1)
+
+    path = _server_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"endpoint": endpoint, "pid": process.pid, "port": port}, f)
+
+    logger.info(f"Browser server iniciado em {endpoint} (pid {process.pid})")
+    return endpoint
+
+
+def stop_browser_server() -> bool:
+    """
+    Encerra o servidor registrado e remove o arquivo de endpoint.
+
+    Returns:
+        bool: True se havia servidor registrado
+    """
+    info = read_server_info()
+    if not info:
+        return False
+
+    try:
+        os.kill(info["pid"], signal.SIGTERM)
+    except OSError:
+        pass
+
+    _server_file().unlink(missing_ok=True)
+    logger.info(f"Browser server encerrado (pid {info['pid']})")
+    return True
+
+
+def main(argv: Optional[list] = None) -> int:
+    """CLI: start | stop | status."""
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "status"
+
+    if command == "start":
+        port = int(argv[1]) if len(argv) > 1 else DEFAULT_SERVER_PORT
+        print(start_browser_server(port))
+    elif command == "stop":
+        print("encerrado" if stop_browser_server() else "nenhum servidor registrado")
+    elif command == "status":
+        info = read_server_info()
+        alive = bool(info) and is_server_alive(info["endpoint"])
+        print(
+            f"{info['endpoint']} ({'ativo' if alive else 'inativo'})"
+            if info
+            else "nenhum servidor registrado"
+        )
+    else:
+        print("Uso: python -m dell.browser.browser_server [start [porta]|stop|status]")
+        return 2
+
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""
+Exceções do módulo browser.
+
+Módulo folha (sem dependências): resilience classifica erros com
+isinstance sem importar utils/browser_manager.
+"""
+
+
+class PageWaitTimeout(Exception):
+    """
+    Exceção customizada para timeouts de espera.
+
+    'category' guarda a classificação do erro original (classify_error), para
+    que um retry externo não trate uma falha fatal como timeout repetível.
+    """
+
+    def __init__(self, message: str = "", category: str = "timeout"):
+        super().__init__(message)
+        self.category = category
+
+
+class ElementNotFoundError(Exception):
+    """Exceção para elementos não encontrados."""
+
+    pass
+
+
+class BrowserCrashedError(Exception):
+    """
+    Exceção para operações interrompidas por queda do browser.
+    A operação pode ser repetida após o browser ser relançado.
+    """
+
+    pass
@@ -0,0 +1,291 @@
+"""
+HttpFetcher - Camada de fetch sem browser com fallback para Playwright.
+
+Muitas URLs de categoria/sitemap da Dell são renderizadas no servidor e não
+precisam de Chromium. O fetch usa o APIRequestContext do Playwright
+(HTTP keep-alive, sem browser) com os headers/UA/locale do perfil; páginas
+que falham na verificação de conteúdo são escaladas para uma página real.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import APIRequestContext, Playwright, async_playwright
+
+from .block_detection import block_detector
+from .pace_manager import pace_manager
+from .profiles.browser_profiles import get_profile
+from .proxy_pool import PROXY_FAILURE_STATUSES, Proxy, proxy_pool
+from .rate_limiter import rate_limiter
+from .response_capture import UrlPattern, compile_url_pattern
+from .utils import safe_goto
+
+logger = logging.getLogger(__name__)
+
+# Tamanho mínimo de HTML para considerar a resposta HTTP utilizável
+MIN_CONTENT_LENGTH = 2048
+
+# Chaves do perfil repassadas ao cliente HTTP
+HTTP_PROFILE_KEYS = ("user_agent", "extra_http_headers", "ignore_https_errors")
+
+# Verificação de conteúdo: recebe o HTML e diz se ele serve sem browser
+ContentCheck = Callable[[str], bool]
+
+
+def default_content_check(content: str) -> bool:
+    """HTML completo o bastante para extração (não é só um shell de JS)."""
+    return len(content) >= MIN_CONTENT_LENGTH and "<body" in content.lower()
+
+
+@dataclass
+class FetchResult:
+    """Resultado de um fetch, indicando qual camada atendeu."""
+
+    url: str
+    tier: str  # "http" ou "browser"
+    status: Optional[int]
+    content: str
+    elapsed: float
+    escalated: bool = False
+
+
+class HttpFetcher:
+    """
+    Fetch HTTP com escalonamento automático para o browser.
+
+    Uso:
+    >>> async with HttpFetcher(browser_manager) as fetcher:
+    >>>     result = await fetcher.fetch("https://www.dell.com/pt-br/shop/...")
+    >>>     print(result.tier, len(result.content))
+    """
+
+    def __init__(
+        self,
+        manager: Any = None,
+        profile_name: str = "production",
+        context_id: str = "fetcher",
+        content_check: ContentCheck = default_content_check,
+        url_patterns: Optional[Dict[str, UrlPattern]] = None,
+        timeout: float = 30000,
+    ):
+        """
+        Args:
+            manager: BrowserManager usado no fallback (padrão: singleton global)
+            profile_name: Perfil de onde vêm headers/UA/locale
+            context_id: Contexto usado nas páginas de fallback
+            content_check: Função que valida o HTML obtido via HTTP
+            url_patterns: Nome → padrão de URL para agrupar estatísticas
+            timeout: Timeout das requisições em ms
+        """
+        if manager is None:
+            from .browser_manager import browser_manager as manager
+
+        self.manager = manager
+        self.profile_name = profile_name
+        self.context_id = context_id
+        self.content_check = content_check
+        self.timeout = timeout
+        self._matchers = {
+            name: compile_url_pattern(pattern)
+            for name, pattern in (url_patterns or {}).items()
+        }
+
+        self._request: Optional[APIRequestContext] = None
+        # Driver próprio quando o manager ainda não tem browser
+        self._playwright: Optional[Playwright] = None
+        self.proxy: Optional[Proxy] = None
+        self.stats: Dict[str, Dict[str, Any]] = {}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Cria o cliente HTTP com a identidade do perfil.
+
+        Só o driver do Playwright é iniciado: o browser do manager é lançado
+        na primeira URL escalada.
+        """
+        if self._request is not None:
+            return
+
+        if self.manager.is_initialized:
+            playwright = self.manager.playwright
+        else:
+            self._playwright = await async_playwright().start()
+            playwright = self._playwright
+
+        profile = get_profile(self.profile_name)
+        options = {key: profile[key] for key in HTTP_PROFILE_KEYS if key in profile}
+
+        # Sem browser não há 'locale'; vira Accept-Language se o perfil não o define
+        headers = dict(options.get("extra_http_headers", {}))
+        if profile.get("locale"):
+            headers.setdefault("Accept-Language", profile["locale"])
+        options["extra_http_headers"] = headers
+
+        # Cookies do warm start, se houver, para parecer a mesma sessão
+        storage_state = self.manager.storage_states.load(self.profile_name)
+        if storage_state:
+            options["storage_state"] = storage_state
+
+        # Mesmo pool de proxies dos contextos do browser
+        self.proxy = proxy_pool.choose() if proxy_pool.enabled else None
+        if self.proxy is not None:
+            options["proxy"] = self.proxy.as_playwright()
+
+        self._request = await playwright.request.new_context(
+            timeout=self.timeout, **options
+        )
+        logger.debug(f"HttpFetcher iniciado com perfil '{self.profile_name}'")
+
+    async def close(self) -> None:
+        """Fecha o cliente HTTP (e o driver próprio, se houver)."""
+        if self._request is not None:
+            await self._request.dispose()
+            self._request = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def fetch(
+        self, url: str, content_check: Optional[ContentCheck] = None
+    ) -> FetchResult:
+        """
+        Busca a URL via HTTP; escala para o browser se o conteúdo não servir.
+
+        Só escala quando o content_check falha ou a página é um desafio
+        anti-bot; status de erro (4xx/5xx) é retornado pela camada HTTP.
+
+        Args:
+            url: URL de destino
+            content_check: Verificação específica desta chamada
+
+        Returns:
+            FetchResult: Conteúdo e camada que atendeu
+        """
+        await self.start()
+        check = content_check or self.content_check
+        stats = self._stats_for(url)
+
+        if self.proxy is not None:
+            await proxy_pool.acquire(self.proxy)
+        else:
+            await rate_limiter.acquire(url)
+
+        started = time.perf_counter()
+        status = None
+        try:
+            response = await self._request.get(url)
+            try:
+                status = response.status
+                content = await response.text()
+            finally:
+                # Libera o corpo guardado pelo driver
+                await response.dispose()
+            elapsed = time.perf_counter() - started
+            if self.proxy is not None:
+                proxy_pool.record(
+                    self.proxy,
+                    ok=status not in PROXY_FAILURE_STATUSES,
+                    latency=elapsed,
+                )
+
+            # Status de erro volta como está: o browser receberia o mesmo, e
+            # 429/503 chegam ao pace adaptativo em vez de virar mais tráfego
+            if not response.ok:
+                pace_manager.report_response(status, elapsed)
+                stats["http"] += 1
+                stats["http_seconds"] += elapsed
+                return FetchResult(url, "http", status, content, elapsed)
+
+            # Desafio anti-bot servido com 200 vai para o browser e conta como
+            # 429 no pace, como no safe_goto (tamanho é do content_check)
+            if block_detector.check_html(url, content, check_empty_body=False).blocked:
+                pace_manager.report_response(429, elapsed)
+            else:
+                pace_manager.report_response(status, elapsed)
+                if check(content):
+                    stats["http"] += 1
+                    stats["http_seconds"] += elapsed
+                    return FetchResult(url, "http", status, content, elapsed)
+
+            logger.debug(f"Fetch HTTP insuficiente para {url} (status {status})")
+
+        except Exception as e:
+            logger.debug(f"Fetch HTTP falhou para {url}: {str(e)}")
+            if status is None:
+                pace_manager.report_response(None, time.perf_counter() - started)
+                if self.proxy is not None:
+                    proxy_pool.record(self.proxy, ok=False)
+
+        # Escalonamento para página real do Playwright
+        stats["escalations"] += 1
+        http_elapsed = time.perf_counter() - started
+        result = await self._fetch_with_browser(url, status)
+        result.elapsed += http_elapsed
+
+        stats["browser"] += 1
+        stats["browser_seconds"] += result.elapsed
+        return result
+
+    async def _fetch_with_browser(
+        self, url: str, http_status: Optional[int]
+    ) -> FetchResult:
+        # page() inicializa o manager (lança o browser) na primeira escalada
+        started = time.perf_counter()
+        async with self.manager.page(self.context_id, self.profile_name) as page:
+            await safe_goto(page, url, profile_name=self.profile_name)
+            content = await page.content()
+
+        return FetchResult(
+            url,
+            "browser",
+            http_status,
+            content,
+            time.perf_counter() - started,
+            escalated=True,
+        )
+
+    def _pattern_for(self, url: str) -> str:
+        """Nome do padrão da URL (ou host + primeiro segmento do path)."""
+        for name, matches in self._matchers.items():
+            if matches(url):
+                return name
+
+        parts = urlsplit(url)
+        first_segment = parts.path.strip("/").split("/")[0]
+        return f"{parts.hostname}/{first_segment}"
+
+    def _stats_for(self, url: str) -> Dict[str, Any]:
+        return self.stats.setdefault(
+            self._pattern_for(url),
+            {
+                "http": 0,
+                "browser": 0,
+                "escalations": 0,
+                "http_seconds": 0.0,
+                "browser_seconds": 0.0,
+            },
+        )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Retorna contagem por camada e por padrão de URL."""
+        http = sum(s["http"] for s in self.stats.values())
+        browser = sum(s["browser"] for s in self.stats.values())
+        total = http + browser
+
+        return {
+            "total": total,
+            "http": http,
+            "browser": browser,
+            "http_ratio": http / total if total else 0.0,
+            "by_pattern": {name: dict(s) for name, s in self.stats.items()},
+        }
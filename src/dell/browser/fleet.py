@@ -0,0 +1,398 @@
+"""
+BrowserFleet - Frota de processos, cada um com seu próprio BrowserManager.
+Distribui URLs/categorias entre núcleos de CPU e devolve resultados por fila.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import time
+import zlib
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+logger = logging.getLogger(__name__)
+
+# Intervalo para checar se os workers continuam vivos enquanto aguarda resultados
+RESULT_POLL_INTERVAL = 1.0
+
+# Tipo do handler executado nos workers: handler(browser_manager, item) -> resultado
+FleetHandler = Callable[[Any, Any], Awaitable[Any]]
+
+
+@dataclass
+class FleetResult:
+    """Resultado de um item processado pela frota."""
+
+    item: Any
+    worker_id: int
+    ok: bool
+    value: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
+async def _worker_loop(
+    worker_id: int,
+    handler: FleetHandler,
+    task_queue: Any,
+    result_queue: Any,
+    options: Dict[str, Any],
+) -> None:
+    """Loop assíncrono de um worker: consome itens e publica resultados."""
+    # Import tardio: cada processo cria seu próprio BrowserManager
+    from dell.browser.browser_manager import BrowserManager
+
+    loop = asyncio.get_running_loop()
+    concurrency = options["concurrency"]
+    stats: Dict[str, Any] = {}
+
+    async def consume() -> None:
+        while True:
+            message = await loop.run_in_executor(None, task_queue.get)
+            if message is None:
+                # Repassar sentinela para os demais consumidores do mesmo worker
+                task_queue.put(None)
+                return
+
+            item_id, item = message
+            result_queue.put(("started", worker_id, item_id))
+            started = time.perf_counter()
+            try:
+                value = await handler(bm, item)
+                ok, error = True, None
+            except Exception as e:
+                value, ok, error = None, False, f"{type(e).__name__}: {str(e)}"
+
+            elapsed = time.perf_counter() - started
+            result_queue.put(("result", worker_id, item_id, ok, value, error, elapsed))
+
+    bm = BrowserManager(page_pool_size=concurrency)
+    started_at = time.perf_counter()
+    try:
+        await bm.initialize(options["browser_type"])
+        await bm.create_context(options["profile_name"], options["context_id"])
+        await asyncio.gather(*(consume() for _ in range(concurrency)))
+    finally:
+        pool = bm.page_pools.get(options["context_id"])
+        stats["pool"] = pool.get_statistics() if pool else {}
+        stats["wall_seconds"] = time.perf_counter() - started_at
+        stats["pid"] = os.getpid()
+        await bm.cleanup()
+        result_queue.put(("stats", worker_id, stats))
+
+
+def _worker_main(
+    worker_id: int,
+    handler: FleetHandler,
+    task_queue: Any,
+    result_queue: Any,
+    options: Dict[str, Any],
+) -> None:
+    """Ponto de entrada do processo worker."""
+    try:
+        asyncio.run(_worker_loop(worker_id, handler, task_queue, result_queue, options))
+    except Exception as e:
+        logger.error(f"Worker {worker_id} finalizado com erro: {str(e)}")
+        result_queue.put(("crashed", worker_id, f"{type(e).__name__}: {str(e)}"))
+
+
+class BrowserFleet:
+    """
+    Frota de N processos, cada um com Playwright, browser e pool de páginas próprios.
+
+    O handler precisa ser uma função assíncrona de nível de módulo (picklable),
+    com assinatura handler(browser_manager, item).
+
+    Uso:
+    >>> with BrowserFleet(scrape_product, workers=8) as fleet:
+    >>>     for result in fleet.map(urls):
+    >>>         print(result.item, result.value)
+    """
+
+    def __init__(
+        self,
+        handler: FleetHandler,
+        workers: Optional[int] = None,
+        concurrency_per_worker: int = 4,
+        profile_name: str = "production",
+        browser_type: str = "chromium",
+        shard_key: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Args:
+            handler: Função async executada para cada item nos workers
+            workers: Número de processos (padrão: número de CPUs)
+            concurrency_per_worker: Itens simultâneos por processo
+            profile_name: Perfil de browser usado pelos workers
+            browser_type: Tipo do browser ('chromium', 'firefox', 'webkit')
+            shard_key: Função item -> chave; itens com a mesma chave vão sempre
+                para o mesmo worker (ex.: categoria), enquanto ele estiver
+                vivo. Sem ela, os workers consomem de uma fila compartilhada.
+        """
+        self.handler = handler
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_key = shard_key
+        self.options = {
+            "concurrency": concurrency_per_worker,
+            "profile_name": profile_name,
+            "browser_type": browser_type,
+            "context_id": "fleet",
+        }
+
+        self._mp = multiprocessing.get_context("spawn")
+        self._processes: List[Any] = []
+        self._task_queues: List[Any] = []
+        self._result_queue: Any = None
+        self._pending: Dict[int, Any] = {}
+        self._assigned: Dict[int, int] = {}
+        self._in_flight: Dict[int, Set[int]] = {}
+        self._dead_workers: Set[int] = set()
+        self._next_id = 0
+        self._started = False
+        self._stopped = False
+        self.worker_stats: Dict[int, Dict[str, Any]] = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> None:
+        """Inicia os processos worker."""
+        if self._started:
+            logger.warning("BrowserFleet já está iniciada")
+            return
+
+        self._result_queue = self._mp.Queue()
+        if self.shard_key is None:
+            shared_queue = self._mp.Queue()
+            self._task_queues = [shared_queue] * self.workers
+        else:
+            self._task_queues = [self._mp.Queue() for _ in range(self.workers)]
+
+        for worker_id in range(self.workers):
+            process = self._mp.Process(
+                target=_worker_main,
+                args=(
+                    worker_id,
+                    self.handler,
+                    self._task_queues[worker_id],
+                    self._result_queue,
+                    self.options,
+                ),
+                name=f"dell-fleet-{worker_id}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+            self._in_flight[worker_id] = set()
+            self.worker_stats[worker_id] = {
+                "processed": 0,
+                "failed": 0,
+                "busy_seconds": 0.0,
+                "alive": True,
+            }
+
+        self._started = True
+        logger.info(f"BrowserFleet iniciada com {self.workers} workers")
+
+    def submit(self, item: Any) -> None:
+        """Envia um item para processamento."""
+        if not self._started:
+            self.start()
+
+        item_id = self._next_id
+        self._next_id += 1
+        self._pending[item_id] = item
+
+        worker_id = self._worker_for(item)
+        if worker_id is not None:
+            self._assigned[item_id] = worker_id
+        self._task_queues[worker_id or 0].put((item_id, item))
+
+    def submit_many(self, items: Iterable[Any]) -> None:
+        """Envia vários itens para processamento."""
+        for item in items:
+            self.submit(item)
+
+    def results(self) -> Iterator[FleetResult]:
+        """
+        Gera resultados em ordem de conclusão até esvaziar os itens pendentes.
+
+        Raises:
+            RuntimeError: Se todos os workers morrerem com itens pendentes
+        """
+        while self._pending:
+            try:
+                message = self._result_queue.get(timeout=RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                yield from self._check_workers()
+                continue
+
+            result = self._handle_message(message)
+            if result is not None:
+                yield result
+
+    def map(self, items: Iterable[Any]) -> Iterator[FleetResult]:
+        """Envia todos os itens e gera os resultados em ordem de conclusão."""
+        self.submit_many(items)
+        yield from self.results()
+
+    async def map_async(self, items: Iterable[Any]) -> List[FleetResult]:
+        """Versão para uso dentro de um event loop (não bloqueia o loop)."""
+        return await asyncio.to_thread(lambda: list(self.map(items)))
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Encerra os workers e coleta as estatísticas finais."""
+        if not self._started or self._stopped:
+            return
+
+        for task_queue in set(self._task_queues):
+            task_queue.put(None)
+
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+
+        # Drenar mensagens finais (estatísticas dos workers)
+        while True:
+            try:
+                self._handle_message(self._result_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        for worker_id, process in enumerate(self._processes):
+            if process.is_alive():
+                logger.warning(f"Worker {worker_id} não encerrou a tempo, terminando")
+                process.terminate()
+            self.worker_stats[worker_id]["alive"] = False
+
+        self._stopped = True
+        logger.info("BrowserFleet encerrada")
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Retorna estatísticas agregadas e por worker."""
+        processed = sum(s["processed"] for s in self.worker_stats.values())
+        failed = sum(s["failed"] for s in self.worker_stats.values())
+
+        return {
+            "workers": self.workers,
+            "total_processed": processed,
+            "total_failed": failed,
+            "pending": len(self._pending),
+            "by_worker": {wid: dict(s) for wid, s in self.worker_stats.items()},
+        }
+
+    def _worker_for(self, item: Any) -> Optional[int]:
+        """Worker fixo do item quando há shard_key (None = fila compartilhada)."""
+        if self.shard_key is None:
+            return None
+
+        # Hash estável entre processos (hash() de str é aleatorizado)
+        key_hash = zlib.crc32(str(self.shard_key(item)).encode("utf-8"))
+        worker_id = key_hash % self.workers
+        if self._worker_alive(worker_id):
+            return worker_id
+
+        # Fila de worker morto nunca seria consumida: redistribuir a chave
+        # entre os vivos (sem vivos, results() reporta a frota morta)
+        alive = [wid for wid in range(self.workers) if self._worker_alive(wid)]
+        return alive[key_hash % len(alive)] if alive else worker_id
+
+    def _worker_alive(self, worker_id: int) -> bool:
+        """Worker vivo (antes do start todos contam como vivos)."""
+        if worker_id in self._dead_workers:
+            return False
+        if worker_id >= len(self._processes):
+            return True
+        return self._processes[worker_id].is_alive()
+
+    def _handle_message(self, message: tuple) -> Optional[FleetResult]:
+        kind, worker_id = message[0], message[1]
+        stats = self.worker_stats[worker_id]
+
+        if kind == "started":
+            self._in_flight[worker_id].add(message[2])
+        elif kind == "result":
+            _, _, item_id, ok, value, error, elapsed = message
+            self._in_flight[worker_id].discard(item_id)
+            self._assigned.pop(item_id, None)
+            stats["processed"] += 1
+            stats["busy_seconds"] += elapsed
+            if not ok:
+                stats["failed"] += 1
+            item = self._pending.pop(item_id, None)
+            return FleetResult(item, worker_id, ok, value, error, elapsed)
+
+        if kind == "stats":
+            final_stats = message[2]
+            stats["pool"] = final_stats.get("pool", {})
+            stats["wall_seconds"] = final_stats.get("wall_seconds", 0.0)
+            stats["pid"] = final_stats.get("pid")
+        elif kind == "crashed":
+            stats["alive"] = False
+            stats["error"] = message[2]
+            logger.error(f"Worker {worker_id} falhou: {message[2]}")
+
+        return None
+
+    def _check_workers(self) -> List[FleetResult]:
+        """
+        Detecta workers mortos e falha os itens que ficaram presos com eles.
+
+        Returns:
+            list: Resultados de falha para itens perdidos
+        """
+        lost: List[FleetResult] = []
+
+        for worker_id, process in enumerate(self._processes):
+            if process.is_alive() or worker_id in self._dead_workers:
+                continue
+
+            self._dead_workers.add(worker_id)
+            stats = self.worker_stats[worker_id]
+            stats["alive"] = False
+            logger.error(f"Worker {worker_id} morreu (exit code {process.exitcode})")
+
+            # Itens em execução e, com shard_key, os ainda na fila do worker
+            item_ids = set(self._in_flight[worker_id])
+            item_ids.update(
+                item_id
+                for item_id, assigned in self._assigned.items()
+                if assigned == worker_id
+            )
+            for item_id in item_ids:
+                self._in_flight[worker_id].discard(item_id)
+                self._assigned.pop(item_id, None)
+                if item_id in self._pending:
+                    stats["failed"] += 1
+                    lost.append(
+                        FleetResult(
+                            self._pending.pop(item_id),
+                            worker_id,
+                            ok=False,
+                            error=f"Worker {worker_id} morreu durante o processamento",
+                        )
+                    )
+
+        if self._pending and not any(p.is_alive() for p in self._processes):
+            raise RuntimeError(
+                f"Todos os workers da frota morreram com {len(self._pending)} itens pendentes"
+            )
+
+        return lost
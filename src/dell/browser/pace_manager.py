@@ -4,12 +4,33 @@ Substitui sleeps hardcoded por estratégias configuráveis e inteligentes.
 """
 
 import asyncio
+import json
 import logging
+import re
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Modo adaptativo (AIMD): redução aditiva do fator quando as respostas são
+# rápidas e 2xx; aumento multiplicativo em 429/503/timeouts
+ADAPTIVE_STEP = 0.05  # Redução do fator por resposta rápida
+ADAPTIVE_BACKOFF = 2.0  # Multiplicador do fator em bloqueio/timeout
+ADAPTIVE_FAST_LATENCY = 3.0  # Latência (s) abaixo da qual a resposta é "rápida"
+ADAPTIVE_EWMA_ALPHA = 0.2  # Peso da última latência na média móvel
+
+# Status HTTP que indicam bloqueio ou sobrecarga do servidor
+BACKOFF_STATUSES = frozenset({429, 503})
+
+# Limites superiores (s) das faixas do histograma de sleeps
+SLEEP_HISTOGRAM_BUCKETS = (0.0, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, float("inf"))
+
+# Máximo de motivos/tasks distintos contabilizados (o resto vai para "outros")
+MAX_ACCOUNTING_KEYS = 200
+
 
 class PaceLevel(Enum):
     """Níveis de velocidade da aplicação."""
@@ -33,6 +54,131 @@ class OperationType(Enum):
     RETRY = "retry"  # Delays entre retries
 
 
+class PaceAccounting:
+    """
+    Contabilidade do tempo dormido em esperas de pace.
+
+    Agrupa por tipo de operação, por motivo (números normalizados, ex.:
+    'Scroll #/#') e por task asyncio, e compara com o tempo de parede.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Zera os acumuladores e reinicia a janela de medição."""
+        self.started_at = time.monotonic()
+        self.by_type: Dict[str, Dict[str, Any]] = {}
+        self.by_reason: Dict[str, Dict[str, Any]] = {}
+        self.by_task: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _new_entry() -> Dict[str, Any]:
+        return {
+            "waits": 0,
+            "seconds": 0.0,
+            "histogram": [0] * len(SLEEP_HISTOGRAM_BUCKETS),
+        }
+
+    @staticmethod
+    def _entry(table: Dict[str, Dict[str, Any]], key: str) -> Dict[str, Any]:
+        if key not in table and len(table) >= MAX_ACCOUNTING_KEYS:
+            key = "outros"
+        entry = table.get(key)
+        if entry is None:
+            entry = table[key] = PaceAccounting._new_entry()
+        return entry
+
+    @staticmethod
+    def _add(entry: Dict[str, Any], seconds: float) -> None:
+        entry["waits"] += 1
+        entry["seconds"] += seconds
+        for index, upper in enumerate(SLEEP_HISTOGRAM_BUCKETS):
+            if seconds <= upper:
+                entry["histogram"][index] += 1
+                break
+
+    def record(
+        self, operation_type: "OperationType", reason: str, seconds: float
+    ) -> None:
+        """
+        Registra uma espera.
+
+        Args:
+            operation_type: Tipo da operação
+            reason: Motivo informado no wait()
+            seconds: Tempo efetivamente dormido
+        """
+        now = time.monotonic()
+        self._add(self._entry(self.by_type, operation_type.value), seconds)
+
+        # Seletores/contadores variam por chamada; números viram '#'
+        reason_key = re.sub(r"\d+", "#", reason)[:80] or "(sem motivo)"
+        self._add(self._entry(self.by_reason, reason_key), seconds)
+
+        task = asyncio.current_task()
+        task_entry = self._entry(self.by_task, task.get_name() if task else "main")
+        self._add(task_entry, seconds)
+        task_entry.setdefault("first_seen", now - seconds)
+        task_entry["last_seen"] = now
+
+    @staticmethod
+    def _summary(entry: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "waits": entry["waits"],
+            "seconds": entry["seconds"],
+            "mean": entry["seconds"] / entry["waits"] if entry["waits"] else 0.0,
+            "histogram": dict(zip(_histogram_labels(), entry["histogram"])),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna a contabilidade agregada.
+
+        A fração por task usa a janela entre a primeira e a última espera da
+        task; o restante desse tempo é trabalho do browser/extração.
+        """
+        wall = time.monotonic() - self.started_at
+        slept = sum(entry["seconds"] for entry in self.by_type.values())
+
+        tasks = {}
+        for name, entry in self.by_task.items():
+            active = entry["last_seen"] - entry["first_seen"]
+            tasks[name] = {
+                **self._summary(entry),
+                "active_seconds": active,
+                "sleep_share": entry["seconds"] / active if active > 0 else 1.0,
+            }
+
+        return {
+            "wall_seconds": wall,
+            "slept_seconds": slept,
+            # Com tasks concorrentes a soma dos sleeps pode passar do tempo de parede
+            "sleep_share": slept / wall if wall > 0 else 0.0,
+            "by_type": {k: self._summary(v) for k, v in self.by_type.items()},
+            "by_reason": {
+                k: self._summary(v)
+                for k, v in sorted(
+                    self.by_reason.items(), key=lambda item: -item[1]["seconds"]
+                )
+            },
+            "by_task": tasks,
+        }
+
+
+def _histogram_labels() -> List[str]:
+    labels = []
+    for upper in SLEEP_HISTOGRAM_BUCKETS:
+        labels.append("inf" if upper == float("inf") else f"<={upper:g}s")
+    return labels
+
+
+# Override de (nível, multiplicador) visível só na task atual e nas filhas
+_pace_override: ContextVar[Optional[Tuple["PaceLevel", float]]] = ContextVar(
+    "pace_override", default=None
+)
+
+
 class PaceManager:
     """
     Gerenciador global de velocidade da aplicação.
@@ -88,11 +234,32 @@ class PaceManager:
         },
     }
 
+    # Limites (mín, máx) do fator adaptativo sobre os delays de cada nível
+    ADAPTIVE_BOUNDS = {
+        PaceLevel.TURBO: (0.5, 8.0),
+        PaceLevel.NORMAL: (0.25, 6.0),
+        PaceLevel.CAREFUL: (0.5, 4.0),
+        PaceLevel.DEBUG: (1.0, 1.0),  # Debug mantém o ritmo fixo
+        PaceLevel.STEALTH: (0.75, 4.0),
+    }
+
     def __init__(self, pace_level: PaceLevel = PaceLevel.NORMAL):
         self.pace_level = pace_level
         self.custom_multiplier = 1.0
         self.operation_counts: Dict[OperationType, int] = {}
 
+        # Modo adaptativo (desligado por padrão)
+        self.adaptive = False
+        self.adaptive_factor = 1.0
+        self.latency_ewma: Optional[float] = None
+        self.adaptive_counts = {"fast": 0, "slow": 0, "backoff": 0}
+
+        # Pacing por deadline: esperas descontam o tempo da própria operação
+        self.deadline_stats = {"waits": 0, "overlapped": 0, "saved_seconds": 0.0}
+
+        # Tempo dormido por tipo/motivo/task
+        self.accounting = PaceAccounting()
+
         logger.info(f"PaceManager inicializado com nível: {pace_level.value}")
 
     def set_pace_level(self, pace_level: PaceLevel) -> None:
@@ -104,6 +271,7 @@ class PaceManager:
         """
         old_level = self.pace_level
         self.pace_level = pace_level
+        self.adaptive_factor = self._clamp_factor(self.adaptive_factor)
         logger.info(f"Pace alterado de {old_level.value} → {pace_level.value}")
 
     def set_multiplier(self, multiplier: float) -> None:
@@ -116,47 +284,135 @@ class PaceManager:
         self.custom_multiplier = multiplier
         logger.info(f"Multiplicador de pace definido: {multiplier}x")
 
+    def set_adaptive(self, enabled: bool = True) -> None:
+        """
+        Liga/desliga o ajuste automático dos delays pelas respostas observadas.
+
+        Args:
+            enabled: True para ativar o modo adaptativo
+        """
+        self.adaptive = enabled
+        if not enabled:
+            self.adaptive_factor = 1.0
+        logger.info(f"Pace adaptativo {'ativado' if enabled else 'desativado'}")
+
+    def report_response(self, status: Optional[int], latency: float) -> None:
+        """
+        Alimenta o controle adaptativo com o resultado de uma navegação.
+
+        Args:
+            status: Status HTTP (None para timeout/sem resposta)
+            latency: Tempo da navegação em segundos
+        """
+        if not self.adaptive:
+            return
+
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += ADAPTIVE_EWMA_ALPHA * (latency - self.latency_ewma)
+
+        if status is None or status in BACKOFF_STATUSES:
+            self.adaptive_counts["backoff"] += 1
+            old_factor = self.adaptive_factor
+            self.adaptive_factor = self._clamp_factor(old_factor * ADAPTIVE_BACKOFF)
+            logger.info(
+                f"Pace adaptativo: {status or 'timeout'} → fator "
+                f"{old_factor:.2f} → {self.adaptive_factor:.2f}"
+            )
+        elif status < 400 and latency <= ADAPTIVE_FAST_LATENCY:
+            self.adaptive_counts["fast"] += 1
+            self.adaptive_factor = self._clamp_factor(
+                self.adaptive_factor - ADAPTIVE_STEP
+            )
+        else:
+            # Lento ou erro não relacionado a bloqueio: mantém o fator
+            self.adaptive_counts["slow"] += 1
+
+    def _clamp_factor(self, factor: float) -> float:
+        min_factor, max_factor = self.ADAPTIVE_BOUNDS[self.pace_level]
+        return min(max(factor, min_factor), max_factor)
+
     async def wait(
         self,
         operation_type: OperationType,
         custom_delay: Optional[float] = None,
         reason: str = "",
+        started_at: Optional[float] = None,
     ) -> None:
         """
         Executa delay inteligente baseado no tipo de operação.
 
+        Com started_at, o delay é o intervalo mínimo desde o início da
+        operação: dorme apenas o que falta (nada, se a operação já demorou
+        mais que o delay).
+
         Args:
             operation_type: Tipo da operação
             custom_delay: Delay customizado (sobrescreve configuração)
             reason: Motivo do delay (para logging)
+            started_at: Início da operação (time.monotonic())
         """
         if custom_delay is not None:
             delay = custom_delay
         else:
-            base_delay = self.PACE_CONFIGS[self.pace_level][operation_type]
-            delay = base_delay * self.custom_multiplier
+            delay = self.get_delay(operation_type)
+
+        if started_at is not None and delay > 0:
+            remaining = max(0.0, delay - (time.monotonic() - started_at))
+            self.deadline_stats["waits"] += 1
+            self.deadline_stats["saved_seconds"] += delay - remaining
+            if remaining == 0:
+                self.deadline_stats["overlapped"] += 1
+            delay = remaining
 
         # Contador de operações para estatísticas
         self.operation_counts[operation_type] = (
             self.operation_counts.get(operation_type, 0) + 1
         )
 
+        slept = 0.0
         if delay > 0:
             logger.debug(f"Pace wait: {delay:.2f}s ({operation_type.value}) - {reason}")
+            sleep_started = time.monotonic()
             await asyncio.sleep(delay)
+            slept = time.monotonic() - sleep_started
+
+        self.accounting.record(operation_type, reason, slept)
+
+    @asynccontextmanager
+    async def paced(
+        self, operation_type: OperationType, reason: str = ""
+    ) -> AsyncIterator[None]:
+        """
+        Marca o início da operação e, ao sair, aguarda só o restante do delay.
+
+        Uso:
+        >>> async with pace_manager.paced(OperationType.CLICK, "botão"):
+        >>>     await page.click("button")
+        """
+        started_at = time.monotonic()
+        yield
+        await self.wait(operation_type, reason=reason, started_at=started_at)
 
     def get_delay(self, operation_type: OperationType) -> float:
         """
-        Obtém o delay configurado para um tipo de operação.
+        Obtém o delay efetivo para um tipo de operação.
 
         Args:
             operation_type: Tipo da operação
 
         Returns:
-            float: Delay em segundos
+            float: Delay em segundos (inclui o fator adaptativo, se ativo)
         """
-        base_delay = self.PACE_CONFIGS[self.pace_level][operation_type]
-        return base_delay * self.custom_multiplier
+        level, multiplier = _pace_override.get() or (
+            self.pace_level,
+            self.custom_multiplier,
+        )
+        delay = self.PACE_CONFIGS[level][operation_type] * multiplier
+        if self.adaptive:
+            delay *= self.adaptive_factor
+        return delay
 
     def get_statistics(self) -> Dict[str, any]:
         """
@@ -174,11 +430,43 @@ class PaceManager:
             "current_delays": {
                 op_type.value: self.get_delay(op_type) for op_type in OperationType
             },
+            "adaptive": {
+                "enabled": self.adaptive,
+                "factor": self.adaptive_factor,
+                "bounds": self.ADAPTIVE_BOUNDS[self.pace_level],
+                "latency_ewma": self.latency_ewma,
+                "responses": dict(self.adaptive_counts),
+            },
+            "deadline": {
+                **self.deadline_stats,
+                "overlap_ratio": (
+                    self.deadline_stats["overlapped"] / self.deadline_stats["waits"]
+                    if self.deadline_stats["waits"]
+                    else 0.0
+                ),
+            },
+            "time_accounting": self.accounting.snapshot(),
         }
 
+    def export_statistics(self, path: str) -> None:
+        """
+        Grava as estatísticas (incluindo a contabilidade de tempo) em JSON.
+
+        Args:
+            path: Caminho do arquivo de saída
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_statistics(), f, indent=2, ensure_ascii=False)
+
+        logger.info(f"Estatísticas de pace exportadas para {path}")
+
     def reset_statistics(self) -> None:
         """Reseta contadores de operações."""
         self.operation_counts.clear()
+        self.adaptive_counts = {"fast": 0, "slow": 0, "backoff": 0}
+        self.latency_ewma = None
+        self.deadline_stats = {"waits": 0, "overlapped": 0, "saved_seconds": 0.0}
+        self.accounting.reset()
         logger.info("Estatísticas de pace resetadas")
 
 
@@ -187,44 +475,50 @@ pace_manager = PaceManager()
 
 
 # Funções de conveniência para uso direto
-async def wait_navigation(reason: str = "") -> None:
+async def wait_navigation(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing de navegação."""
-    await pace_manager.wait(OperationType.NAVIGATION, reason=reason)
+    await pace_manager.wait(
+        OperationType.NAVIGATION, reason=reason, started_at=started_at
+    )
 
 
-async def wait_click(reason: str = "") -> None:
+async def wait_click(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing de clique."""
-    await pace_manager.wait(OperationType.CLICK, reason=reason)
+    await pace_manager.wait(OperationType.CLICK, reason=reason, started_at=started_at)
 
 
-async def wait_fill(reason: str = "") -> None:
+async def wait_fill(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing de preenchimento."""
-    await pace_manager.wait(OperationType.FILL, reason=reason)
+    await pace_manager.wait(OperationType.FILL, reason=reason, started_at=started_at)
 
 
-async def wait_scroll(reason: str = "") -> None:
+async def wait_scroll(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing de scroll."""
-    await pace_manager.wait(OperationType.SCROLL, reason=reason)
+    await pace_manager.wait(OperationType.SCROLL, reason=reason, started_at=started_at)
 
 
-async def wait_extraction(reason: str = "") -> None:
+async def wait_extraction(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing de extração."""
-    await pace_manager.wait(OperationType.EXTRACTION, reason=reason)
+    await pace_manager.wait(
+        OperationType.EXTRACTION, reason=reason, started_at=started_at
+    )
 
 
-async def wait_network(reason: str = "") -> None:
+async def wait_network(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing de rede."""
-    await pace_manager.wait(OperationType.NETWORK, reason=reason)
+    await pace_manager.wait(OperationType.NETWORK, reason=reason, started_at=started_at)
 
 
-async def wait_retry(reason: str = "") -> None:
+async def wait_retry(reason: str = "", started_at: Optional[float] = None) -> None:
     """Aguarda timing entre retries."""
-    await pace_manager.wait(OperationType.RETRY, reason=reason)
+    await pace_manager.wait(OperationType.RETRY, reason=reason, started_at=started_at)
 
 
 # Função para configuração rápida
 def configure_pace(
-    level: PaceLevel = PaceLevel.NORMAL, multiplier: float = 1.0
+    level: PaceLevel = PaceLevel.NORMAL,
+    multiplier: float = 1.0,
+    adaptive: Optional[bool] = None,
 ) -> None:
     """
     Configuração rápida do pace global.
@@ -232,32 +526,37 @@ def configure_pace(
     Args:
         level: Nível de velocidade
         multiplier: Multiplicador adicional
+        adaptive: Liga/desliga o modo adaptativo (None mantém o atual)
     """
     pace_manager.set_pace_level(level)
     pace_manager.set_multiplier(multiplier)
+    if adaptive is not None:
+        pace_manager.set_adaptive(adaptive)
 
     logger.info(f"Pace configurado: {level.value} (x{multiplier})")
 
 
 # Context manager para pace temporário
 class TemporaryPace:
-    """Context manager para pace temporário."""
+    """
+    Context manager para pace temporário.
+
+    O override vale apenas para a task atual (e tasks criadas dentro do
+    bloco), via contextvars; as demais coroutines mantêm o pace global.
+    """
 
     def __init__(self, level: PaceLevel, multiplier: float = 1.0):
         self.temp_level = level
         self.temp_multiplier = multiplier
-        self.original_level = None
-        self.original_multiplier = None
+        self._token = None
 
     async def __aenter__(self):
-        self.original_level = pace_manager.pace_level
-        self.original_multiplier = pace_manager.custom_multiplier
-
-        pace_manager.set_pace_level(self.temp_level)
-        pace_manager.set_multiplier(self.temp_multiplier)
-
+        self._token = _pace_override.set((self.temp_level, self.temp_multiplier))
+        logger.debug(
+            f"Pace temporário: {self.temp_level.value} (x{self.temp_multiplier})"
+        )
         return pace_manager
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        pace_manager.set_pace_level(self.original_level)
-        pace_manager.set_multiplier(self.original_multiplier)
+        _pace_override.reset(self._token)
+        self._token = None
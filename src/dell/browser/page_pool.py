@@ -0,0 +1,237 @@
+"""
+PagePool - Pool limitado de páginas por contexto.
+Reutiliza páginas já abertas (renderers aquecidos) em vez de criar uma nova a cada uso.
+
+Na devolução a página volta para about:blank, sem rotas e sem os listeners
+registrados via on(). Listeners adicionados direto com page.on() continuam
+na página: a API pública do Playwright não lista listeners, e o reset não
+depende dos internos do driver.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from playwright.async_api import BrowserContext, Page
+
+from .errors import PageWaitTimeout
+
+logger = logging.getLogger(__name__)
+
+# Página neutra usada para resetar páginas devolvidas ao pool
+BLANK_URL = "about:blank"
+
+
+class PoolClosedError(Exception):
+    """Exceção para uso de um pool já fechado."""
+
+    pass
+
+
+class PagePool:
+    """
+    Pool de páginas com limite de tamanho e fila de espera.
+    Páginas são emprestadas com acquire() e devolvidas com release().
+    """
+
+    def __init__(self, context: BrowserContext, context_id: str, max_size: int = 5):
+        if max_size < 1:
+            raise ValueError("max_size deve ser maior ou igual a 1")
+
+        self.context = context
+        self.context_id = context_id
+        self.max_size = max_size
+
+        self._idle: Deque[Page] = deque()
+        self._in_use: Set[Page] = set()
+        self._creating = 0
+        self._tracked_listeners: Dict[Page, List[Tuple[str, Callable]]] = {}
+        self._condition = asyncio.Condition()
+        self._closed = False
+
+        self.stats: Dict[str, int] = {
+            "created": 0,
+            "reused": 0,
+            "waits": 0,
+            "discarded": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        """Total de páginas do pool (livres + emprestadas + em criação)."""
+        return len(self._idle) + len(self._in_use) + self._creating
+
+    @property
+    def in_use(self) -> int:
+        """Quantidade de páginas emprestadas no momento."""
+        return len(self._in_use)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def owns(self, page: Page) -> bool:
+        """Indica se a página está emprestada por este pool."""
+        return page in self._in_use
+
+    def on(self, page: Page, event: str, handler: Callable) -> None:
+        """
+        Registra um listener na página emprestada, removido na devolução.
+
+        Use no lugar de page.on() para listeners temporários: só os
+        registrados aqui são removidos no reset.
+
+        Raises:
+            ValueError: Se a página não estiver emprestada por este pool
+        """
+        if page not in self._in_use:
+            raise ValueError(f"Página não pertence ao pool '{self.context_id}'")
+        page.on(event, handler)
+        self._tracked_listeners.setdefault(page, []).append((event, handler))
+
+    async def acquire(self, timeout: Optional[float] = None) -> Page:
+        """
+        Empresta uma página do pool, aguardando se o limite foi atingido.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+        Returns:
+            Page: Página pronta para uso
+
+        Raises:
+            PageWaitTimeout: Se nenhuma página ficar livre dentro do timeout
+            PoolClosedError: Se o pool for fechado
+        """
+        async with self._condition:
+            while True:
+                if self._closed:
+                    raise PoolClosedError(f"Pool '{self.context_id}' está fechado")
+
+                # Reutilizar página livre, descartando as que foram fechadas
+                while self._idle:
+                    page = self._idle.popleft()
+                    if page.is_closed():
+                        self._forget(page)
+                        continue
+
+                    self._in_use.add(page)
+                    self.stats["reused"] += 1
+                    return page
+
+                if self.size < self.max_size:
+                    self._creating += 1
+                    break
+
+                # Pool cheio - entrar na fila de espera
+                self.stats["waits"] += 1
+                logger.debug(
+                    f"Pool '{self.context_id}' cheio ({self.max_size}), aguardando página"
+                )
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    raise PageWaitTimeout(
+                        f"Nenhuma página livre no pool '{self.context_id}' após {timeout}s"
+                    )
+
+        # Criar página fora do lock para não bloquear quem está devolvendo
+        try:
+            page = await self.context.new_page()
+        except Exception:
+            async with self._condition:
+                self._creating -= 1
+                self._condition.notify()
+            raise
+
+        async with self._condition:
+            self._creating -= 1
+            self._in_use.add(page)
+            self.stats["created"] += 1
+
+        logger.debug(f"Nova página criada no pool '{self.context_id}'")
+        return page
+
+    async def release(self, page: Page, discard: bool = False) -> None:
+        """
+        Devolve uma página ao pool após resetá-la.
+
+        Args:
+            page: Página emprestada via acquire()
+            discard: Fechar a página em vez de reutilizá-la
+        """
+        if page not in self._in_use:
+            logger.warning(f"Página não pertence ao pool '{self.context_id}'")
+            return
+
+        if not discard and not self._closed and not page.is_closed():
+            discard = not await self._reset_page(page)
+
+        if discard or self._closed:
+            await self._close_page(page)
+
+        async with self._condition:
+            self._in_use.discard(page)
+            if page.is_closed():
+                self._forget(page)
+                self.stats["discarded"] += 1
+            else:
+                self._idle.append(page)
+            self._condition.notify()
+
+    async def close(self) -> None:
+        """Fecha o pool e todas as páginas livres."""
+        async with self._condition:
+            self._closed = True
+            idle_pages = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+
+        for page in idle_pages:
+            await self._close_page(page)
+            self._forget(page)
+
+        logger.debug(f"Pool '{self.context_id}' fechado")
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Retorna estatísticas de uso do pool."""
+        return {
+            **self.stats,
+            "max_size": self.max_size,
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+        }
+
+    async def _reset_page(self, page: Page) -> bool:
+        """
+        Reseta a página para o estado neutro (rotas, listeners e URL).
+
+        Returns:
+            bool: True se a página pode voltar ao pool
+        """
+        try:
+            await page.unroute_all(behavior="ignoreErrors")
+            self._remove_listeners(page)
+            if page.url != BLANK_URL:
+                await page.goto(BLANK_URL)
+            return True
+
+        except Exception as e:
+            logger.warning(f"Erro ao resetar página do pool: {str(e)}")
+            return False
+
+    def _remove_listeners(self, page: Page) -> None:
+        """Remove os listeners registrados via on() durante o empréstimo."""
+        for event, handler in self._tracked_listeners.pop(page, []):
+            page.remove_listener(event, handler)
+
+    async def _close_page(self, page: Page) -> None:
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            logger.debug(f"Erro ao fechar página do pool: {str(e)}")
+
+    def _forget(self, page: Page) -> None:
+        self._tracked_listeners.pop(page, None)
@@ -0,0 +1,139 @@
+"""
+Presence - Sondagem rápida de elementos e memória de ausência por template.
+
+Campos opcionais (selo de desconto, bundle) faltam na maioria dos produtos
+Dell; esperar o timeout de wait_for_selector por eles custa segundos por
+página. A sondagem verifica todos os seletores de uma vez, e a memória
+aprende por template de página quais seletores costumam faltar.
+"""
+
+import logging
+import re
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page
+
+logger = logging.getLogger(__name__)
+
+# Observações mínimas antes de confiar na memória de ausência
+MIN_OBSERVATIONS = 5
+
+# Fração máxima de presença para considerar o seletor "geralmente ausente"
+ABSENT_RATIO = 0.1
+
+# A cada N observações, uma espera completa revalida um seletor "ausente"
+# (elementos que carregam tarde não ficam marcados como ausentes para sempre)
+RECHECK_INTERVAL = 20
+
+_PROBE_JS = """
+(selectors) => Object.fromEntries(selectors.map((selector) => {
+    try {
+        return [selector, document.querySelector(selector) !== null];
+    } catch (e) {
+        return [selector, false];
+    }
+}))
+"""
+
+
+def page_template(url: str) -> str:
+    """
+    Template da página a partir da URL: host + path sem o último segmento,
+    com números normalizados (produtos da mesma categoria compartilham o template).
+
+    Args:
+        url: URL da página
+
+    Returns:
+        str: Chave do template (ex.: 'www.dell.com/pt-br/shop/notebooks/spd')
+    """
+    parts = urlsplit(url)
+    segments = [s for s in parts.path.split("/") if s][:-1]
+    path = re.sub(r"\d+", "#", "/".join(segments))
+    return f"{parts.hostname or ''}/{path}"
+
+
+class PresenceMemory:
+    """
+    Contagem de presença/ausência de seletores por template de página.
+    """
+
+    def __init__(
+        self,
+        min_observations: int = MIN_OBSERVATIONS,
+        absent_ratio: float = ABSENT_RATIO,
+    ):
+        self.min_observations = min_observations
+        self.absent_ratio = absent_ratio
+        # template → seletor → [observações, presenças]
+        self.counts: Dict[str, Dict[str, list]] = {}
+
+    def record(self, template: str, selector: str, present: bool) -> None:
+        """Registra uma observação do seletor no template."""
+        counts = self.counts.setdefault(template, {}).setdefault(selector, [0, 0])
+        counts[0] += 1
+        counts[1] += int(present)
+
+    def is_usually_absent(self, template: str, selector: str) -> bool:
+        """
+        Indica se o seletor costuma faltar nas páginas do template.
+
+        Retorna False periodicamente (RECHECK_INTERVAL) para forçar uma
+        espera completa que revalide a memória.
+        """
+        counts = self.counts.get(template, {}).get(selector)
+        if not counts or counts[0] < self.min_observations:
+            return False
+        if counts[0] % RECHECK_INTERVAL == 0:
+            return False
+        return counts[1] / counts[0] <= self.absent_ratio
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Retorna a taxa de presença por template e seletor."""
+        return {
+            template: {
+                selector: present / seen
+                for selector, (seen, present) in selectors.items()
+            }
+            for template, selectors in self.counts.items()
+        }
+
+    def reset(self) -> None:
+        """Esquece todas as observações."""
+        self.counts.clear()
+
+
+# Instância global da memória de presença
+presence_memory = PresenceMemory()
+
+
+async def probe_selectors(
+    page: Page, selectors: Iterable[str], template: Optional[str] = None
+) -> Dict[str, bool]:
+    """
+    Verifica, sem esperar, quais seletores existem na página (um round trip).
+
+    Use logo após a página ficar pronta; depois, só espere/extraia os
+    campos presentes.
+
+    Args:
+        page: Página do Playwright
+        selectors: Seletores CSS candidatos
+        template: Template da página (padrão: derivado da URL)
+
+    Returns:
+        dict: Seletor → presente
+    """
+    selectors = list(dict.fromkeys(selectors))
+    try:
+        presence = await page.evaluate(_PROBE_JS, selectors)
+    except Exception as e:
+        logger.warning(f"Erro na sondagem de seletores: {str(e)}")
+        return {selector: False for selector in selectors}
+
+    template = template or page_template(page.url)
+    for selector, present in presence.items():
+        presence_memory.record(template, selector, present)
+
+    return presence
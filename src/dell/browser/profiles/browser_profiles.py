@@ -3,6 +3,31 @@ Browser profiles configuration for Dell scraping automation.
 Following RPA standards with maximum reliability approach.
 """
 
+# Resource Policy - Recursos que não usamos na extração (só lemos texto/atributos)
+TRACKING_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googleadservices.com",
+    "facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "adobedtm.com",
+    "omtrdc.net",
+    "demdex.net",
+    "everesttech.net",
+    "bing.com",
+    "linkedin.com",
+    "tiktok.com",
+    "qualtrics.com",
+]
+
+BLOCKING_RESOURCE_POLICY = {
+    "block_resource_types": ["image", "media", "font", "texttrack", "eventsource"],
+    "block_domains": TRACKING_DOMAINS,
+    "allow_domains": None,  # None = qualquer domínio fora da lista de bloqueio
+}
+
 # Production Profile - Maximum Reliability
 PRODUCTION_PROFILE = {
     "headless": True,
@@ -29,6 +54,8 @@ PRODUCTION_PROFILE = {
     "permissions": ["geolocation"],
     "color_scheme": "light",
     "reduced_motion": "no-preference",
+    "resource_policy": BLOCKING_RESOURCE_POLICY,
+    "warm_up_url": "https://www.dell.com/pt-br",  # Consentimento/locale/cookies
 }
 
 # Debug Profile - Para desenvolvimento e análise de elementos
@@ -44,6 +71,7 @@ DEBUG_PROFILE = {
         "--disable-web-security",
         "--allow-running-insecure-content",
     ],
+    "resource_policy": None,  # Debug carrega tudo para análise visual
 }
 
 # Stealth Profile - Para casos que precisam de mais discrição
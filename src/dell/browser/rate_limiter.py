@@ -0,0 +1,249 @@
+"""
+RateLimiter - Limite de requisições por host com token bucket.
+
+O pace_manager espaça ações de uma coroutine; com várias páginas em paralelo
+a taxa agregada para dell.com fica sem limite. Os buckets aqui são
+compartilhados por todas as coroutines do processo e, opcionalmente, por
+todos os processos (estado em arquivo com lock).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from dell.config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem lock de arquivo, apenas limite por processo
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Orçamento padrão por host: requisições por segundo e rajada máxima
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+
+
+class TokenBucket:
+    """
+    Token bucket com reserva: cada acquire() consome um token na hora e
+    dorme o tempo até ele estar disponível, sem segurar o lock no sleep.
+    A ordem de chegada é preservada.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        """
+        Args:
+            rate: Tokens repostos por segundo (requisições/s sustentadas)
+            burst: Capacidade do bucket (rajada máxima)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate deve ser > 0 e burst >= 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        self.stats = {"acquired": 0, "delayed": 0, "waited_seconds": 0.0}
+
+    def _reserve(self) -> float:
+        """Consome um token e retorna quanto esperar por ele (segundos)."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self) -> float:
+        """
+        Aguarda um token.
+
+        Returns:
+            float: Tempo esperado em segundos
+        """
+        async with self._lock:
+            delay = self._reserve()
+
+        self.stats["acquired"] += 1
+        if delay > 0:
+            self.stats["delayed"] += 1
+            self.stats["waited_seconds"] += delay
+            await asyncio.sleep(delay)
+        return delay
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket cujo estado fica em arquivo, com flock, para que processos
+    diferentes (ex.: workers do BrowserFleet) dividam o mesmo orçamento.
+    """
+
+    def __init__(
+        self, path: Path, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST
+    ):
+        super().__init__(rate, burst)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _reserve(self) -> float:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            raw = os.read(fd, 4096)
+            try:
+                state = json.loads(raw) if raw else {}
+            except ValueError:
+                state = {}
+
+            # monotonic é comum a todos os processos da máquina; estado de
+            # antes de um reboot (updated no futuro) é descartado
+            now = time.monotonic()
+            self.tokens = state.get("tokens", float(self.burst))
+            self.updated = state.get("updated", now)
+            if self.updated > now:
+                self.tokens, self.updated = float(self.burst), now
+
+            delay = super()._reserve()
+
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(
+                fd,
+                json.dumps({"tokens": self.tokens, "updated": self.updated}).encode(),
+            )
+            return delay
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+class RateLimiter:
+    """
+    Limite de requisições por host, compartilhado por todas as coroutines.
+
+    Configuração (settings): rate_limit_rps, rate_limit_burst e
+    rate_limit_shared_dir (ativa o orçamento entre processos).
+
+    Uso:
+    >>> await rate_limiter.acquire("https://www.dell.com/pt-br/shop/...")
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        shared_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            rate: Requisições/s por host (padrão: settings ou DEFAULT_RATE)
+            burst: Rajada por host (padrão: settings ou DEFAULT_BURST)
+            host_limits: Host → (rate, burst) para hosts específicos
+            shared_dir: Diretório do estado compartilhado entre processos
+        """
+        self._rate = rate
+        self._burst = burst
+        self._shared_dir = shared_dir
+        self.host_limits: Dict[str, Tuple[float, int]] = dict(host_limits or {})
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.enabled = True
+
+    def configure(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        shared_dir: Optional[str] = None,
+    ) -> None:
+        """Altera o orçamento; buckets existentes são recriados."""
+        if rate is not None:
+            self._rate = rate
+        if burst is not None:
+            self._burst = burst
+        if host_limits is not None:
+            self.host_limits.update(host_limits)
+        if shared_dir is not None:
+            self._shared_dir = shared_dir
+
+        self.buckets.clear()
+        logger.info(f"Rate limit: {self.rate} req/s, rajada {self.burst} por host")
+
+    @property
+    def rate(self) -> float:
+        if self._rate is None:
+            self._rate = float(settings.get("rate_limit_rps", DEFAULT_RATE))
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        if self._burst is None:
+            self._burst = int(settings.get("rate_limit_burst", DEFAULT_BURST))
+        return self._burst
+
+    @property
+    def shared_dir(self) -> Optional[str]:
+        if self._shared_dir is None:
+            self._shared_dir = settings.get("rate_limit_shared_dir") or ""
+        return self._shared_dir or None
+
+    def bucket_for(self, host: str) -> TokenBucket:
+        """Bucket do host (criado sob demanda)."""
+        bucket = self.buckets.get(host)
+        if bucket is not None:
+            return bucket
+
+        rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+        if self.shared_dir and fcntl is not None:
+            bucket = SharedTokenBucket(
+                Path(self.shared_dir) / f"{host}.bucket", rate, burst
+            )
+        else:
+            bucket = TokenBucket(rate, burst)
+
+        self.buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> float:
+        """
+        Aguarda o orçamento do host da URL.
+
+        Args:
+            url: URL (ou host) da requisição
+
+        Returns:
+            float: Tempo esperado em segundos
+        """
+        if not self.enabled:
+            return 0.0
+
+        host = urlsplit(url).hostname if "://" in url else url
+        if not host:
+            return 0.0
+
+        delay = await self.bucket_for(host.lower()).acquire()
+        if delay > 0:
+            logger.debug(f"Rate limit {host}: aguardando {delay:.2f}s")
+        return delay
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Retorna contadores de espera por host."""
+        return {
+            "enabled": self.enabled,
+            "rate": self.rate,
+            "burst": self.burst,
+            "shared": bool(self.shared_dir),
+            "hosts": {host: dict(b.stats) for host, b in self.buckets.items()},
+        }
+
+
+# Instância global do rate limiter
+rate_limiter = RateLimiter()
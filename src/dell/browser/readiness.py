@@ -0,0 +1,185 @@
+"""
+Readiness - Estratégias para decidir quando uma página está pronta.
+
+'networkidle' espera os beacons de analytics da Dell e custa 5-10s por
+navegação. Uma estratégia navega com commit/domcontentloaded e considera a
+página pronta quando o que importa chegou: um seletor, uma resposta de URL
+específica ou um predicado JS. Estratégias são registradas por padrão de URL
+e, opcionalmente, por perfil.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright.async_api import Page, Response
+
+from .response_capture import UrlPattern, compile_url_pattern
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReadinessStrategy:
+    """
+    Critério de página pronta.
+
+    Todos os critérios definidos precisam ser satisfeitos; eles são
+    aguardados em paralelo após a navegação.
+
+    Attributes:
+        name: Nome para as estatísticas
+        wait_until: Evento de navegação ('commit', 'domcontentloaded', 'load', 'networkidle')
+        selector: Seletor que precisa existir (state='attached')
+        response: Padrão de URL de uma resposta que precisa chegar
+        predicate: Expressão/função JS que precisa ficar verdadeira
+    """
+
+    name: str
+    wait_until: str = "domcontentloaded"
+    selector: Optional[str] = None
+    response: Optional[UrlPattern] = None
+    predicate: Optional[str] = None
+
+    async def navigate(
+        self, page: Page, url: str, timeout: float = 30000
+    ) -> Optional[Response]:
+        """
+        Navega e aguarda os critérios da estratégia.
+
+        Args:
+            page: Página do Playwright
+            url: URL de destino
+            timeout: Timeout total em ms
+
+        Returns:
+            Response da navegação (ou None)
+
+        Raises:
+            playwright TimeoutError: Se algum critério não for satisfeito a tempo
+        """
+        started = time.monotonic()
+        try:
+            # O listener da resposta precisa existir antes da navegação
+            if self.response is not None:
+                matches = compile_url_pattern(self.response)
+                expect = page.expect_response(
+                    lambda response: matches(response.url), timeout=timeout
+                )
+            else:
+                expect = nullcontext()
+
+            async with expect:
+                response = await page.goto(
+                    url, wait_until=self.wait_until, timeout=timeout
+                )
+
+                # Critérios esperam só o que sobrou do timeout total (timeout=0
+                # no Playwright é "sem limite", então o mínimo é 1 ms)
+                remaining = max(timeout - (time.monotonic() - started) * 1000, 1)
+                waits = []
+                if self.selector:
+                    waits.append(
+                        page.wait_for_selector(
+                            self.selector, state="attached", timeout=remaining
+                        )
+                    )
+                if self.predicate:
+                    waits.append(
+                        page.wait_for_function(self.predicate, timeout=remaining)
+                    )
+                if waits:
+                    await asyncio.gather(*waits)
+
+        except Exception:
+            readiness_registry.record(self.name, time.monotonic() - started, ok=False)
+            raise
+
+        readiness_registry.record(self.name, time.monotonic() - started, ok=True)
+        return response
+
+
+class ReadinessRegistry:
+    """
+    Estratégias por padrão de URL e perfil, com tempo medido por estratégia.
+
+    Uso:
+    >>> readiness_registry.register(
+    >>>     "*/shop/*/spd/*",
+    >>>     ReadinessStrategy("pdp", selector="[data-testid='sharedPSPDellPrice']"),
+    >>> )
+    >>> await safe_goto(page, url)  # usa a estratégia se a URL casar
+    """
+
+    def __init__(self):
+        # (perfil ou None, matcher, padrão, estratégia), na ordem de registro
+        self.rules: List[Tuple[Optional[str], Any, UrlPattern, ReadinessStrategy]] = []
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def register(
+        self,
+        pattern: UrlPattern,
+        strategy: ReadinessStrategy,
+        profile_name: Optional[str] = None,
+    ) -> None:
+        """
+        Associa uma estratégia a um padrão de URL.
+
+        Args:
+            pattern: Glob, regex ou função(url) (mesmo formato do ResponseCapture)
+            strategy: Estratégia a usar
+            profile_name: Restringe a regra a um perfil (None = todos)
+        """
+        matches = compile_url_pattern(pattern)
+        self.rules.append((profile_name, matches, pattern, strategy))
+        logger.debug(f"Readiness '{strategy.name}' registrada para {pattern}")
+
+    def resolve(
+        self, url: str, profile_name: Optional[str] = None
+    ) -> Optional[ReadinessStrategy]:
+        """
+        Estratégia para a URL: regras do perfil primeiro, depois as gerais.
+
+        Returns:
+            ReadinessStrategy ou None (usa o wait_until padrão)
+        """
+        fallback = None
+        for rule_profile, matches, _, strategy in self.rules:
+            if not matches(url):
+                continue
+            if rule_profile is not None and rule_profile == profile_name:
+                return strategy
+            if rule_profile is None and fallback is None:
+                fallback = strategy
+        return fallback
+
+    def clear(self) -> None:
+        """Remove todas as regras."""
+        self.rules.clear()
+
+    def record(self, name: str, seconds: float, ok: bool) -> None:
+        """Registra o tempo até a página ficar pronta."""
+        stats = self.stats.setdefault(
+            name, {"navigations": 0, "failures": 0, "total_seconds": 0.0}
+        )
+        stats["navigations"] += 1
+        stats["total_seconds"] += seconds
+        if not ok:
+            stats["failures"] += 1
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Retorna navegações, falhas e tempo médio por estratégia."""
+        return {
+            name: {
+                **stats,
+                "mean_seconds": stats["total_seconds"] / stats["navigations"],
+            }
+            for name, stats in self.stats.items()
+        }
+
+
+# Instância global do registro de estratégias
+readiness_registry = ReadinessRegistry()
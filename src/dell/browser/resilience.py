@@ -0,0 +1,393 @@
+"""
+Resilience - Política de retry unificada e circuit breaker por host.
+
+Quando a Dell começa a limitar requisições, cada coroutine repetindo por
+conta própria só piora o bloqueio. Aqui os erros são classificados (só os
+transitórios são repetidos), o backoff segue o pace RETRY com jitter, e um
+breaker por host abre após N falhas seguidas: enquanto aberto, as chamadas
+falham na hora (liberando a página/worker) e, passado o tempo de espera,
+poucas sondagens decidem se ele fecha de novo.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from .block_detection import BlockedPageError
+from .errors import BrowserCrashedError, ElementNotFoundError, PageWaitTimeout
+from .pace_manager import OperationType, pace_manager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Falhas seguidas que abrem o breaker e tempo aberto antes das sondagens (s)
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+
+# Sondagens simultâneas permitidas com o breaker meio-aberto
+DEFAULT_HALF_OPEN_PROBES = 1
+
+# Teto do backoff (s) e multiplicador extra quando o servidor pede calma
+MAX_BACKOFF = 60.0
+THROTTLE_BACKOFF_FACTOR = 2.0
+
+# Status HTTP que indicam limitação/sobrecarga do servidor
+THROTTLE_STATUSES = {429, 503}
+
+# Categorias de erro que vale repetir e as que contam como falha do host.
+# 'blocked' só é repetido por quem troca de página/contexto (ex.: map_pages):
+# na mesma página a identidade bloqueada continua a mesma.
+RETRYABLE_CATEGORIES = frozenset(
+    {"timeout", "network", "throttled", "server", "crashed"}
+)
+HOST_FAILURE_CATEGORIES = frozenset(
+    {"timeout", "network", "throttled", "server", "blocked"}
+)
+
+# Trechos de mensagem de erros de rede/browser do Playwright
+_NETWORK_MARKERS = ("net::err_", "ns_error_", "econnreset", "econnrefused")
+_CRASH_MARKERS = ("target closed", "has been closed", "browser closed", "crashed")
+
+# OSError de sistema de arquivos: configuração/caminho errado, não rede
+_LOCAL_FILE_ERRORS = (
+    FileNotFoundError,
+    PermissionError,
+    IsADirectoryError,
+    NotADirectoryError,
+)
+
+
+class HttpStatusError(Exception):
+    """Resposta HTTP de erro tratada como falha da operação."""
+
+    def __init__(self, status: int, url: str = ""):
+        super().__init__(f"HTTP {status} para {url}" if url else f"HTTP {status}")
+        self.status = status
+        self.url = url
+
+
+class CircuitOpenError(Exception):
+    """Breaker do host aberto: a chamada falhou sem ser executada."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(
+            f"Circuit breaker aberto para {host} (nova sondagem em {retry_in:.1f}s)"
+        )
+        self.host = host
+        self.retry_in = retry_in
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Classifica o erro para decidir retry e contagem no breaker.
+
+    Returns:
+        str: 'timeout', 'network', 'throttled', 'server', 'crashed',
+        'blocked', 'missing', 'circuit_open', 'client' (HTTP 4xx) ou 'fatal'
+    """
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, BlockedPageError):
+        return "blocked"
+    if isinstance(error, HttpStatusError):
+        if error.status in THROTTLE_STATUSES:
+            return "throttled"
+        return "server" if error.status >= 500 else "client"
+    if isinstance(error, (PlaywrightTimeoutError, asyncio.TimeoutError)):
+        return "timeout"
+    if isinstance(error, PageWaitTimeout):
+        return error.category
+    if isinstance(error, ElementNotFoundError):
+        return "missing"
+    # Erros de arquivo local (HAR, storage state) não melhoram com retry,
+    # mas são OSError e cairiam em 'network'
+    if isinstance(error, _LOCAL_FILE_ERRORS):
+        return "fatal"
+
+    message = str(error).lower()
+    if isinstance(error, BrowserCrashedError) or any(
+        marker in message for marker in _CRASH_MARKERS
+    ):
+        return "crashed"
+    if isinstance(error, (ConnectionError, OSError)) or any(
+        marker in message for marker in _NETWORK_MARKERS
+    ):
+        return "network"
+    if isinstance(error, PlaywrightError) and "timeout" in message:
+        return "timeout"
+    return "fatal"
+
+
+def host_of(url: str) -> Optional[str]:
+    """Host da URL em minúsculas (ou None para about:blank, data:, ...)."""
+    host = urlsplit(url).hostname if "://" in url else None
+    return host.lower() if host else None
+
+
+class CircuitBreaker:
+    """
+    Breaker de um host: closed → open (após N falhas seguidas) → half-open
+    (após reset_timeout, libera sondagens) → closed (sondagem ok) ou open.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+        self.stats = {"opened": 0, "rejected": 0, "probes": 0, "failures": 0}
+
+    def retry_in(self) -> float:
+        """Segundos até o breaker aceitar sondagens (0 se não estiver aberto)."""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Reserva a execução de uma chamada; False se ela deve falhar na hora."""
+        if self.state == "open":
+            if self.retry_in() > 0:
+                self.stats["rejected"] += 1
+                return False
+            self.state = "half_open"
+            self.probes = 0
+            logger.info(f"Circuit breaker meio-aberto para {self.host}")
+
+        if self.state == "half_open":
+            if self.probes >= self.half_open_probes:
+                self.stats["rejected"] += 1
+                return False
+            self.probes += 1
+            self.stats["probes"] += 1
+
+        return True
+
+    def release(self) -> None:
+        """Devolve a vaga de sondagem de uma chamada sem resultado para o host."""
+        if self.state == "half_open" and self.probes > 0:
+            self.probes -= 1
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            logger.info(f"Circuit breaker fechado para {self.host}")
+        self.state = "closed"
+        self.failures = 0
+        self.probes = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.stats["failures"] += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        if self.state != "open":
+            self.stats["opened"] += 1
+            logger.warning(
+                f"Circuit breaker aberto para {self.host} após "
+                f"{self.failures} falhas (sondagem em {self.reset_timeout:.0f}s)"
+            )
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self.probes = 0
+
+
+class CircuitBreakerRegistry:
+    """Breakers por host, criados sob demanda com a mesma configuração."""
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.enabled = True
+
+    def configure(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        half_open_probes: Optional[int] = None,
+    ) -> None:
+        """Altera a configuração; breakers existentes são recriados."""
+        if failure_threshold is not None:
+            self.failure_threshold = failure_threshold
+        if reset_timeout is not None:
+            self.reset_timeout = reset_timeout
+        if half_open_probes is not None:
+            self.half_open_probes = half_open_probes
+        self.breakers.clear()
+
+    def breaker_for(self, url: str) -> Optional[CircuitBreaker]:
+        """Breaker do host da URL (None se desativado ou sem host)."""
+        host = host_of(url)
+        if not self.enabled or host is None:
+            return None
+
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = self.breakers[host] = CircuitBreaker(
+                host,
+                self.failure_threshold,
+                self.reset_timeout,
+                self.half_open_probes,
+            )
+        return breaker
+
+    def reset(self) -> None:
+        """Fecha todos os breakers."""
+        self.breakers.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Retorna estado e contadores por host."""
+        return {
+            host: {
+                **breaker.stats,
+                "state": breaker.state,
+                "consecutive_failures": breaker.failures,
+                "retry_in": breaker.retry_in(),
+            }
+            for host, breaker in self.breakers.items()
+        }
+
+
+# Instância global dos breakers por host
+circuit_breakers = CircuitBreakerRegistry()
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Quantas vezes repetir e quanto esperar entre tentativas.
+
+    O delay base é o do pace RETRY (nível, multiplicador e fator adaptativo
+    do pace_manager), dobrado a cada tentativa, com jitter
+    "equal" (metade fixa, metade aleatória) para dessincronizar coroutines.
+
+    Attributes:
+        max_attempts: Total de tentativas (1 = sem retry)
+        base_delay: Delay base em segundos (None = pace RETRY)
+        max_delay: Teto do backoff em segundos
+        jitter: Aplica jitter ao backoff
+        retry_on: Categorias de erro repetidas (ver classify_error)
+    """
+
+    max_attempts: int = 3
+    base_delay: Optional[float] = None
+    max_delay: float = MAX_BACKOFF
+    jitter: bool = True
+    retry_on: FrozenSet[str] = RETRYABLE_CATEGORIES
+
+    def backoff(self, attempt: int, category: str = "") -> float:
+        """
+        Delay antes da próxima tentativa.
+
+        Args:
+            attempt: Tentativa que falhou (1 = primeira)
+            category: Categoria do erro (limitação do servidor espera mais)
+        """
+        base = self.base_delay
+        if base is None:
+            base = pace_manager.get_delay(OperationType.RETRY)
+
+        delay = base * 2 ** (attempt - 1)
+        if category in ("throttled", "blocked"):
+            delay *= THROTTLE_BACKOFF_FACTOR
+        delay = min(delay, self.max_delay)
+
+        if self.jitter:
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+
+async def call_with_retry(
+    operation: Callable[[], Awaitable[T]],
+    url: Optional[str] = None,
+    policy: Optional[RetryPolicy] = None,
+    reason: str = "",
+    breakers: Optional[CircuitBreakerRegistry] = None,
+) -> T:
+    """
+    Executa a operação com retry classificado e breaker do host da URL.
+
+    Só as categorias de policy.retry_on são repetidas (até max_attempts);
+    as demais sobem na hora. Com url, falhas do host alimentam o
+    breaker e, com ele aberto, a chamada falha sem executar.
+
+    Args:
+        operation: Função async sem argumentos (uma tentativa)
+        url: URL da operação, para o breaker (None = sem breaker)
+        policy: Política de retry (padrão: RetryPolicy())
+        reason: Descrição para logs e contabilidade do pace
+        breakers: Registro de breakers (padrão: circuit_breakers global)
+
+    Returns:
+        Resultado da operação
+
+    Raises:
+        CircuitOpenError: Se o breaker do host estiver aberto
+        Exception: Último erro da operação
+    """
+    policy = policy or RetryPolicy()
+    breakers = breakers or circuit_breakers
+    breaker = breakers.breaker_for(url) if url else None
+
+    attempts = max(1, policy.max_attempts)
+    for attempt in range(1, attempts + 1):
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(breaker.host, breaker.retry_in())
+
+        try:
+            result = await operation()
+        except asyncio.CancelledError:
+            if breaker is not None:
+                breaker.release()
+            raise
+        except Exception as e:
+            category = classify_error(e)
+            if breaker is not None:
+                if category in HOST_FAILURE_CATEGORIES:
+                    breaker.record_failure()
+                else:
+                    breaker.release()
+
+            if category not in policy.retry_on or attempt == attempts:
+                raise
+
+            delay = policy.backoff(attempt, category)
+            logger.warning(
+                f"Tentativa {attempt} falhou ({category}): {str(e)} "
+                f"- nova tentativa em {delay:.1f}s"
+            )
+            await pace_manager.wait(
+                OperationType.RETRY, custom_delay=delay, reason=reason
+            )
+            continue
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
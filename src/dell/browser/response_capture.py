@@ -0,0 +1,231 @@
+"""
+ResponseCapture - Captura das respostas JSON (XHR/fetch) de páginas da Dell.
+Preços e specs chegam por chamadas JSON em background; capturá-las evita
+esperar renderização e consultar o DOM campo a campo.
+"""
+
+import asyncio
+import fnmatch
+import logging
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Union
+
+from playwright.async_api import BrowserContext, Page, Response
+
+from .errors import PageWaitTimeout
+
+logger = logging.getLogger(__name__)
+
+# Padrão de URL: glob ('*dell.com/api/price*'), regex compilada ou função(url)
+UrlPattern = Union[str, Pattern, Callable[[str], bool]]
+
+
+def compile_url_pattern(pattern: UrlPattern) -> Callable[[str], bool]:
+    """
+    Converte um padrão em função url -> bool.
+
+    Glob se houver curingas ('*?['), regex com search(), função usada como
+    está; texto sem curingas casa se aparecer em qualquer ponto da URL.
+    """
+    if callable(pattern) and not isinstance(pattern, re.Pattern):
+        return pattern
+    if isinstance(pattern, re.Pattern):
+        return lambda url: pattern.search(url) is not None
+    if any(char in pattern for char in "*?["):
+        return lambda url: fnmatch.fnmatchcase(url, pattern)
+    # Sem curingas: basta o trecho aparecer na URL
+    return lambda url: pattern in url
+
+
+class ResponseCapture:
+    """
+    Coleta corpos JSON de respostas cujo URL casa com padrões nomeados.
+
+    Uso:
+    >>> async with ResponseCapture(page, {"price": "*/api/price*"}) as capture:
+    >>>     await page.goto(url, wait_until="commit")
+    >>>     price = await capture.wait_for("price", timeout=10)
+    """
+
+    def __init__(
+        self,
+        target: Union[Page, BrowserContext],
+        patterns: Dict[str, UrlPattern],
+        max_items: int = 50,
+        stream: bool = False,
+    ):
+        """
+        Args:
+            target: Página ou contexto a observar
+            patterns: Nome → padrão de URL
+            max_items: Máximo de payloads guardados por nome (os mais antigos saem)
+            stream: Publicar (nome, url, payload) em 'queue' para consumo
+                contínuo; a fila guarda até max_items (os mais antigos saem)
+        """
+        self.target = target
+        self.max_items = max_items
+        self._matchers = {
+            name: compile_url_pattern(pattern) for name, pattern in patterns.items()
+        }
+
+        self.captured: Dict[str, List[Any]] = {name: [] for name in patterns}
+        self.queue: Optional[asyncio.Queue] = (
+            asyncio.Queue(maxsize=max_items) if stream else None
+        )
+        self.stats = {"matched": 0, "parsed": 0, "errors": 0}
+
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._tasks: set = set()
+        self._active = False
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    def start(self) -> None:
+        """Começa a observar respostas do alvo."""
+        if not self._active:
+            self.target.on("response", self._on_response)
+            self._active = True
+
+    async def stop(self) -> None:
+        """Para de observar e cancela leituras de corpo pendentes."""
+        if self._active:
+            self.target.remove_listener("response", self._on_response)
+            self._active = False
+
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        for waiters in self._waiters.values():
+            for future in waiters:
+                if not future.done():
+                    future.cancel()
+        self._waiters.clear()
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Último payload capturado para o nome (ou default)."""
+        items = self.captured.get(name)
+        return items[-1] if items else default
+
+    async def wait_for(
+        self, name: str, timeout: Optional[float] = 30.0, fresh: bool = False
+    ) -> Any:
+        """
+        Aguarda um payload do nome.
+
+        Args:
+            name: Nome do padrão
+            timeout: Tempo máximo em segundos
+            fresh: Só aceitar payload que chegue após a chamada (ex.: alvo
+                reaproveitado entre navegações); sem ele, o mais recente já
+                capturado retorna na hora
+
+        Returns:
+            Payload JSON decodificado
+
+        Raises:
+            PageWaitTimeout: Se o payload não chegar a tempo
+        """
+        if name not in self._matchers:
+            raise KeyError(f"Padrão '{name}' não registrado")
+
+        if self.captured[name] and not fresh:
+            return self.captured[name][-1]
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(name, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise PageWaitTimeout(f"Resposta '{name}' não capturada em {timeout}s")
+        finally:
+            waiters = self._waiters.get(name, [])
+            if future in waiters:
+                waiters.remove(future)
+
+    async def wait_for_all(
+        self, names: Optional[Iterable[str]] = None, timeout: Optional[float] = 30.0
+    ) -> Dict[str, Any]:
+        """
+        Aguarda um payload de cada nome, em paralelo, com timeout único.
+
+        Returns:
+            dict: Nome → payload
+        """
+        names = list(names) if names is not None else list(self._matchers)
+        results = await asyncio.gather(
+            *(self.wait_for(name, timeout) for name in names)
+        )
+        return dict(zip(names, results))
+
+    def _on_response(self, response: Response) -> None:
+        # Casamento de URL é síncrono e barato; o corpo só é lido se casar
+        url = response.url
+        names = [name for name, matches in self._matchers.items() if matches(url)]
+        if not names:
+            return
+
+        self.stats["matched"] += 1
+        task = asyncio.get_running_loop().create_task(self._read(response, names))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _read(self, response: Response, names: List[str]) -> None:
+        try:
+            data = await response.json()
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.debug(f"Resposta não-JSON ignorada {response.url}: {str(e)}")
+            return
+
+        self.stats["parsed"] += 1
+        for name in names:
+            items = self.captured[name]
+            items.append(data)
+            if len(items) > self.max_items:
+                items.pop(0)
+
+            if self.queue is not None:
+                # Consumidor lento não acumula memória: descarta o mais antigo
+                if self.queue.full():
+                    self.queue.get_nowait()
+                self.queue.put_nowait((name, response.url, data))
+            for future in self._waiters.pop(name, []):
+                if not future.done():
+                    future.set_result(data)
+
+
+async def goto_and_capture(
+    page: Page,
+    url: str,
+    patterns: Dict[str, UrlPattern],
+    required: Optional[Iterable[str]] = None,
+    timeout: float = 30.0,
+) -> Dict[str, Any]:
+    """
+    Navega e retorna assim que os payloads JSON necessários chegarem.
+
+    Usa wait_until='commit': não espera load/networkidle nem consulta o DOM.
+
+    Args:
+        page: Página do Playwright
+        url: URL de destino
+        patterns: Nome → padrão de URL das respostas a capturar
+        required: Nomes obrigatórios (padrão: todos os padrões)
+        timeout: Tempo máximo total em segundos
+
+    Returns:
+        dict: Nome → payload JSON
+
+    Raises:
+        PageWaitTimeout: Se algum payload obrigatório não chegar
+    """
+    async with ResponseCapture(page, patterns) as capture:
+        await page.goto(url, wait_until="commit", timeout=timeout * 1000)
+        return await capture.wait_for_all(required, timeout)
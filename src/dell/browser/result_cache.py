@@ -0,0 +1,193 @@
+"""
+ResultCache - Coalescência de operações em andamento e cache TTL+LRU por URL.
+
+Crawls de categoria encontram o mesmo produto em várias listagens/filtros.
+Chamadas concorrentes para a mesma URL compartilham uma única operação, e
+resultados concluídos ficam em cache por um tempo curto.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Tempo de vida dos resultados (segundos) e tamanho máximo do cache
+DEFAULT_CACHE_TTL = 300.0
+DEFAULT_CACHE_SIZE = 1000
+
+
+def normalize_url(url: str) -> str:
+    """Chave de cache da URL: esquema/host em minúsculas e sem fragmento."""
+    parts = urlsplit(url)
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, "")
+    )
+
+
+class ResultCache:
+    """
+    Cache de resultados por chave com coalescência de chamadas concorrentes.
+
+    Uso:
+    >>> cache = ResultCache(ttl=300, max_size=1000)
+    >>> product = await cache.get_or_compute(url, lambda: scrape(url))
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_CACHE_TTL, max_size: int = DEFAULT_CACHE_SIZE
+    ):
+        """
+        Args:
+            ttl: Tempo de vida de cada resultado em segundos
+            max_size: Máximo de resultados guardados (os menos usados saem)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+
+        # chave → (expira_em, valor), do menos para o mais recentemente usado
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # chave → [task, quantidade de chamadores aguardando]
+        self._inflight: Dict[str, list] = {}
+        # objeto (ex.: handler) → prefixo de chave; a referência forte impede
+        # que o id de um objeto liberado seja reaproveitado por outro
+        self._namespaces: Dict[Any, str] = {}
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "errors": 0,
+        }
+
+    def namespace(self, owner: Any) -> str:
+        """
+        Prefixo de chave exclusivo do objeto (ex.: o handler que produz os
+        resultados), estável enquanto o cache existir.
+
+        Objetos iguais (==) compartilham o prefixo: métodos ligados da mesma
+        instância são recriados a cada acesso, mas comparam iguais.
+
+        Raises:
+            TypeError: Se o objeto não for hashable
+        """
+        namespace = self._namespaces.get(owner)
+        if namespace is None:
+            name = getattr(owner, "__qualname__", type(owner).__qualname__)
+            namespace = f"{name}#{len(self._namespaces)}"
+            self._namespaces[owner] = namespace
+        return namespace
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Resultado em cache (não expirado) ou default, sem contar estatística."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return default
+        return entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """Guarda um resultado, removendo o menos usado se passar do limite."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Remove uma chave (ou tudo, se None)."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Retorna o resultado em cache, aguarda a operação em andamento para a
+        mesma chave, ou executa compute().
+
+        A operação compartilhada só é cancelada quando todos os chamadores
+        que a aguardam desistem. Exceções não são guardadas em cache.
+
+        Args:
+            key: Chave (ex.: normalize_url(url))
+            compute: Função async que produz o resultado
+            cache_if: Decide se o resultado vai para o cache (padrão: sempre)
+
+        Returns:
+            Resultado da operação
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] >= time.monotonic():
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[1]
+            del self._entries[key]
+            self.stats["expirations"] += 1
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.stats["misses"] += 1
+            task = asyncio.get_running_loop().create_task(compute())
+            inflight = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda done: self._on_done(key, done, cache_if))
+        else:
+            self.stats["coalesced"] += 1
+            logger.debug(f"Operação em andamento reutilizada: {key}")
+
+        task = inflight[0]
+        inflight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            inflight[1] -= 1
+            if inflight[1] == 0 and not task.done():
+                task.cancel()
+
+    def _on_done(
+        self,
+        key: str,
+        task: asyncio.Task,
+        cache_if: Optional[Callable[[Any], bool]],
+    ) -> None:
+        if self._inflight.get(key, [None])[0] is task:
+            del self._inflight[key]
+
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.stats["errors"] += 1
+            return
+
+        result = task.result()
+        if cache_if is None or cache_if(result):
+            self.put(key, result)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Retorna contadores de acerto/erro e ocupação do cache."""
+        lookups = self.stats["hits"] + self.stats["misses"] + self.stats["coalesced"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "inflight": len(self._inflight),
+            "hit_ratio": (
+                (self.stats["hits"] + self.stats["coalesced"]) / lookups
+                if lookups
+                else 0.0
+            ),
+        }
+
+
+# Instância global do cache de resultados
+result_cache = ResultCache()
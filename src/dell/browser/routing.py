@@ -0,0 +1,135 @@
+"""
+Resource routing - Bloqueio de recursos por tipo e por domínio.
+Aplicado por contexto a partir da chave 'resource_policy' dos perfis.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Request, Response, Route
+
+logger = logging.getLogger(__name__)
+
+
+def _host_matches(host: str, domains: Iterable[str]) -> bool:
+    """Verifica se o host é um dos domínios (ou subdomínio deles)."""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+class ResourcePolicy:
+    """
+    Política de bloqueio de requests de um contexto.
+
+    Ordem de decisão:
+    1. Domínio em block_domains → bloqueado
+    2. allow_domains definido e domínio fora da lista → bloqueado
+    3. Tipo de recurso em block_resource_types → bloqueado
+    """
+
+    def __init__(
+        self,
+        block_resource_types: Iterable[str] = (),
+        block_domains: Iterable[str] = (),
+        allow_domains: Optional[Iterable[str]] = None,
+    ):
+        self.block_resource_types = frozenset(block_resource_types)
+        self.block_domains = tuple(block_domains)
+        self.allow_domains = tuple(allow_domains) if allow_domains else None
+
+        self.stats: Dict[str, Any] = {
+            "allowed_requests": 0,
+            "allowed_bytes": 0,
+            "blocked_requests": 0,
+            "allowed_bytes_by_type": {},
+            "blocked_by_type": {},
+            "blocked_by_reason": {},
+        }
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Dict[str, Any]]
+    ) -> Optional["ResourcePolicy"]:
+        """
+        Cria política a partir do dicionário do perfil.
+
+        Returns:
+            ResourcePolicy ou None se o perfil não define bloqueios
+        """
+        if not config:
+            return None
+
+        return cls(
+            block_resource_types=config.get("block_resource_types", ()),
+            block_domains=config.get("block_domains", ()),
+            allow_domains=config.get("allow_domains"),
+        )
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        Retorna o motivo do bloqueio ou None se o request deve seguir.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            return None
+
+        host = (parts.hostname or "").lower()
+        if _host_matches(host, self.block_domains):
+            return "block_domain"
+        if self.allow_domains is not None and not _host_matches(
+            host, self.allow_domains
+        ):
+            return "not_allowed_domain"
+        if resource_type in self.block_resource_types:
+            return "resource_type"
+
+        return None
+
+    async def install(self, context: BrowserContext) -> None:
+        """Instala o roteamento e os contadores no contexto."""
+        await context.route("**/*", self._handle_route)
+        context.on("response", self._on_response)
+        logger.debug(
+            f"Política de recursos instalada: tipos={sorted(self.block_resource_types)}"
+        )
+
+    async def _handle_route(self, route: Route, request: Request) -> None:
+        reason = self.block_reason(request.resource_type, request.url)
+        if reason is None:
+            await route.fallback()
+            return
+
+        self.stats["blocked_requests"] += 1
+        by_type = self.stats["blocked_by_type"]
+        by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+        by_reason = self.stats["blocked_by_reason"]
+        by_reason[reason] = by_reason.get(reason, 0) + 1
+
+        await route.abort("blockedbyclient")
+
+    def _on_response(self, response: Response) -> None:
+        # Content-Length é o tamanho transferido; ausente em respostas chunked
+        length = response.headers.get("content-length", "")
+        size = int(length) if length.isdigit() else 0
+        resource_type = response.request.resource_type
+
+        self.stats["allowed_requests"] += 1
+        self.stats["allowed_bytes"] += size
+        by_type = self.stats["allowed_bytes_by_type"]
+        by_type[resource_type] = by_type.get(resource_type, 0) + size
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Retorna contadores de requests/bytes permitidos e bloqueados.
+
+        Requests bloqueados são abortados antes do download, então o
+        tamanho deles não é conhecido; apenas a contagem é registrada.
+        """
+        total = self.stats["allowed_requests"] + self.stats["blocked_requests"]
+        return {
+            **self.stats,
+            "allowed_bytes_by_type": dict(self.stats["allowed_bytes_by_type"]),
+            "blocked_by_type": dict(self.stats["blocked_by_type"]),
+            "blocked_by_reason": dict(self.stats["blocked_by_reason"]),
+            "blocked_ratio": self.stats["blocked_requests"] / total if total else 0.0,
+        }
@@ -0,0 +1,87 @@
+"""
+StorageStateStore - Persistência do storage state (cookies/localStorage) por perfil.
+Permite criar contextos já aquecidos (consentimento, locale, cookies negociados).
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Diretório padrão dos arquivos de storage state
+DEFAULT_STORAGE_STATE_DIR = ".browser_state"
+
+# Idade máxima do storage state antes de ser considerado velho (6h)
+DEFAULT_STORAGE_STATE_TTL = 6 * 60 * 60
+
+
+class StorageStateStore:
+    """
+    Armazena um arquivo JSON de storage state por perfil.
+    Gravação atômica para não corromper o arquivo com processos concorrentes.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_STORAGE_STATE_DIR,
+        ttl: float = DEFAULT_STORAGE_STATE_TTL,
+    ):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def path_for(self, profile_name: str) -> Path:
+        """Caminho do arquivo de storage state do perfil."""
+        return self.directory / f"{profile_name}.json"
+
+    def age(self, profile_name: str) -> Optional[float]:
+        """Idade do arquivo em segundos (None se não existe)."""
+        try:
+            return time.time() - self.path_for(profile_name).stat().st_mtime
+        except OSError:
+            return None
+
+    def is_fresh(self, profile_name: str) -> bool:
+        """Indica se existe storage state mais novo que o TTL."""
+        age = self.age(profile_name)
+        return age is not None and age < self.ttl
+
+    def load(self, profile_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Carrega o storage state do perfil se estiver fresco.
+
+        Returns:
+            dict: Storage state no formato do Playwright ou None
+        """
+        if not self.is_fresh(profile_name):
+            return None
+
+        try:
+            with open(self.path_for(profile_name), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Storage state de '{profile_name}' inválido: {str(e)}")
+            return None
+
+    def save(self, profile_name: str, state: Dict[str, Any]) -> None:
+        """Grava o storage state do perfil (escrita atômica)."""
+        path = self.path_for(profile_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+        logger.debug(f"Storage state de '{profile_name}' salvo em {path}")
+
+    def discard(self, profile_name: str) -> None:
+        """Remove o storage state do perfil (ex.: identidade bloqueada)."""
+        try:
+            self.path_for(profile_name).unlink()
+            logger.debug(f"Storage state de '{profile_name}' descartado")
+        except FileNotFoundError:
+            pass
@@ -1,28 +1,150 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Union
 
-from playwright.async_api import ElementHandle, Page
+from playwright.async_api import BrowserContext, ElementHandle, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from .block_detection import EARLY_WAIT_EVENTS, BlockedPageError, block_detector
+from .errors import ElementNotFoundError, PageWaitTimeout
 from .pace_manager import (
+    pace_manager,
     wait_click,
     wait_fill,
     wait_scroll,
 )
+from .presence import page_template, presence_memory
+from .proxy_pool import PROXY_FAILURE_STATUSES, proxy_pool
+from .rate_limiter import rate_limiter
+from .resilience import (
+    CircuitOpenError,
+    HttpStatusError,
+    RetryPolicy,
+    call_with_retry,
+    classify_error,
+)
+
+if TYPE_CHECKING:
+    from .readiness import ReadinessStrategy
 
 logger = logging.getLogger(__name__)
 
+# Tentativas de cliques/preenchimentos (navegação usa max_retries do safe_goto)
+DEFAULT_ACTION_RETRIES = 2
+
+# Contextos em replay de HAR (registrados pelo BrowserManager): não acessam a
+# rede, então o safe_goto não gasta rate limit nem alimenta o breaker do host
+replay_contexts: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+# Campo de extração: seletor CSS ou dict com selector/attribute/all/transform/default
+FieldSpec = Union[str, Dict[str, Any]]
+
+# Leitura de campos no browser: extract(root, fields) gera um registro com
+# seletores relativos a root (':scope' ou '' = o próprio root)
+_FIELD_READER_JS = """
+    const read = (el, attribute) => {
+        if (attribute === "text") return (el.textContent || "").trim();
+        if (attribute === "html") return el.innerHTML;
+        return el.getAttribute(attribute);
+    };
+    const query = (root, selector, all) => {
+        if (!selector || selector === ":scope") return root === document ? [] : [root];
+        if (all) return Array.from(root.querySelectorAll(selector));
+        const el = root.querySelector(selector);
+        return el ? [el] : [];
+    };
+    const extract = (root, fields) => {
+        const out = {};
+        for (const [name, field] of Object.entries(fields)) {
+            try {
+                const nodes = query(root, field.selector, field.all);
+                out[name] = field.all
+                    ? nodes.map((el) => read(el, field.attribute))
+                    : nodes.length ? read(nodes[0], field.attribute) : null;
+            } catch (e) {
+                out[name] = null;  // Seletor inválido conta como ausente
+            }
+        }
+        return out;
+    };
+"""
+
+# Lê todos os campos em um único page.evaluate (seletores CSS). Sem 'card',
+# extrai um registro do documento; com 'card', um registro por card
+_EXTRACT_FIELDS_JS = (
+    "({fields, card, offset, limit}) => {"
+    + _FIELD_READER_JS
+    + """
+    if (!card) return [extract(document, fields)];
+    const cards = Array.from(document.querySelectorAll(card));
+    return cards
+        .slice(offset, limit == null ? undefined : offset + limit)
+        .map((el) => extract(el, fields));
+}
+"""
+)
 
-class PageWaitTimeout(Exception):
-    """Exceção customizada para timeouts de espera."""
+# Harvester de scroll infinito: MutationObserver enfileira cards novos
+# (WeakSet evita duplicar nós já vistos)
+_HARVEST_INSTALL_JS = """
+(card) => {
+    const previous = window.__dellHarvest;
+    if (previous) previous.observer.disconnect();
+
+    const state = {seen: new WeakSet(), queue: []};
+    const collect = (node) => {
+        if (node.nodeType !== 1) return;
+        const found = node.matches(card) ? [node] : [];
+        found.push(...node.querySelectorAll(card));
+        for (const el of found) {
+            if (!state.seen.has(el)) {
+                state.seen.add(el);
+                state.queue.push(el);
+            }
+        }
+    };
+    collect(document.documentElement);
+    state.observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) mutation.addedNodes.forEach(collect);
+    });
+    state.observer.observe(document.documentElement, {childList: true, subtree: true});
+    window.__dellHarvest = state;
+}
+"""
+
+# Esvazia a fila extraindo os registros e, se pedido, rola até o fim
+_HARVEST_DRAIN_JS = (
+    "({fields, scroll}) => {"
+    + _FIELD_READER_JS
+    + """
+    const state = window.__dellHarvest;
+    const records = state ? state.queue.splice(0).map((el) => extract(el, fields)) : [];
+    const height = document.body.scrollHeight;
+    if (scroll) window.scrollTo(0, height);
+    return {records, height};
+}
+"""
+)
+
+_HARVEST_PENDING_JS = "() => (window.__dellHarvest?.queue.length || 0) > 0"
 
-    pass
+_HARVEST_STOP_JS = """
+() => {
+    if (window.__dellHarvest) window.__dellHarvest.observer.disconnect();
+    delete window.__dellHarvest;
+}
+"""
 
 
-class ElementNotFoundError(Exception):
-    """Exceção para elementos não encontrados."""
+class ExtractedFields(dict):
+    """Resultado de extract_fields(): dict campo → valor, com .missing."""
 
-    pass
+    def __init__(self, values: Dict[str, Any], missing: List[str]):
+        super().__init__(values)
+        self.missing = missing
 
 
 async def safe_goto(
@@ -31,50 +153,196 @@ async def safe_goto(
     wait_until: str = "networkidle",
     timeout: float = 30000,
     max_retries: int = 3,
+    readiness: Optional["ReadinessStrategy"] = None,
+    profile_name: Optional[str] = None,
+    detect_blocks: Optional[bool] = None,
+    raise_on_status: bool = False,
 ) -> bool:
     """
     Navega para URL com retry automático e tratamento de erros.
 
+    Os retries seguem a política do módulo resilience: só erros transitórios
+    (timeout, rede, 429/503, 5xx) são repetidos, com backoff do pace RETRY,
+    e o circuit breaker do host falha na hora quando ele está aberto.
+    Contextos em replay de HAR não passam pelo rate limit nem pelo breaker.
+
+    Sem 'readiness', usa a estratégia registrada para a URL/perfil no
+    readiness_registry; se nenhuma casar, espera por 'wait_until'.
+
     Args:
         page: Página do Playwright
         url: URL de destino
         wait_until: Estratégia de espera ('load', 'networkidle', 'commit')
         timeout: Timeout em ms
         max_retries: Máximo de tentativas
+        readiness: Estratégia de página pronta (seletor/resposta/predicado)
+        profile_name: Perfil da página, para escolher a estratégia registrada
+        detect_blocks: Verificar página de bloqueio/CAPTCHA após a navegação
+            (padrão: block_detector.enabled)
+        raise_on_status: Levantar HttpStatusError em vez de retornar False
+            para resposta HTTP de erro (após os retries)
 
     Returns:
-        bool: True se navegação foi bem-sucedida
+        bool: True se navegação foi bem-sucedida (False para resposta HTTP de erro)
 
     Raises:
-        PageWaitTimeout: Se timeout for atingido
+        PageWaitTimeout: Se a navegação falhar após os retries ('category'
+            mantém a classificação do erro original)
+        CircuitOpenError: Se o breaker do host estiver aberto
+        HttpStatusError: Resposta HTTP de erro, com raise_on_status
+        BlockedPageError: Se a página recebida for de bloqueio/desafio,
+            inclusive quando a espera expira depois do commit (sem retry na
+            mesma página; o contexto é rotacionado pelos listeners do
+            block_detector)
     """
-    for attempt in range(max_retries):
+    # Import tardio: readiness → response_capture → utils
+    from .readiness import readiness_registry
+
+    strategy = readiness or readiness_registry.resolve(url, profile_name)
+    if detect_blocks is None:
+        detect_blocks = block_detector.enabled
+    proxy = proxy_pool.proxy_for(page.context) if proxy_pool.enabled else None
+    replay = page.context in replay_contexts
+
+    async def attempt() -> None:
+        logger.debug(f"Navegando para {url}")
+
+        # Orçamento por host compartilhado entre páginas concorrentes
+        # (por IP, quando o contexto sai por um proxy do pool)
+        if proxy is not None:
+            await proxy_pool.acquire(proxy)
+        elif not replay:
+            await rate_limiter.acquire(url)
+
+        # Commit da navegação: um timeout depois dele pode ser a espera de
+        # readiness presa numa página de desafio, não uma rede lenta
+        committed = False
+
+        def on_frame_navigated(frame) -> None:
+            nonlocal committed
+            if frame == page.main_frame:
+                committed = True
+
+        started = time.monotonic()
+        page.on("framenavigated", on_frame_navigated)
         try:
-            logger.debug(f"Navegando para {url} (tentativa {attempt + 1})")
+            if strategy:
+                response = await strategy.navigate(page, url, timeout)
+            else:
+                response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+                readiness_registry.record(
+                    wait_until, time.monotonic() - started, ok=True
+                )
+        except Exception as e:
+            if isinstance(e, PlaywrightTimeoutError) and committed and detect_blocks:
+                # Desafio não renderiza o seletor/resposta esperado
+                verdict = await block_detector.detect(page, check_empty_body=False)
+                if verdict.blocked:
+                    pace_manager.report_response(429, time.monotonic() - started)
+                    raise BlockedPageError(verdict) from e
+            if isinstance(e, PlaywrightTimeoutError):
+                if not strategy:
+                    readiness_registry.record(
+                        wait_until, time.monotonic() - started, ok=False
+                    )
+                pace_manager.report_response(None, time.monotonic() - started)
+            # Timeout/erro de conexão também contam contra o proxy
+            if proxy is not None:
+                proxy_pool.record(proxy, ok=False)
+            raise
+        finally:
+            page.remove_listener("framenavigated", on_frame_navigated)
+
+        status = response.status if response else 200
+        if status < 400 and detect_blocks:
+            # Página que ainda não renderizou não é "vazia" por bloqueio
+            waited_for = strategy.wait_until if strategy else wait_until
+            early = waited_for in EARLY_WAIT_EVENTS
+            verdict = await block_detector.detect(page, check_empty_body=not early)
+            if verdict.blocked:
+                # Desafio com status 200 conta como 429 para o pace adaptativo
+                pace_manager.report_response(429, time.monotonic() - started)
+                raise BlockedPageError(verdict)
+
+        # Latência/status alimentam o pace adaptativo e a saúde do proxy
+        pace_manager.report_response(status, time.monotonic() - started)
+        if proxy is not None:
+            proxy_pool.record(
+                proxy,
+                ok=status not in PROXY_FAILURE_STATUSES,
+                latency=time.monotonic() - started,
+            )
 
-            response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+        if status >= 400:
+            raise HttpStatusError(status, url)
 
-            if response and response.status < 400:
-                logger.info(f"Navegação bem-sucedida para {url}")
-                return True
+    try:
+        await call_with_retry(
+            attempt,
+            url=None if replay else url,  # Sem breaker no replay
+            policy=RetryPolicy(max_attempts=max_retries),
+            reason=f"Navegação para {url}",
+        )
+    except CircuitOpenError as e:
+        logger.warning(str(e))
+        raise
+    except BlockedPageError:
+        raise
+    except HttpStatusError as e:
+        logger.warning(f"Resposta {str(e)}")
+        if raise_on_status:
+            raise
+        return False
+    except Exception as e:
+        raise PageWaitTimeout(
+            f"Falha na navegação para {url}: {str(e)}", category=classify_error(e)
+        ) from e
 
-            logger.warning(
-                f"Resposta HTTP {response.status if response else 'None'} para {url}"
-            )
+    logger.info(f"Navegação bem-sucedida para {url}")
+    return True
 
-        except Exception as e:
-            logger.warning(f"Tentativa {attempt + 1} falhou: {str(e)}")
-            if attempt == max_retries - 1:
-                raise PageWaitTimeout(
-                    f"Falha na navegação após {max_retries} tentativas: {str(e)}"
-                )
-            await asyncio.sleep(2**attempt)  # Backoff exponencial
 
-    return False
+async def _find_element(
+    page: Page,
+    selector: str,
+    timeout: float,
+    optional: Optional[bool] = None,
+    state: str = "visible",
+) -> Optional[ElementHandle]:
+    """
+    Localiza o elemento esperando até o timeout, ou sonda sem esperar se
+    for opcional (ou se costuma faltar no template da página).
+
+    Raises:
+        Exception: Erro do wait_for_selector (timeout) no modo com espera
+    """
+    template = page_template(page.url)
+    if optional is None:
+        optional = presence_memory.is_usually_absent(template, selector)
+
+    if optional:
+        element = await page.query_selector(selector)
+        presence_memory.record(template, selector, element is not None)
+        if element is None:
+            logger.debug(f"Elemento ausente (sondagem): {selector}")
+        return element
+
+    try:
+        element = await page.wait_for_selector(selector, timeout=timeout, state=state)
+    except PlaywrightTimeoutError:
+        presence_memory.record(template, selector, False)
+        raise
+
+    presence_memory.record(template, selector, element is not None)
+    return element
 
 
 async def wait_for_element(
-    page: Page, selector: str, timeout: float = 10000, state: str = "visible"
+    page: Page,
+    selector: str,
+    timeout: float = 10000,
+    state: str = "visible",
+    optional: Optional[bool] = None,
 ) -> Optional[ElementHandle]:
     """
     Espera por elemento com timeout customizado.
@@ -84,6 +352,8 @@ async def wait_for_element(
         selector: Seletor CSS/XPath
         timeout: Timeout em ms
         state: Estado desejado ('visible', 'attached', 'detached', 'hidden')
+        optional: True sonda sem esperar; None decide pela memória de
+            ausência do template ('visible'/'attached' apenas)
 
     Returns:
         ElementHandle ou None se não encontrado
@@ -94,9 +364,14 @@ async def wait_for_element(
     try:
         logger.debug(f"Aguardando elemento: {selector} (state: {state})")
 
-        await page.wait_for_selector(selector, timeout=timeout, state=state)
+        if state in ("visible", "attached"):
+            element = await _find_element(page, selector, timeout, optional, state)
+            if element is None:
+                raise ElementNotFoundError(f"Elemento '{selector}' ausente")
+        else:
+            await page.wait_for_selector(selector, timeout=timeout, state=state)
+            element = await page.query_selector(selector)
 
-        element = await page.query_selector(selector)
         if element:
             logger.debug(f"Elemento encontrado: {selector}")
             return element
@@ -114,25 +389,30 @@ async def safe_click(
     timeout: float = 10000,
     force: bool = False,
     wait_after: float = 1.0,
+    max_retries: int = DEFAULT_ACTION_RETRIES,
 ) -> bool:
     """
     Clique seguro com validações e retry.
 
+    Só falhas transitórias do clique (timeout, elemento recriado) são
+    repetidas; elemento não encontrado falha direto, sem outra espera.
+
     Args:
         page: Página do Playwright
         selector: Seletor do elemento
         timeout: Timeout para encontrar elemento
         force: Forçar clique mesmo se elemento não estiver visível
         wait_after: Espera após clique (segundos)
+        max_retries: Máximo de tentativas
 
     Returns:
         bool: True se clique foi bem-sucedido
     """
-    try:
+    started_at = time.monotonic()
+
+    async def attempt() -> None:
         # Aguardar elemento estar disponível
         element = await wait_for_element(page, selector, timeout)
-        if not element:
-            return False
 
         # Scroll para elemento se necessário
         await element.scroll_into_view_if_needed()
@@ -141,18 +421,25 @@ async def safe_click(
         await element.click(force=force)
         logger.debug(f"Clique executado: {selector}")
 
-        # Aguardar após clique usando pace inteligente
-        if wait_after > 0:
-            await wait_click(f"Pós-clique em {selector}")
-        else:
-            await wait_click(f"Clique em {selector}")
-
-        return True
-
+    try:
+        await call_with_retry(
+            attempt,
+            policy=RetryPolicy(max_attempts=max_retries),
+            reason=f"Clique em {selector}",
+        )
     except Exception as e:
         logger.error(f"Erro no clique '{selector}': {str(e)}")
         return False
 
+    # Aguardar após clique usando pace inteligente
+    # (desconta o tempo já gasto localizando e clicando)
+    if wait_after > 0:
+        await wait_click(f"Pós-clique em {selector}", started_at)
+    else:
+        await wait_click(f"Clique em {selector}", started_at)
+
+    return True
+
 
 async def safe_fill(
     page: Page,
@@ -160,6 +447,7 @@ async def safe_fill(
     value: str,
     clear_first: bool = True,
     timeout: float = 10000,
+    max_retries: int = DEFAULT_ACTION_RETRIES,
 ) -> bool:
     """
     Preenchimento seguro de campo de texto.
@@ -170,14 +458,15 @@ async def safe_fill(
         value: Valor a preencher
         clear_first: Limpar campo antes de preencher
         timeout: Timeout para encontrar elemento
+        max_retries: Máximo de tentativas (só falhas transitórias)
 
     Returns:
         bool: True se preenchimento foi bem-sucedido
     """
-    try:
+    started_at = time.monotonic()
+
+    async def attempt() -> None:
         element = await wait_for_element(page, selector, timeout)
-        if not element:
-            return False
 
         # Limpar campo se solicitado
         if clear_first:
@@ -187,18 +476,28 @@ async def safe_fill(
         await element.fill(value)
         logger.debug(f"Campo preenchido: {selector} = '{value[:50]}...'")
 
-        # Aguardar após preenchimento
-        await wait_fill(f"Preenchimento de {selector}")
-
-        return True
-
+    try:
+        await call_with_retry(
+            attempt,
+            policy=RetryPolicy(max_attempts=max_retries),
+            reason=f"Preenchimento de {selector}",
+        )
     except Exception as e:
         logger.error(f"Erro ao preencher '{selector}': {str(e)}")
         return False
 
+    # Aguardar após preenchimento
+    await wait_fill(f"Preenchimento de {selector}", started_at)
+
+    return True
+
 
 async def extract_text(
-    page: Page, selector: str, timeout: float = 5000, default: str = ""
+    page: Page,
+    selector: str,
+    timeout: float = 5000,
+    default: str = "",
+    optional: Optional[bool] = None,
 ) -> str:
     """
     Extrai texto de elemento com fallback.
@@ -208,12 +507,14 @@ async def extract_text(
         selector: Seletor do elemento
         timeout: Timeout para encontrar elemento
         default: Valor padrão se elemento não encontrado
+        optional: True sonda sem esperar (campo opcional); None decide pela
+            memória de ausência do template da página
 
     Returns:
         str: Texto extraído ou valor padrão
     """
     try:
-        element = await page.wait_for_selector(selector, timeout=timeout)
+        element = await _find_element(page, selector, timeout, optional)
         if element:
             text = await element.text_content()
             return text.strip() if text else default
@@ -225,7 +526,12 @@ async def extract_text(
 
 
 async def extract_attribute(
-    page: Page, selector: str, attribute: str, timeout: float = 5000, default: str = ""
+    page: Page,
+    selector: str,
+    attribute: str,
+    timeout: float = 5000,
+    default: str = "",
+    optional: Optional[bool] = None,
 ) -> str:
     """
     Extrai atributo de elemento.
@@ -236,12 +542,14 @@ async def extract_attribute(
         attribute: Nome do atributo
         timeout: Timeout para encontrar elemento
         default: Valor padrão se não encontrado
+        optional: True sonda sem esperar (campo opcional); None decide pela
+            memória de ausência do template da página
 
     Returns:
         str: Valor do atributo ou padrão
     """
     try:
-        element = await page.wait_for_selector(selector, timeout=timeout)
+        element = await _find_element(page, selector, timeout, optional)
         if element:
             value = await element.get_attribute(attribute)
             return value or default
@@ -252,6 +560,227 @@ async def extract_attribute(
     return default
 
 
+def _normalize_field(field: FieldSpec) -> Dict[str, Any]:
+    if isinstance(field, str):
+        field = {"selector": field}
+    return {
+        "selector": field["selector"],
+        "attribute": field.get("attribute", "text"),
+        "all": field.get("all", False),
+        "transform": field.get("transform"),
+        "default": field.get("default", [] if field.get("all") else ""),
+    }
+
+
+async def extract_fields(
+    page: Page,
+    spec: Dict[str, FieldSpec],
+    wait_for: Optional[str] = None,
+    timeout: float = 5000,
+) -> ExtractedFields:
+    """
+    Extrai vários campos em uma única ida ao browser.
+
+    extract_text/extract_attribute fazem 2-3 round trips por campo; aqui
+    todos os campos saem de um page.evaluate.
+
+    Args:
+        page: Página do Playwright
+        spec: Campo → seletor CSS ou dict com:
+            selector: Seletor CSS
+            attribute: 'text' (padrão), 'html' ou nome do atributo
+            all: True para lista com todos os elementos
+            transform: Função aplicada ao valor bruto (ex.: parse de preço)
+            default: Valor quando ausente ('' ou [] por padrão)
+        wait_for: Seletor aguardado uma vez antes da extração
+        timeout: Timeout do wait_for em ms
+
+    Returns:
+        ExtractedFields: Dict campo → valor; .missing lista campos ausentes
+
+    Example:
+        >>> product = await extract_fields(page, {
+        >>>     "title": "h1.product-title",
+        >>>     "price": {"selector": ".ps-dell-price", "transform": parse_price},
+        >>>     "image": {"selector": "img.hero", "attribute": "src"},
+        >>> })
+    """
+    fields = {name: _normalize_field(field) for name, field in spec.items()}
+
+    if wait_for:
+        await _wait_optional(page, wait_for, timeout)
+
+    try:
+        raw = (await _evaluate_fields(page, fields))[0]
+    except Exception as e:
+        logger.error(f"Erro na extração em lote: {str(e)}")
+        raw = {}
+
+    result = _apply_fields(fields, raw)
+    if result.missing:
+        logger.debug(f"Campos ausentes: {', '.join(result.missing)}")
+
+    return result
+
+
+async def extract_cards(
+    page: Page,
+    card_selector: str,
+    spec: Dict[str, FieldSpec],
+    wait_for: bool = True,
+    timeout: float = 5000,
+) -> List[ExtractedFields]:
+    """
+    Extrai todos os cards repetidos (ex.: produtos de uma listagem) de uma vez.
+
+    Um único page.evaluate percorre os cards e aplica o spec de campos com
+    seletores relativos a cada card.
+
+    Args:
+        page: Página do Playwright
+        card_selector: Seletor CSS dos cards
+        spec: Campo → seletor relativo ao card (formato de extract_fields)
+        wait_for: Aguardar o primeiro card antes de extrair
+        timeout: Timeout da espera em ms
+
+    Returns:
+        list: Um ExtractedFields por card, na ordem do documento
+
+    Example:
+        >>> products = await extract_cards(page, "article.ps-stack", {
+        >>>     "title": "h3 a",
+        >>>     "url": {"selector": "h3 a", "attribute": "href"},
+        >>>     "price": ".ps-dell-price",
+        >>> })
+    """
+    fields = {name: _normalize_field(field) for name, field in spec.items()}
+
+    if wait_for:
+        await _wait_optional(page, card_selector, timeout)
+
+    try:
+        raw_cards = await _evaluate_fields(page, fields, card_selector)
+    except Exception as e:
+        logger.error(f"Erro na extração de cards '{card_selector}': {str(e)}")
+        return []
+
+    logger.debug(f"{len(raw_cards)} cards extraídos de '{card_selector}'")
+    return [_apply_fields(fields, raw) for raw in raw_cards]
+
+
+async def iter_cards(
+    page: Page,
+    card_selector: str,
+    spec: Dict[str, FieldSpec],
+    chunk_size: int = 100,
+    wait_for: bool = True,
+    timeout: float = 5000,
+) -> AsyncIterator[List[ExtractedFields]]:
+    """
+    Variante em blocos de extract_cards para listagens muito longas.
+
+    Cada bloco é um page.evaluate com até chunk_size cards, evitando
+    serializar centenas de registros de uma vez.
+
+    Args:
+        page: Página do Playwright
+        card_selector: Seletor CSS dos cards
+        spec: Campo → seletor relativo ao card
+        chunk_size: Cards por bloco
+        wait_for: Aguardar o primeiro card antes de extrair
+        timeout: Timeout da espera em ms
+
+    Yields:
+        list: Bloco de ExtractedFields
+
+    Example:
+        >>> async for chunk in iter_cards(page, "article.ps-stack", spec):
+        >>>     save(chunk)
+    """
+    fields = {name: _normalize_field(field) for name, field in spec.items()}
+
+    if wait_for:
+        await _wait_optional(page, card_selector, timeout)
+
+    offset = 0
+    while True:
+        try:
+            raw_cards = await _evaluate_fields(
+                page, fields, card_selector, offset, chunk_size
+            )
+        except Exception as e:
+            logger.error(f"Erro na extração de cards (offset {offset}): {str(e)}")
+            return
+
+        if raw_cards:
+            yield [_apply_fields(fields, raw) for raw in raw_cards]
+
+        if len(raw_cards) < chunk_size:
+            return
+        offset += chunk_size
+
+
+async def _wait_optional(page: Page, selector: str, timeout: float) -> None:
+    try:
+        await page.wait_for_selector(selector, timeout=timeout)
+    except Exception as e:
+        logger.debug(f"Seletor de espera não encontrado '{selector}': {str(e)}")
+
+
+async def _evaluate_fields(
+    page: Page,
+    fields: Dict[str, Dict[str, Any]],
+    card_selector: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    return await page.evaluate(
+        _EXTRACT_FIELDS_JS,
+        {
+            "fields": {
+                name: {k: f[k] for k in ("selector", "attribute", "all")}
+                for name, f in fields.items()
+            },
+            "card": card_selector,
+            "offset": offset,
+            "limit": limit,
+        },
+    )
+
+
+def _default_value(field: Dict[str, Any]) -> Any:
+    # Cópia para que registros diferentes não compartilhem a mesma lista
+    default = field["default"]
+    return default.copy() if isinstance(default, (list, dict)) else default
+
+
+def _apply_fields(
+    fields: Dict[str, Dict[str, Any]], raw: Dict[str, Any]
+) -> ExtractedFields:
+    """Aplica defaults e transformações aos valores brutos do browser."""
+    values: Dict[str, Any] = {}
+    missing: List[str] = []
+    for name, field in fields.items():
+        value = raw.get(name)
+        if value is None or value == "" or value == []:
+            values[name] = _default_value(field)
+            missing.append(name)
+            continue
+
+        if field["transform"]:
+            try:
+                value = field["transform"](value)
+            except Exception as e:
+                logger.debug(f"Transformação falhou para '{name}': {str(e)}")
+                values[name] = _default_value(field)
+                missing.append(name)
+                continue
+
+        values[name] = value
+
+    return ExtractedFields(values, missing)
+
+
 async def scroll_to_bottom(
     page: Page, delay: float = 1.0, max_scrolls: int = 10
 ) -> None:
@@ -267,6 +796,8 @@ async def scroll_to_bottom(
         logger.debug("Iniciando scroll até o final da página")
 
         for i in range(max_scrolls):
+            started_at = time.monotonic()
+
             # Obter altura atual
             prev_height = await page.evaluate("document.body.scrollHeight")
 
@@ -274,7 +805,7 @@ async def scroll_to_bottom(
             await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
 
             # Aguardar carregamento com pace inteligente
-            await wait_scroll(f"Scroll {i + 1}/{max_scrolls}")
+            await wait_scroll(f"Scroll {i + 1}/{max_scrolls}", started_at)
 
             # Verificar se altura mudou (novo conteúdo carregou)
             new_height = await page.evaluate("document.body.scrollHeight")
@@ -289,6 +820,107 @@ async def scroll_to_bottom(
         logger.error(f"Erro durante scroll: {str(e)}")
 
 
+async def harvest_scroll(
+    page: Page,
+    card_selector: str,
+    spec: Dict[str, FieldSpec],
+    target_count: Optional[int] = None,
+    max_scrolls: int = 50,
+    idle_timeout: float = 3000,
+    stable_rounds: int = 2,
+    unique_by: Optional[str] = None,
+) -> AsyncIterator[ExtractedFields]:
+    """
+    Rola uma listagem infinita entregando só os cards recém-inseridos.
+
+    Um MutationObserver na página enfileira os cards novos; cada rodada
+    extrai a fila e rola no mesmo page.evaluate, e depois espera novos cards
+    chegarem (não um intervalo fixo). O consumidor processa os itens
+    enquanto o scroll continua, e nada é relido.
+
+    Args:
+        page: Página do Playwright
+        card_selector: Seletor CSS dos cards
+        spec: Campo → seletor relativo ao card (formato de extract_fields)
+        target_count: Para ao atingir esse número de registros
+        max_scrolls: Máximo de scrolls
+        idle_timeout: Espera máxima por novos cards após cada scroll (ms)
+        stable_rounds: Rodadas sem cards novos e sem mudança de altura para parar
+        unique_by: Campo usado para descartar registros repetidos (re-render)
+
+    Yields:
+        ExtractedFields: Um registro por card novo
+
+    Example:
+        >>> async for product in harvest_scroll(page, "article.ps-stack", spec):
+        >>>     await save(product)
+    """
+    fields = {name: _normalize_field(field) for name, field in spec.items()}
+    js_fields = {
+        name: {k: f[k] for k in ("selector", "attribute", "all")}
+        for name, f in fields.items()
+    }
+
+    await page.evaluate(_HARVEST_INSTALL_JS, card_selector)
+    seen_keys = set()
+    total = 0
+    stable = 0
+    prev_height = None
+
+    try:
+        for scroll in range(max_scrolls + 1):
+            started_at = time.monotonic()
+            batch = await page.evaluate(
+                _HARVEST_DRAIN_JS,
+                {"fields": js_fields, "scroll": scroll < max_scrolls},
+            )
+
+            new_records = 0
+            for raw in batch["records"]:
+                record = _apply_fields(fields, raw)
+                if unique_by is not None:
+                    key = record.get(unique_by)
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+
+                yield record
+                total += 1
+                new_records += 1
+                if target_count is not None and total >= target_count:
+                    logger.debug(f"Harvest: {total} registros (meta atingida)")
+                    return
+
+            # Fim da listagem: nada novo e altura parada por stable_rounds
+            if new_records == 0 and batch["height"] == prev_height:
+                stable += 1
+                if stable >= stable_rounds:
+                    logger.debug(f"Harvest: fim da listagem após {scroll} scrolls")
+                    return
+            else:
+                stable = 0
+            prev_height = batch["height"]
+
+            if scroll == max_scrolls:
+                break
+
+            try:
+                await page.wait_for_function(_HARVEST_PENDING_JS, timeout=idle_timeout)
+            except PlaywrightTimeoutError:
+                pass
+
+            # Intervalo mínimo entre scrolls, descontando a espera acima
+            await wait_scroll(f"Harvest scroll {scroll + 1}/{max_scrolls}", started_at)
+
+        logger.debug(f"Harvest: {total} registros em {max_scrolls} scrolls")
+
+    finally:
+        try:
+            await page.evaluate(_HARVEST_STOP_JS)
+        except Exception as e:
+            logger.debug(f"Erro ao remover observer do harvest: {str(e)}")
+
+
 async def take_screenshot(
     page: Page, path: str, full_page: bool = True, quality: Optional[int] = 80
 ) -> bool:
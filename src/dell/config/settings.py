@@ -1,19 +1,55 @@
-from dynaconf import Dynaconf
-
-settings = Dynaconf(
-    envvar_prefix="DELL",
-    settings_files=["settings.toml", ".secrets.toml"],
-    environments=True,
-    load_dotenv=True,  # Carrega .env automaticamente
-)
-
-# Configuração do Rich Logging baseada no ambiente
-LOGGING_CONFIG = {
-    "rich_enabled": settings.get("rich_logging", True),
-    "environment": "development" if settings.debug else "production",
-    "console_output": settings.get("console_logging", True),
-    "file_output": settings.get("file_logging", True),
-}
+from functools import lru_cache
+from typing import Any, Dict
+
+
+@lru_cache(maxsize=None)
+def get_settings():
+    """
+    Cria o objeto Dynaconf na primeira utilização.
+
+    Importar o Dynaconf e ler settings.toml/.env custa caro no cold start;
+    comandos que não usam configuração não pagam esse custo.
+    """
+    from dynaconf import Dynaconf
+
+    return Dynaconf(
+        envvar_prefix="DELL",
+        settings_files=["settings.toml", ".secrets.toml"],
+        environments=True,
+        load_dotenv=True,  # Carrega .env automaticamente
+    )
+
+
+class _LazySettings:
+    """Proxy que delega para o Dynaconf, criado só no primeiro acesso."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return "<LazySettings>"
+
+
+settings = _LazySettings()
+
+
+@lru_cache(maxsize=None)
+def get_logging_config() -> Dict[str, Any]:
+    """Configuração do Rich Logging baseada no ambiente."""
+    return {
+        "rich_enabled": settings.get("rich_logging", True),
+        "environment": "development" if settings.debug else "production",
+        "console_output": settings.get("console_logging", True),
+        "file_output": settings.get("file_logging", True),
+    }
+
+
+def __getattr__(name: str) -> Any:
+    # LOGGING_CONFIG avaliado sob demanda (compatibilidade com o import antigo)
+    if name == "LOGGING_CONFIG":
+        return get_logging_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Uso no código:
 # settings.DATABASE_PASSWORD  # Vem do .env ou .secrets.toml
@@ -1,10 +1,11 @@
 # src/dell/main.py (novo)
 from dell.config.rich_logging import setup_rich_logging
-from dell.config.settings import LOGGING_CONFIG
+from dell.config.settings import get_logging_config
 
 
 def configure_app():
     """Configuração inicial da aplicação."""
+    LOGGING_CONFIG = get_logging_config()
 
     # Configurar logging bonito
     if LOGGING_CONFIG["rich_enabled"]:
@@ -0,0 +1,124 @@
+"""
+BlockDetector sem browser: classify() sobre snapshots e check_html() sobre
+HTML bruto (caminho do HttpFetcher), com as estatísticas por host.
+"""
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from dell.browser.block_detection import BlockDetector  # noqa: E402
+
+PRODUCT_URL = "https://www.dell.com/pt-br/shop/notebooks/spd/xps-13"
+
+PRODUCT_HTML = (
+    "<html><head><title>Notebook XPS 13 | Dell Brasil</title>"
+    "<script src='https://www.dell.com/assets/app.js'></script></head>"
+    "<body><h1>XPS 13</h1><p>" + "Especificações técnicas. " * 20 + "</p></body></html>"
+)
+
+
+def snapshot(**fields):
+    """Snapshot de página real, com os campos informados sobrescritos."""
+    return {
+        "url": PRODUCT_URL,
+        "title": "Notebook XPS 13 | Dell Brasil",
+        "text_length": 5000,
+        "selectors": [],
+        "scripts": [],
+        **fields,
+    }
+
+
+@pytest.mark.parametrize(
+    "fields, reason",
+    [
+        ({"title": "Just a moment..."}, "title:just a moment"),
+        ({"title": "Acesso Negado"}, "title:acesso negado"),
+        (
+            {"url": "https://www.dell.com/cdn-cgi/challenge-platform/h/b"},
+            "url:/cdn-cgi/challenge-platform",
+        ),
+        ({"selectors": ["#px-captcha"]}, "dom:#px-captcha"),
+        (
+            {"scripts": ["https://challenges.cloudflare.com/turnstile/v0/api.js"]},
+            "script:challenges.cloudflare.com",
+        ),
+    ],
+)
+def test_classify_challenge_signals(fields, reason):
+    verdict = BlockDetector().classify(snapshot(**fields))
+
+    assert verdict.blocked
+    assert verdict.reason == reason
+    assert verdict.kind == reason.split(":")[0]
+
+
+def test_classify_real_page_is_not_blocked():
+    verdict = BlockDetector().classify(snapshot())
+
+    assert not verdict.blocked and verdict.reason is None
+
+
+def test_empty_body_only_when_enabled_and_requested():
+    empty = snapshot(text_length=10)
+
+    # Desativado por padrão: shell de JS não é bloqueio
+    assert not BlockDetector().classify(empty).blocked
+
+    detector = BlockDetector(min_text_length=200)
+    assert detector.classify(empty).reason == "empty_body"
+    # Navegação que retornou antes de renderizar não conta como vazia
+    assert not detector.classify(empty, check_empty_body=False).blocked
+
+
+def test_check_html_detects_challenge_from_raw_html():
+    html = (
+        "<html><head><title>Just a moment...</title></head>"
+        "<body>Verificando o navegador</body></html>"
+    )
+    verdict = BlockDetector().check_html(PRODUCT_URL, html)
+
+    assert verdict.blocked and verdict.reason == "title:just a moment"
+
+
+def test_check_html_detects_challenge_script():
+    html = (
+        "<html><head><title>Dell</title>"
+        '<script src="https://geo.captcha-delivery.com/captcha/?initialCid=x">'
+        "</script></head><body></body></html>"
+    )
+    verdict = BlockDetector().check_html(PRODUCT_URL, html)
+
+    assert verdict.reason == "script:captcha-delivery.com"
+
+
+def test_check_html_counts_only_visible_text():
+    detector = BlockDetector(min_text_length=200)
+    # Muito HTML, pouco texto: scripts e tags não contam
+    shell = (
+        "<html><head><title>Dell</title><script>"
+        + "var x = 1;" * 100
+        + "</script></head><body><div id='root'></div></body></html>"
+    )
+
+    assert detector.check_html(PRODUCT_URL, shell).reason == "empty_body"
+    assert not detector.check_html(PRODUCT_URL, PRODUCT_HTML).blocked
+    assert not detector.check_html(PRODUCT_URL, shell, check_empty_body=False).blocked
+
+
+def test_statistics_per_host():
+    detector = BlockDetector()
+    detector.check_html(PRODUCT_URL, PRODUCT_HTML)
+    detector.classify(snapshot(title="Access Denied"))
+    detector.classify(snapshot(url="https://outra.dell.test/captcha"))
+
+    stats = detector.get_statistics()
+    assert stats["www.dell.com"]["checked"] == 2
+    assert stats["www.dell.com"]["blocked"] == 1
+    assert stats["www.dell.com"]["block_rate"] == 0.5
+    assert stats["www.dell.com"]["reasons"] == {"title": 1}
+    assert stats["outra.dell.test"]["reasons"] == {"url": 1}
+
+    detector.reset_statistics()
+    assert detector.get_statistics() == {}
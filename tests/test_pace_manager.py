@@ -0,0 +1,128 @@
+"""
+Contabilidade do pace sem browser: tempo dormido por tipo, motivo e task,
+histograma de sleeps e o desconto das esperas por deadline.
+"""
+
+import asyncio
+import time
+
+from dell.browser.pace_manager import (
+    MAX_ACCOUNTING_KEYS,
+    OperationType,
+    PaceAccounting,
+    PaceLevel,
+    PaceManager,
+)
+
+
+def record_all(accounting, records):
+    """Registra (tipo, motivo, segundos) dentro de uma task, como o wait()."""
+
+    async def main():
+        for operation_type, reason, seconds in records:
+            accounting.record(operation_type, reason, seconds)
+
+    asyncio.run(main())
+
+
+def test_record_groups_by_type_reason_and_task():
+    accounting = PaceAccounting()
+    record_all(
+        accounting,
+        [
+            (OperationType.SCROLL, "Scroll 1/10", 0.3),
+            (OperationType.SCROLL, "Scroll 2/10", 0.3),
+            (OperationType.CLICK, "", 0.0),
+        ],
+    )
+    snapshot = accounting.snapshot()
+
+    assert snapshot["by_type"]["scroll"]["waits"] == 2
+    assert snapshot["by_type"]["scroll"]["seconds"] == 0.6
+    # Números do motivo viram '#': uma linha para todos os scrolls
+    assert snapshot["by_reason"]["Scroll #/#"]["mean"] == 0.3
+    assert snapshot["by_reason"]["(sem motivo)"]["waits"] == 1
+    assert snapshot["slept_seconds"] == 0.6
+    assert sum(task["waits"] for task in snapshot["by_task"].values()) == 3
+
+
+def test_histogram_buckets():
+    accounting = PaceAccounting()
+    record_all(
+        accounting,
+        [(OperationType.RETRY, "retry", s) for s in (0.0, 0.07, 0.3, 0.3, 10.0)],
+    )
+
+    histogram = accounting.snapshot()["by_type"]["retry"]["histogram"]
+    assert histogram["<=0s"] == 1
+    assert histogram["<=0.1s"] == 1
+    assert histogram["<=0.5s"] == 2
+    assert histogram["inf"] == 1
+    assert sum(histogram.values()) == 5
+
+
+def test_reasons_beyond_limit_go_to_outros():
+    accounting = PaceAccounting()
+    # Letras não são normalizadas: cada motivo é uma chave distinta
+    reasons = [
+        "".join(chr(ord("a") + int(digit)) for digit in str(index))
+        for index in range(MAX_ACCOUNTING_KEYS + 10)
+    ]
+    record_all(accounting, [(OperationType.CLICK, r, 0.0) for r in reasons])
+
+    by_reason = accounting.snapshot()["by_reason"]
+    assert len(by_reason) == MAX_ACCOUNTING_KEYS + 1
+    assert by_reason["outros"]["waits"] == 10
+
+
+def test_reset_starts_a_new_window():
+    accounting = PaceAccounting()
+    record_all(accounting, [(OperationType.CLICK, "botão", 0.2)])
+    accounting.reset()
+
+    snapshot = accounting.snapshot()
+    assert snapshot["slept_seconds"] == 0.0
+    assert snapshot["by_type"] == {} and snapshot["by_task"] == {}
+
+
+def test_wait_records_actual_sleep_per_task():
+    manager = PaceManager(PaceLevel.TURBO)
+
+    async def worker(name):
+        asyncio.current_task().set_name(name)
+        await manager.wait(OperationType.CLICK, custom_delay=0.02, reason="clique")
+
+    async def main():
+        await asyncio.gather(worker("pagina-1"), worker("pagina-2"))
+
+    asyncio.run(main())
+    snapshot = manager.get_statistics()["time_accounting"]
+
+    assert set(snapshot["by_task"]) == {"pagina-1", "pagina-2"}
+    assert snapshot["by_type"]["click"]["waits"] == 2
+    assert snapshot["by_type"]["click"]["seconds"] >= 0.04
+
+
+def test_deadline_wait_only_sleeps_the_remainder():
+    manager = PaceManager(PaceLevel.TURBO)
+
+    async def main():
+        # Operação mais lenta que o delay: nada a dormir
+        await manager.wait(
+            OperationType.CLICK,
+            custom_delay=0.05,
+            started_at=time.monotonic() - 1.0,
+        )
+        # Operação instantânea: dorme o delay inteiro
+        await manager.wait(
+            OperationType.CLICK, custom_delay=0.02, started_at=time.monotonic()
+        )
+
+    asyncio.run(main())
+    stats = manager.get_statistics()
+
+    assert stats["deadline"]["waits"] == 2
+    assert stats["deadline"]["overlapped"] == 1
+    assert stats["deadline"]["saved_seconds"] >= 0.05
+    histogram = stats["time_accounting"]["by_type"]["click"]["histogram"]
+    assert histogram["<=0s"] == 1 and histogram["<=0.05s"] == 1
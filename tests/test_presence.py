@@ -0,0 +1,86 @@
+"""
+PresenceMemory sem browser: template por URL e os limiares que decidem
+quando um seletor é tratado como "geralmente ausente".
+"""
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from dell.browser.presence import (  # noqa: E402
+    RECHECK_INTERVAL,
+    PresenceMemory,
+    page_template,
+)
+
+TEMPLATE = "www.dell.com/pt-br/shop/notebooks/spd"
+BADGE = ".ps-discount-badge"
+
+
+def observe(memory, present, absent, selector=BADGE):
+    for _ in range(present):
+        memory.record(TEMPLATE, selector, True)
+    for _ in range(absent):
+        memory.record(TEMPLATE, selector, False)
+
+
+def test_template_groups_products_of_a_category():
+    first = page_template("https://www.dell.com/pt-br/shop/notebooks/spd/xps-13-9340")
+    second = page_template("https://www.dell.com/pt-br/shop/notebooks/spd/vostro-3520")
+
+    assert first == second == TEMPLATE
+    assert page_template("https://www.dell.com/pt-br/shop/cty/pdp/spd/x1") == (
+        "www.dell.com/pt-br/shop/cty/pdp/spd"
+    )
+    # Números no caminho viram '#'
+    assert page_template("https://www.dell.com/pt-br/2024/ofertas/a") == (
+        "www.dell.com/pt-br/#/ofertas"
+    )
+
+
+def test_needs_min_observations_before_trusting_absence():
+    memory = PresenceMemory(min_observations=5, absent_ratio=0.1)
+
+    observe(memory, present=0, absent=4)
+    assert not memory.is_usually_absent(TEMPLATE, BADGE)
+
+    observe(memory, present=0, absent=1)
+    assert memory.is_usually_absent(TEMPLATE, BADGE)
+
+
+def test_absent_ratio_threshold():
+    memory = PresenceMemory(min_observations=5, absent_ratio=0.1)
+
+    observe(memory, present=1, absent=9)  # 10% presente: no limite
+    assert memory.is_usually_absent(TEMPLATE, BADGE)
+
+    observe(memory, present=1, absent=0)  # 2 de 11: acima do limite
+    assert not memory.is_usually_absent(TEMPLATE, BADGE)
+
+
+def test_periodic_recheck_forces_full_wait():
+    memory = PresenceMemory(min_observations=5, absent_ratio=0.1)
+
+    observe(memory, present=0, absent=RECHECK_INTERVAL - 1)
+    assert memory.is_usually_absent(TEMPLATE, BADGE)
+
+    observe(memory, present=0, absent=1)
+    assert not memory.is_usually_absent(TEMPLATE, BADGE)
+
+
+def test_memory_is_per_template_and_selector():
+    memory = PresenceMemory(min_observations=1, absent_ratio=0.1)
+    observe(memory, present=0, absent=3)
+
+    assert memory.is_usually_absent(TEMPLATE, BADGE)
+    assert not memory.is_usually_absent(TEMPLATE, ".ps-bundle")
+    assert not memory.is_usually_absent("www.dell.com/pt-br/shop/desktops", BADGE)
+
+
+def test_statistics_and_reset():
+    memory = PresenceMemory()
+    observe(memory, present=1, absent=3)
+
+    assert memory.get_statistics() == {TEMPLATE: {BADGE: 0.25}}
+    memory.reset()
+    assert memory.get_statistics() == {}
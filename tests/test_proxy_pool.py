@@ -0,0 +1,237 @@
+"""
+Pool de proxies pelo caminho real: BrowserManager.create_context, safe_goto
+e HttpFetcher saindo por proxies HTTP locais de teste.
+
+Os proxies de teste respondem eles mesmos como origem (qualquer host), então
+não há acesso à rede. Os testes com browser precisam do Chromium do
+Playwright instalado; o do HttpFetcher só do driver.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from playwright.async_api import async_playwright  # noqa: E402
+
+from dell.browser import (  # noqa: E402
+    BlockedPageError,
+    BrowserManager,
+    HttpFetcher,
+    StorageStateStore,
+    circuit_breakers,
+    proxy_pool,
+    safe_goto,
+)
+
+# Host fictício: o proxy atende qualquer host, e o Chromium não ignora o
+# proxy como faria para loopback
+PRODUCT_URL = "http://dell.test/pt-br/shop/produto"
+
+PRODUCT_HTML = (
+    "<html><head><title>Notebook Dell</title></head>"
+    "<body><h1>Notebook Dell</h1><p>" + "Especificações. " * 20 + "</p></body></html>"
+)
+CHALLENGE_HTML = (
+    "<html><head><title>Just a moment...</title></head>"
+    "<body>Verificando o navegador</body></html>"
+)
+
+# Orçamento alto por proxy: o teste mede escolha/saúde, não o rate limit
+PROXY_RATE = 100.0
+
+
+def stand_in_proxy(delay: float = 0.0, status: int = 200, body: str = PRODUCT_HTML):
+    """
+    Proxy HTTP de teste que responde no lugar da origem.
+
+    Aceita túnel CONNECT (APIRequestContext) e requisições com URL absoluta
+    (Chromium para http://).
+
+    Args:
+        delay: Atraso por requisição em segundos
+        status: Status da resposta (ex.: 429 para IP limitado)
+        body: HTML da resposta
+    """
+
+    async def handler(reader, writer):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if head.startswith(b"CONNECT"):
+                writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+                await writer.drain()
+                await reader.readuntil(b"\r\n\r\n")
+
+            await asyncio.sleep(delay)
+            payload = body.encode() if status < 400 else b""
+            writer.write(
+                b"HTTP/1.1 %d Stand-in\r\nContent-Type: text/html; charset=utf-8\r\n"
+                b"Content-Length: %d\r\nConnection: close\r\n\r\n%s"
+                % (status, len(payload), payload)
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return handler
+
+
+async def start_proxies(**behaviours):
+    """Sobe um proxy por comportamento; retorna (servidores, nome → URL)."""
+    servers, urls = [], {}
+    for name, handler in behaviours.items():
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        servers.append(server)
+        urls[name] = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    return servers, urls
+
+
+def configure_pool(urls):
+    """Configura o pool global e retorna nome → Proxy."""
+    proxy_pool.configure(
+        [{"server": url, "rate": PROXY_RATE, "burst": 10} for url in urls.values()],
+        cooldown=30,
+    )
+    by_server = {proxy.server: proxy for proxy in proxy_pool.proxies}
+    return {name: by_server[url] for name, url in urls.items()}
+
+
+def run(scenario, tmp_path):
+    """Executa o cenário com o estado global isolado."""
+
+    async def main():
+        # 429 seguidos abririam o breaker do host fictício
+        circuit_breakers.configure(failure_threshold=1000)
+        manager = BrowserManager(
+            page_pool_size=2, storage_states=StorageStateStore(str(tmp_path))
+        )
+        try:
+            await scenario(manager)
+        finally:
+            await manager.cleanup()
+            proxy_pool.configure([])
+            circuit_breakers.configure(failure_threshold=5)
+
+    asyncio.run(main())
+
+
+@pytest.fixture(scope="module")
+def chromium():
+    async def check():
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch()
+            await browser.close()
+
+    try:
+        asyncio.run(check())
+    except Exception as e:
+        pytest.skip(f"Chromium do Playwright indisponível: {str(e).splitlines()[0]}")
+
+
+async def open_context(manager, context_id):
+    # storage_state explícito: sem warm start (que navegaria pelo pool)
+    await manager.create_context("production", context_id, storage_state=None)
+    return proxy_pool.proxy_for(manager.contexts[context_id])
+
+
+def test_create_context_prefers_fast_healthy_proxy(chromium, tmp_path):
+    async def scenario(manager):
+        servers, urls = await start_proxies(
+            rapido=stand_in_proxy(),
+            lento=stand_in_proxy(delay=0.3),
+            limitado=stand_in_proxy(status=429),
+        )
+        proxies = configure_pool(urls)
+        await manager.initialize(use_server=False)
+
+        # Sem histórico, cada contexto vai para um proxy diferente
+        assigned = {
+            name: await open_context(manager, f"ctx_{name}") for name in proxies
+        }
+        assert set(assigned.values()) == set(proxies.values())
+
+        for _ in range(3):
+            for name in proxies:
+                page = await manager.get_page(f"ctx_{name}")
+                await safe_goto(page, PRODUCT_URL, wait_until="load", max_retries=1)
+                await page.close()
+
+        limited = assigned["limitado"]
+        # 429 pelo safe_goto conta como falha do proxy, sem cool-down
+        assert limited.failures == 3 and limited.successes == 0
+        assert limited.cooling_for() == 0
+        assert limited.success_rate < proxy_pool.min_success_rate
+
+        fast, slow = assigned["rapido"], assigned["lento"]
+        assert fast.successes == 3 and slow.successes == 3
+        assert fast.median_latency < slow.median_latency
+
+        # Novo contexto: o proxy rápido e saudável, não o limitado
+        await manager.close_context("ctx_limitado")
+        assert await open_context(manager, "ctx_novo") is fast
+        assert fast.contexts == 2
+
+        for server in servers:
+            server.close()
+
+    run(scenario, tmp_path)
+
+
+def test_block_page_cools_proxy_and_rotates_context(chromium, tmp_path):
+    async def scenario(manager):
+        servers, urls = await start_proxies(
+            desafio=stand_in_proxy(body=CHALLENGE_HTML),
+            rapido=stand_in_proxy(),
+        )
+        proxies = configure_pool(urls)
+        await manager.initialize(use_server=False)
+
+        assert await open_context(manager, "main") is proxies["desafio"]
+        old_context = manager.contexts["main"]
+
+        async with manager.page("main") as page:
+            with pytest.raises(BlockedPageError):
+                await safe_goto(page, PRODUCT_URL, wait_until="load", max_retries=1)
+
+        # Bloqueio: cool-down do proxy e contexto recriado por outro proxy
+        assert proxies["desafio"].blocks == 1
+        assert proxies["desafio"].cooling_for() > 0
+        assert manager.block_rotations == 1
+        assert manager.contexts["main"] is not old_context
+        assert proxy_pool.proxy_for(manager.contexts["main"]) is proxies["rapido"]
+
+        async with manager.page("main") as page:
+            assert await safe_goto(page, PRODUCT_URL, wait_until="load")
+
+        # Em cool-down o proxy bloqueado não é escolhido
+        assert proxy_pool.choose() is proxies["rapido"]
+
+        for server in servers:
+            server.close()
+
+    run(scenario, tmp_path)
+
+
+def test_http_fetcher_uses_pool_without_browser(tmp_path):
+    async def scenario(manager):
+        servers, urls = await start_proxies(rapido=stand_in_proxy())
+        proxies = configure_pool(urls)
+
+        async with HttpFetcher(manager, content_check=lambda html: True) as fetcher:
+            result = await fetcher.fetch(PRODUCT_URL)
+            assert fetcher.proxy is proxies["rapido"]
+
+        assert result.tier == "http" and result.status == 200
+        assert "Notebook Dell" in result.content
+        assert proxies["rapido"].successes == 1
+        assert proxies["rapido"].median_latency is not None
+        # Tudo atendido via HTTP: o browser não foi lançado
+        assert manager.browser is None
+
+        for server in servers:
+            server.close()
+
+    run(scenario, tmp_path)
@@ -0,0 +1,125 @@
+"""
+Rate limiter sem browser: token bucket por host e o orçamento compartilhado
+entre processos via arquivo com flock (como nos workers do BrowserFleet).
+"""
+
+import asyncio
+import json
+import multiprocessing
+
+import pytest
+
+from dell.browser.rate_limiter import (
+    RateLimiter,
+    SharedTokenBucket,
+    TokenBucket,
+    fcntl,
+)
+
+# Reposição rápida: os atrasos esperados ficam na casa de centésimos
+RATE = 20.0
+
+# Reposição lenta: o início dos processos não devolve tokens ao bucket
+SLOW_RATE = 0.01
+
+shared_only = pytest.mark.skipif(fcntl is None, reason="flock indisponível")
+
+
+def acquire_all(bucket, count):
+    """Adquire 'count' tokens em sequência; retorna os atrasos."""
+
+    async def main():
+        return [await bucket.acquire() for _ in range(count)]
+
+    return asyncio.run(main())
+
+
+def test_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=RATE, burst=3)
+    delays = acquire_all(bucket, 4)
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert 0 < delays[3] <= 1 / RATE
+    assert bucket.stats["acquired"] == 4 and bucket.stats["delayed"] == 1
+
+
+def test_concurrent_acquires_are_spaced():
+    bucket = TokenBucket(rate=RATE, burst=1)
+
+    async def main():
+        return await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    delays = sorted(asyncio.run(main()))
+    # Cada reserva fica um intervalo depois da anterior
+    assert delays[0] == 0.0
+    assert delays[1] == pytest.approx(1 / RATE, abs=0.01)
+    assert delays[2] == pytest.approx(2 / RATE, abs=0.01)
+
+
+def test_invalid_budget_is_rejected():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, burst=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
+
+
+def test_limiter_keeps_one_bucket_per_host():
+    limiter = RateLimiter(rate=RATE, burst=1, host_limits={"api.dell.test": (5, 2)})
+
+    async def main():
+        await limiter.acquire("https://www.dell.test/a")
+        await limiter.acquire("https://WWW.dell.test/b")
+        await limiter.acquire("https://api.dell.test/price")
+
+    asyncio.run(main())
+    assert set(limiter.buckets) == {"www.dell.test", "api.dell.test"}
+    assert limiter.buckets["www.dell.test"].stats["acquired"] == 2
+    assert limiter.buckets["api.dell.test"].burst == 2
+
+
+@shared_only
+def test_shared_buckets_split_one_budget(tmp_path):
+    path = tmp_path / "www.dell.test.bucket"
+    first = SharedTokenBucket(path, rate=RATE, burst=2)
+    second = SharedTokenBucket(path, rate=RATE, burst=2)
+
+    # A rajada é do arquivo, não de cada instância
+    assert acquire_all(first, 2) == [0.0, 0.0]
+    assert acquire_all(second, 1)[0] > 0
+
+
+@shared_only
+def test_limiter_uses_shared_file_when_configured(tmp_path):
+    limiter = RateLimiter(rate=RATE, burst=1, shared_dir=str(tmp_path))
+    bucket = limiter.bucket_for("www.dell.test")
+
+    assert isinstance(bucket, SharedTokenBucket)
+    acquire_all(bucket, 1)
+    assert (tmp_path / "www.dell.test.bucket").exists()
+
+
+def _acquire_in_child(path, queue):
+    queue.put(acquire_all(SharedTokenBucket(path, rate=SLOW_RATE, burst=2), 1)[0])
+
+
+@shared_only
+def test_budget_is_shared_across_processes(tmp_path):
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("fork indisponível")
+
+    path = tmp_path / "www.dell.test.bucket"
+    queue = context.Queue()
+    children = [
+        context.Process(target=_acquire_in_child, args=(path, queue)) for _ in range(2)
+    ]
+    for child in children:
+        child.start()
+    for child in children:
+        child.join(timeout=10)
+
+    # Cada processo gastou um token da mesma rajada: o arquivo ficou vazio
+    assert sorted(queue.get(timeout=1) for _ in children) == [0.0, 0.0]
+    state = json.loads(path.read_text())
+    assert state["tokens"] < 0.5
@@ -0,0 +1,191 @@
+"""
+Resilience sem browser: transições do CircuitBreaker, classificação de erros
+e o que o call_with_retry repete, com operações simuladas.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError  # noqa: E402
+
+from dell.browser.block_detection import BlockedPageError, BlockVerdict  # noqa: E402
+from dell.browser.errors import PageWaitTimeout  # noqa: E402
+from dell.browser.resilience import (  # noqa: E402
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    HttpStatusError,
+    RetryPolicy,
+    call_with_retry,
+    classify_error,
+)
+
+URL = "https://www.dell.test/pt-br/shop/produto"
+
+# Sem espera entre tentativas: o teste mede decisões, não o backoff
+NO_WAIT = dict(base_delay=0.0, jitter=False)
+
+
+def failing(*errors, result="ok"):
+    """Operação que levanta os erros na ordem e depois retorna 'result'."""
+    calls = []
+
+    async def operation():
+        calls.append(time.monotonic())
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return operation, calls
+
+
+def test_classify_error_categories():
+    blocked = BlockedPageError(BlockVerdict(URL, True, "title:just a moment"))
+
+    assert classify_error(PlaywrightTimeoutError("Timeout 30000ms")) == "timeout"
+    assert classify_error(asyncio.TimeoutError()) == "timeout"
+    assert classify_error(ConnectionResetError()) == "network"
+    assert classify_error(Exception("net::ERR_CONNECTION_RESET")) == "network"
+    assert classify_error(Exception("Target closed")) == "crashed"
+    assert classify_error(HttpStatusError(429, URL)) == "throttled"
+    assert classify_error(HttpStatusError(502, URL)) == "server"
+    assert classify_error(HttpStatusError(404, URL)) == "client"
+    assert classify_error(blocked) == "blocked"
+    assert classify_error(CircuitOpenError("www.dell.test", 5)) == "circuit_open"
+    assert classify_error(PageWaitTimeout("falhou", category="network")) == "network"
+    assert classify_error(ValueError("seletor inválido")) == "fatal"
+
+
+def test_local_file_errors_are_fatal_not_network():
+    assert classify_error(FileNotFoundError("har/categoria.har.zip")) == "fatal"
+    assert classify_error(PermissionError("storage_state.json")) == "fatal"
+    assert classify_error(IsADirectoryError("har")) == "fatal"
+
+
+def test_breaker_opens_probes_and_closes():
+    breaker = CircuitBreaker("www.dell.test", failure_threshold=2, reset_timeout=0.05)
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_in() > 0
+
+    # Após o reset_timeout: uma sondagem por vez no meio-aberto
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.failures == 0
+    assert breaker.stats["opened"] == 1
+
+
+def test_breaker_reopens_when_probe_fails():
+    breaker = CircuitBreaker("www.dell.test", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.stats["opened"] == 2
+    assert not breaker.allow()
+
+
+def test_released_probe_frees_half_open_slot():
+    breaker = CircuitBreaker("www.dell.test", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.release()  # Sondagem sem resultado para o host (ex.: cancelada)
+    assert breaker.allow()
+
+
+def test_retry_repeats_transient_errors_until_success():
+    operation, calls = failing(
+        PlaywrightTimeoutError("Timeout 30000ms"), HttpStatusError(503, URL)
+    )
+    result = asyncio.run(
+        call_with_retry(
+            operation,
+            url=URL,
+            policy=RetryPolicy(max_attempts=3, **NO_WAIT),
+            breakers=CircuitBreakerRegistry(failure_threshold=5),
+        )
+    )
+
+    assert result == "ok"
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        HttpStatusError(404, URL),
+        ValueError("seletor inválido"),
+        FileNotFoundError("har/categoria.har.zip"),
+    ],
+)
+def test_retry_raises_non_transient_errors_at_once(error):
+    operation, calls = failing(error)
+
+    with pytest.raises(type(error)):
+        asyncio.run(
+            call_with_retry(operation, policy=RetryPolicy(max_attempts=3, **NO_WAIT))
+        )
+    assert len(calls) == 1
+
+
+def test_retry_gives_up_after_max_attempts():
+    operation, calls = failing(*[ConnectionResetError()] * 5)
+
+    with pytest.raises(ConnectionResetError):
+        asyncio.run(
+            call_with_retry(operation, policy=RetryPolicy(max_attempts=3, **NO_WAIT))
+        )
+    assert len(calls) == 3
+
+
+def test_host_failures_open_breaker_and_fail_fast():
+    breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60)
+    policy = RetryPolicy(max_attempts=1, **NO_WAIT)
+
+    async def scenario():
+        for _ in range(2):
+            operation, _ = failing(HttpStatusError(503, URL))
+            with pytest.raises(HttpStatusError):
+                await call_with_retry(
+                    operation, url=URL, policy=policy, breakers=breakers
+                )
+
+        # Breaker aberto: a operação nem é executada
+        operation, calls = failing()
+        with pytest.raises(CircuitOpenError):
+            await call_with_retry(operation, url=URL, policy=policy, breakers=breakers)
+        assert calls == []
+
+    asyncio.run(scenario())
+    assert breakers.get_statistics()["www.dell.test"]["state"] == "open"
+
+
+def test_client_errors_do_not_count_against_host():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=60)
+
+    async def scenario():
+        operation, _ = failing(HttpStatusError(404, URL))
+        with pytest.raises(HttpStatusError):
+            await call_with_retry(operation, url=URL, breakers=breakers)
+
+    asyncio.run(scenario())
+    assert breakers.breaker_for(URL).state == "closed"
@@ -0,0 +1,160 @@
+"""
+ResultCache sem browser: TTL, descarte LRU, coalescência de chamadas
+concorrentes e prefixos por handler.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from dell.browser.result_cache import ResultCache, normalize_url
+
+
+def counted(value="produto", delay=0.0):
+    """compute() que conta execuções e demora 'delay' segundos."""
+    calls = []
+
+    async def compute():
+        calls.append(time.monotonic())
+        await asyncio.sleep(delay)
+        return value
+
+    return compute, calls
+
+
+def test_normalize_url_drops_fragment_and_case_of_host():
+    assert (
+        normalize_url("HTTPS://WWW.Dell.com/pt-br/Shop?sku=1#specs")
+        == "https://www.dell.com/pt-br/Shop?sku=1"
+    )
+
+
+def test_hit_within_ttl_and_recompute_after_expiry():
+    cache = ResultCache(ttl=0.05)
+    compute, calls = counted()
+
+    async def main():
+        await cache.get_or_compute("url", compute)
+        await cache.get_or_compute("url", compute)
+        await asyncio.sleep(0.06)
+        await cache.get_or_compute("url", compute)
+
+    asyncio.run(main())
+    assert len(calls) == 2
+    stats = cache.get_statistics()
+    assert stats["hits"] == 1 and stats["expirations"] == 1
+    assert cache.get("url") == "produto"
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResultCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    async def touch_a():
+        return await cache.get_or_compute("a", counted()[0])
+
+    assert asyncio.run(touch_a()) == 1  # "a" passa a ser o mais recente
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get_statistics()["evictions"] == 1
+
+
+def test_concurrent_callers_share_one_computation():
+    cache = ResultCache()
+    compute, calls = counted(delay=0.02)
+
+    async def main():
+        return await asyncio.gather(
+            *(cache.get_or_compute("url", compute) for _ in range(5))
+        )
+
+    assert asyncio.run(main()) == ["produto"] * 5
+    assert len(calls) == 1
+    assert cache.get_statistics()["coalesced"] == 4
+
+
+def test_errors_are_shared_but_not_cached():
+    cache = ResultCache()
+    attempts = []
+
+    async def compute():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise ConnectionResetError()
+
+    async def main():
+        results = await asyncio.gather(
+            cache.get_or_compute("url", compute),
+            cache.get_or_compute("url", compute),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ConnectionResetError) for r in results)
+        with pytest.raises(ConnectionResetError):
+            await cache.get_or_compute("url", compute)
+
+    asyncio.run(main())
+    assert len(attempts) == 2
+    assert cache.get_statistics()["errors"] == 2
+
+
+def test_cache_if_filters_results():
+    cache = ResultCache()
+
+    async def main():
+        await cache.get_or_compute("falha", counted(None)[0], cache_if=bool)
+        await cache.get_or_compute("ok", counted("produto")[0], cache_if=bool)
+
+    asyncio.run(main())
+    assert cache.get("falha", "ausente") == "ausente"
+    assert cache.get("ok") == "produto"
+
+
+def test_shared_computation_survives_one_cancelled_caller():
+    cache = ResultCache()
+    compute, calls = counted(delay=0.05)
+
+    async def main():
+        impatient = asyncio.create_task(cache.get_or_compute("url", compute))
+        patient = asyncio.create_task(cache.get_or_compute("url", compute))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        return await patient
+
+    assert asyncio.run(main()) == "produto"
+    assert len(calls) == 1
+
+
+def test_namespace_is_per_handler_object():
+    cache = ResultCache()
+
+    def factory(field):
+        async def handler(page, url):
+            return field
+
+        return handler
+
+    class Extractor:
+        async def extract(self, page, url):
+            return url
+
+    price, title = factory("price"), factory("title")
+    first, second = Extractor(), Extractor()
+
+    # Closures da mesma fábrica têm o mesmo __qualname__, mas não o prefixo
+    assert cache.namespace(price) != cache.namespace(title)
+    assert cache.namespace(price) == cache.namespace(price)
+    # Método ligado é recriado a cada acesso, mas a instância decide
+    assert cache.namespace(first.extract) == cache.namespace(first.extract)
+    assert cache.namespace(first.extract) != cache.namespace(second.extract)
+
+
+def test_namespace_is_not_reused_after_handler_is_freed():
+    cache = ResultCache()
+    seen = {cache.namespace(lambda page, url: n) for n in range(50)}
+
+    # O cache mantém os handlers: ids liberados não repetem prefixos
+    assert len(seen) == 50